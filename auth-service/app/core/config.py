@@ -9,6 +9,10 @@ class Settings(BaseSettings):
     jwt_secret_key: str = "change-this-super-secret-key-for-prod"
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 120
+    jwt_issuer: str = "auth-service"
+    jwt_private_key: str | None = None
+    jwt_private_key_path: str | None = None
+    jwt_key_id: str | None = None
 
     seed_owner_email: str = "owner@inbox.local"
     seed_owner_password: str = "OwnerPass!123"
@@ -0,0 +1,90 @@
+import base64
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.core.config import Settings, get_settings
+
+
+logger = logging.getLogger("auth-service")
+settings = get_settings()
+
+ASYMMETRIC_ALGORITHMS = {"RS256", "RS384", "RS512"}
+
+
+def _b64url_uint(value: int) -> str:
+    raw = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    kid: str
+    algorithm: str
+    private_pem: str
+    public_pem: str
+    public_jwk: dict[str, Any]
+
+
+def _build_signing_key(private_key: rsa.RSAPrivateKey, algorithm: str, kid: str | None) -> SigningKey:
+    public_key = private_key.public_key()
+    numbers = public_key.public_numbers()
+    jwk = {"kty": "RSA", "n": _b64url_uint(numbers.n), "e": _b64url_uint(numbers.e)}
+    if not kid:
+        # RFC 7638 thumbprint keeps key IDs stable across restarts for the same key.
+        canonical = json.dumps({"e": jwk["e"], "kty": "RSA", "n": jwk["n"]}, separators=(",", ":"))
+        kid = base64.urlsafe_b64encode(hashlib.sha256(canonical.encode()).digest()).rstrip(b"=").decode()
+
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode("utf-8")
+    public_pem = public_key.public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode("utf-8")
+    return SigningKey(
+        kid=kid,
+        algorithm=algorithm,
+        private_pem=private_pem,
+        public_pem=public_pem,
+        public_jwk={**jwk, "kid": kid, "alg": algorithm, "use": "sig"},
+    )
+
+
+def load_signing_key(config: Settings) -> SigningKey | None:
+    if config.jwt_algorithm not in ASYMMETRIC_ALGORITHMS:
+        return None
+
+    pem = config.jwt_private_key
+    if not pem and config.jwt_private_key_path:
+        pem = Path(config.jwt_private_key_path).read_text(encoding="utf-8")
+
+    if pem:
+        private_key = serialization.load_pem_private_key(pem.encode("utf-8"), password=None)
+        if not isinstance(private_key, rsa.RSAPrivateKey):
+            raise ValueError(f"{config.jwt_algorithm} requires an RSA private key")
+    else:
+        logger.warning(
+            "No JWT private key configured; generated an ephemeral RSA key. "
+            "Tokens will not survive restarts or validate across replicas."
+        )
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    return _build_signing_key(private_key, config.jwt_algorithm, config.jwt_key_id)
+
+
+signing_key = load_signing_key(settings)
+
+
+def get_jwks() -> dict[str, list[dict[str, Any]]]:
+    if signing_key is None:
+        return {"keys": []}
+    return {"keys": [signing_key.public_jwk]}
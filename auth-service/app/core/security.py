@@ -6,6 +6,7 @@ from passlib.context import CryptContext
 from pydantic import BaseModel
 
 from app.core.config import get_settings
+from app.core.keys import signing_key
 
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -34,13 +35,22 @@ def create_access_token(subject: str, email: str, role: str, expires_minutes: in
         "email": email,
         "role": role,
         "exp": int(expire.timestamp()),
+        "iss": settings.jwt_issuer,
     }
+    if signing_key is not None:
+        return jwt.encode(
+            payload,
+            signing_key.private_pem,
+            algorithm=signing_key.algorithm,
+            headers={"kid": signing_key.kid},
+        )
     return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 
 def decode_token(token: str) -> TokenPayload:
+    verification_key = signing_key.public_pem if signing_key is not None else settings.jwt_secret_key
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+        payload = jwt.decode(token, verification_key, algorithms=[settings.jwt_algorithm])
         return TokenPayload(**payload)
     except JWTError as exc:
         raise ValueError("Invalid token") from exc
@@ -6,6 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.core.database import AsyncSessionLocal, init_database
 from app.core.middleware import RequestLoggingMiddleware
 from app.routers.auth_router import router as auth_router
+from app.routers.jwks_router import router as jwks_router
 from app.routers.users_router import router as users_router
 from app.services.seed_service import seed_users
 
@@ -35,6 +36,7 @@ app.add_middleware(
 )
 app.include_router(auth_router)
 app.include_router(users_router)
+app.include_router(jwks_router)
 
 
 @app.get("/health", tags=["health"])
@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Response
+
+from app.core.keys import get_jwks
+
+
+router = APIRouter(tags=["jwks"])
+
+
+@router.get("/.well-known/jwks.json")
+async def jwks(response: Response) -> dict:
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return get_jwks()
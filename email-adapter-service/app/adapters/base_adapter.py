@@ -1,13 +1,22 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 
-from shared.models import Message, PlatformStatus, SendMessageRequest, ThreadDetail
+from shared.models import Message, PlatformStatus, SearchResults, SendMessageRequest, ThreadDetail, UnreadCounts
 
 
 class BaseEmailPlatformAdapter(ABC):
     platform_name: str
 
     @abstractmethod
-    async def fetch_unread(self, user_id: str, limit: int) -> list[Message]:
+    async def fetch_unread(
+        self,
+        user_id: str,
+        limit: int,
+        before: datetime | None = None,
+        cursor: str | None = None,
+        participant: str | None = None,
+    ) -> list[Message]:
         raise NotImplementedError
 
     @abstractmethod
@@ -23,7 +32,55 @@ class BaseEmailPlatformAdapter(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_thread(self, user_id: str, thread_id: str) -> ThreadDetail | None:
+    async def mark_many_as_read(self, user_id: str, message_ids: list[str]) -> list[Message]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search_messages(
+        self,
+        user_id: str,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        unread_only: bool = False,
+        participant: str | None = None,
+    ) -> SearchResults:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_messages(
+        self,
+        user_id: str,
+        unread_only: bool = False,
+        thread_id: str | None = None,
+        since: datetime | None = None,
+        participant: str | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[list[Message]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_thread(
+        self,
+        user_id: str,
+        thread_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> ThreadDetail | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_unread_counts(self, user_id: str) -> UnreadCounts:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_unread_version(self, user_id: str) -> tuple[datetime | None, int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_thread_version(self, user_id: str, thread_id: str) -> tuple[datetime, int, int] | None:
         raise NotImplementedError
 
     @abstractmethod
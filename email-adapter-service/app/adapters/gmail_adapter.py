@@ -1,8 +1,19 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.base_adapter import BaseEmailPlatformAdapter
 from app.repository.message_repository import MessageRepository
-from shared.models import Message, Platform, PlatformStatus, SendMessageRequest, ThreadDetail
+from shared.models import (
+    Message,
+    Platform,
+    PlatformStatus,
+    SearchResults,
+    SendMessageRequest,
+    ThreadDetail,
+    UnreadCounts,
+)
 
 
 class GmailAdapter(BaseEmailPlatformAdapter):
@@ -11,8 +22,21 @@ class GmailAdapter(BaseEmailPlatformAdapter):
     def __init__(self, session: AsyncSession):
         self.repo = MessageRepository(session)
 
-    async def fetch_unread(self, user_id: str, limit: int) -> list[Message]:
-        return await self.repo.get_unread_messages(user_id=user_id, limit=limit)
+    async def fetch_unread(
+        self,
+        user_id: str,
+        limit: int,
+        before: datetime | None = None,
+        cursor: str | None = None,
+        participant: str | None = None,
+    ) -> list[Message]:
+        return await self.repo.get_unread_messages(
+            user_id=user_id,
+            limit=limit,
+            before=before,
+            cursor=cursor,
+            participant=participant,
+        )
 
     async def send_reply(self, user_id: str, message_id: str, body: str) -> Message:
         return await self.repo.send_reply(user_id=user_id, message_id=message_id, body=body)
@@ -29,10 +53,69 @@ class GmailAdapter(BaseEmailPlatformAdapter):
     async def mark_as_read(self, user_id: str, message_id: str) -> Message:
         return await self.repo.mark_as_read(user_id=user_id, message_id=message_id)
 
-    async def get_thread(self, user_id: str, thread_id: str) -> ThreadDetail | None:
-        return await self.repo.get_thread(user_id=user_id, thread_id=thread_id)
+    async def mark_many_as_read(self, user_id: str, message_ids: list[str]) -> list[Message]:
+        return await self.repo.mark_many_as_read(user_id=user_id, message_ids=message_ids)
+
+    async def search_messages(
+        self,
+        user_id: str,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        unread_only: bool = False,
+        participant: str | None = None,
+    ) -> SearchResults:
+        return await self.repo.search_messages(
+            user_id=user_id,
+            query=query,
+            limit=limit,
+            cursor=cursor,
+            since=since,
+            until=until,
+            unread_only=unread_only,
+            participant=participant,
+        )
+
+    def stream_messages(
+        self,
+        user_id: str,
+        unread_only: bool = False,
+        thread_id: str | None = None,
+        since: datetime | None = None,
+        participant: str | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[list[Message]]:
+        return self.repo.stream_messages(
+            user_id=user_id,
+            unread_only=unread_only,
+            thread_id=thread_id,
+            since=since,
+            participant=participant,
+            batch_size=batch_size,
+        )
+
+    async def get_thread(
+        self,
+        user_id: str,
+        thread_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> ThreadDetail | None:
+        return await self.repo.get_thread(user_id=user_id, thread_id=thread_id, limit=limit, cursor=cursor)
+
+    async def get_unread_counts(self, user_id: str) -> UnreadCounts:
+        return await self.repo.get_unread_counts(user_id=user_id)
+
+    async def get_unread_version(self, user_id: str) -> tuple[datetime | None, int]:
+        return await self.repo.get_unread_version(user_id=user_id)
+
+    async def get_thread_version(self, user_id: str, thread_id: str) -> tuple[datetime, int, int] | None:
+        return await self.repo.get_thread_version(user_id=user_id, thread_id=thread_id)
 
-    async def get_platform_status(self) -> PlatformStatus:
+    @staticmethod
+    async def get_platform_status() -> PlatformStatus:
         return PlatformStatus(
             platform=Platform.EMAIL,
             connected=True,
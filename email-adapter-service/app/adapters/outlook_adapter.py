@@ -1,11 +1,29 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+
 from app.adapters.base_adapter import BaseEmailPlatformAdapter
-from shared.models import Message, Platform, PlatformStatus, SendMessageRequest, ThreadDetail
+from shared.models import (
+    Message,
+    Platform,
+    PlatformStatus,
+    SearchResults,
+    SendMessageRequest,
+    ThreadDetail,
+    UnreadCounts,
+)
 
 
 class OutlookAdapter(BaseEmailPlatformAdapter):
     platform_name = "outlook"
 
-    async def fetch_unread(self, user_id: str, limit: int) -> list[Message]:
+    async def fetch_unread(
+        self,
+        user_id: str,
+        limit: int,
+        before: datetime | None = None,
+        cursor: str | None = None,
+        participant: str | None = None,
+    ) -> list[Message]:
         return []
 
     async def send_reply(self, user_id: str, message_id: str, body: str) -> Message:
@@ -17,10 +35,55 @@ class OutlookAdapter(BaseEmailPlatformAdapter):
     async def mark_as_read(self, user_id: str, message_id: str) -> Message:
         raise ValueError("Outlook adapter is not enabled in MVP")
 
-    async def get_thread(self, user_id: str, thread_id: str) -> ThreadDetail | None:
+    async def mark_many_as_read(self, user_id: str, message_ids: list[str]) -> list[Message]:
+        raise ValueError("Outlook adapter is not enabled in MVP")
+
+    async def search_messages(
+        self,
+        user_id: str,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        unread_only: bool = False,
+        participant: str | None = None,
+    ) -> SearchResults:
+        return SearchResults()
+
+    async def stream_messages(
+        self,
+        user_id: str,
+        unread_only: bool = False,
+        thread_id: str | None = None,
+        since: datetime | None = None,
+        participant: str | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[list[Message]]:
+        # The Outlook stub has no mailbox to export.
+        return
+        yield
+
+    async def get_thread(
+        self,
+        user_id: str,
+        thread_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> ThreadDetail | None:
+        return None
+
+    async def get_unread_counts(self, user_id: str) -> UnreadCounts:
+        return UnreadCounts(platform=Platform.EMAIL)
+
+    async def get_unread_version(self, user_id: str) -> tuple[datetime | None, int]:
+        return None, 0
+
+    async def get_thread_version(self, user_id: str, thread_id: str) -> tuple[datetime, int, int] | None:
         return None
 
-    async def get_platform_status(self) -> PlatformStatus:
+    @staticmethod
+    async def get_platform_status() -> PlatformStatus:
         return PlatformStatus(
             platform=Platform.EMAIL,
             connected=False,
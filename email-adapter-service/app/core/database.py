@@ -1,5 +1,6 @@
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -27,8 +28,20 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def init_database() -> None:
+    from app.core.migrations import MIGRATION_LOCK_KEY, apply_migrations
     from app.models.message import EmailMessage  # noqa: F401
     from app.models.thread import EmailThread  # noqa: F401
-
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    from app.models.unread_counter import EmailUnreadCounter  # noqa: F401
+
+    async with engine.connect() as conn:
+        # Session-level lock, held across the per-migration commits, so replicas starting together take turns.
+        await conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        try:
+            # create_all builds a fresh database; it never alters existing tables, which is what migrations are for.
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.commit()
+            await apply_migrations(conn)
+        finally:
+            await conn.rollback()
+            await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            await conn.commit()
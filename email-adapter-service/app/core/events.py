@@ -0,0 +1,59 @@
+import json
+import logging
+from datetime import UTC, datetime
+
+from redis.asyncio import Redis
+
+from app.core.config import get_settings
+
+
+logger = logging.getLogger("email-adapter-service")
+settings = get_settings()
+redis_client = Redis.from_url(settings.redis_url, decode_responses=True)
+
+
+class MessageEventPublisher:
+    """
+    Publishes per-user mailbox change events to a Redis stream.
+
+    Publishing is best effort: a Redis failure is logged and never fails the
+    write that produced the event.
+    """
+
+    def __init__(self, redis: Redis, stream: str, maxlen: int):
+        self.redis = redis
+        self.stream = stream
+        self.maxlen = maxlen
+
+    async def publish(
+        self,
+        event_type: str,
+        user_id: str,
+        message_ids: list[str],
+        thread_ids: list[str],
+        unread_count: int,
+    ) -> None:
+        try:
+            await self.redis.xadd(
+                self.stream,
+                {
+                    "type": event_type,
+                    "user_id": user_id,
+                    "platform": "email",
+                    "message_ids": json.dumps(message_ids),
+                    "thread_ids": json.dumps(sorted(set(thread_ids))),
+                    "unread_count": str(unread_count),
+                    "occurred_at": datetime.now(UTC).isoformat(),
+                },
+                maxlen=self.maxlen,
+                approximate=True,
+            )
+        except Exception:
+            logger.warning("Failed to publish %s event for user %s", event_type, user_id, exc_info=True)
+
+
+message_events = MessageEventPublisher(
+    redis=redis_client,
+    stream=settings.message_events_stream,
+    maxlen=settings.message_events_maxlen,
+)
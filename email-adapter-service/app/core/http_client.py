@@ -0,0 +1,12 @@
+from app.core.config import get_settings
+from shared.http_client import HttpClientRegistry
+
+
+settings = get_settings()
+
+http_clients = HttpClientRegistry(
+    settings,
+    upstreams={
+        "auth": (settings.auth_service_url, settings.auth_service_timeout_seconds),
+    },
+)
@@ -0,0 +1,21 @@
+from app.core.config import get_settings
+from app.core.http_client import http_clients
+from shared.jwks import JwksKeySet, LocalVerificationUnavailable
+from shared.models import AuthenticatedUser
+
+
+settings = get_settings()
+
+jwks_key_set = JwksKeySet(
+    http_clients,
+    refresh_seconds=settings.auth_jwks_refresh_seconds,
+    min_refresh_seconds=settings.auth_jwks_min_refresh_seconds,
+    algorithms=settings.auth_jwt_algorithms,
+    issuer=settings.auth_jwt_issuer,
+)
+
+__all__ = ["LocalVerificationUnavailable", "jwks_key_set", "verify_token_locally"]
+
+
+async def verify_token_locally(token: str) -> AuthenticatedUser | None:
+    return await jwks_key_set.verify(token)
@@ -0,0 +1,142 @@
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.models.message import MESSAGE_SEARCH_VECTOR_SQL
+from app.models.thread import THREAD_SEARCH_VECTOR_SQL
+
+
+logger = logging.getLogger("email-adapter-service")
+
+# Arbitrary key for pg_advisory_lock, so concurrent replicas migrate one at a time.
+MIGRATION_LOCK_KEY = 7_311_220_023
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    statements: tuple[str, ...]
+    # When set, each statement is a backfill batch bound to `:batch_size`: it is re-run, committing after every
+    # run, until it changes no rows. Batches must shrink their own work set so an interrupted run resumes.
+    batch_size: int | None = None
+
+
+# Append-only: never edit an applied migration, add a new one. `create_all` still builds a fresh
+# database from the models, so every statement here must be a no-op against that schema.
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        1,
+        "search_vectors",
+        (
+            "ALTER TABLE email_messages ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ({MESSAGE_SEARCH_VECTOR_SQL}) STORED",
+            "CREATE INDEX IF NOT EXISTS ix_email_messages_search_vector ON email_messages USING gin (search_vector)",
+            "ALTER TABLE email_threads ADD COLUMN IF NOT EXISTS subject_vector tsvector "
+            f"GENERATED ALWAYS AS ({THREAD_SEARCH_VECTOR_SQL}) STORED",
+            "CREATE INDEX IF NOT EXISTS ix_email_threads_subject_vector ON email_threads USING gin (subject_vector)",
+        ),
+    ),
+    Migration(
+        2,
+        "unread_and_thread_read_indexes",
+        (
+            "CREATE INDEX IF NOT EXISTS ix_email_messages_unread_user_sent "
+            "ON email_messages (user_id, sent_at DESC, id DESC) WHERE is_unread",
+            "CREATE INDEX IF NOT EXISTS ix_email_messages_thread_covering "
+            "ON email_messages (thread_id, sent_at, id) INCLUDE (user_id, is_unread)",
+            # Superseded by the covering index, which leads with thread_id.
+            "DROP INDEX IF EXISTS ix_email_messages_thread_id",
+        ),
+    ),
+    Migration(
+        3,
+        "unread_counters",
+        (
+            "ALTER TABLE email_threads ADD COLUMN IF NOT EXISTS unread_count INTEGER NOT NULL DEFAULT 0",
+            "CREATE TABLE IF NOT EXISTS email_unread_counters ("
+            "user_id UUID PRIMARY KEY, unread_count INTEGER NOT NULL DEFAULT 0, version BIGINT NOT NULL DEFAULT 0, "
+            "updated_at TIMESTAMPTZ NOT NULL DEFAULT now())",
+            # Writes wait until the backfill commits, so none lands between the count and the counter update.
+            "LOCK TABLE email_messages IN SHARE MODE",
+            "UPDATE email_threads AS t SET unread_count = c.unread_count FROM ("
+            "SELECT thread_id, count(*) AS unread_count FROM email_messages WHERE is_unread GROUP BY thread_id"
+            ") AS c WHERE c.thread_id = t.id",
+            "INSERT INTO email_unread_counters (user_id, unread_count) "
+            "SELECT user_id, count(*) FILTER (WHERE is_unread) FROM email_messages GROUP BY user_id "
+            "ON CONFLICT (user_id) DO UPDATE SET unread_count = excluded.unread_count, "
+            "version = email_unread_counters.version + 1, updated_at = now()",
+        ),
+    ),
+    Migration(
+        4,
+        "participant_arrays",
+        (
+            "ALTER TABLE email_messages ADD COLUMN IF NOT EXISTS recipients TEXT[] NOT NULL DEFAULT '{}'",
+            "ALTER TABLE email_threads ADD COLUMN IF NOT EXISTS participants TEXT[] NOT NULL DEFAULT '{}'",
+            # A fresh database never had the CSV columns; empty ones keep the backfill below the same everywhere.
+            "ALTER TABLE email_messages ADD COLUMN IF NOT EXISTS recipients_csv VARCHAR(1500) NOT NULL DEFAULT ''",
+            "ALTER TABLE email_threads ADD COLUMN IF NOT EXISTS participants_csv VARCHAR(1000) NOT NULL DEFAULT ''",
+        ),
+    ),
+    Migration(
+        5,
+        "backfill_participant_arrays",
+        (
+            # Each batch moves values out of the CSV column, so the remaining work shrinks and a rerun resumes.
+            "UPDATE email_messages SET recipients = array_remove(string_to_array(recipients_csv, ','), ''), "
+            "recipients_csv = '' WHERE id IN ("
+            "SELECT id FROM email_messages WHERE recipients_csv <> '' LIMIT :batch_size FOR UPDATE)",
+            "UPDATE email_threads SET participants = array_remove(string_to_array(participants_csv, ','), ''), "
+            "participants_csv = '' WHERE id IN ("
+            "SELECT id FROM email_threads WHERE participants_csv <> '' LIMIT :batch_size FOR UPDATE)",
+        ),
+        batch_size=5000,
+    ),
+    Migration(
+        6,
+        "participant_indexes",
+        (
+            "ALTER TABLE email_messages DROP COLUMN IF EXISTS recipients_csv",
+            "ALTER TABLE email_threads DROP COLUMN IF EXISTS participants_csv",
+            # Built after the backfill: one bulk GIN build is far cheaper than maintaining it row by row.
+            "CREATE INDEX IF NOT EXISTS ix_email_messages_recipients ON email_messages USING gin (recipients)",
+            "CREATE INDEX IF NOT EXISTS ix_email_messages_user_sender ON email_messages (user_id, sender)",
+        ),
+    ),
+)
+
+
+async def apply_migrations(conn: AsyncConnection, migrations: tuple[Migration, ...] = MIGRATIONS) -> list[int]:
+    """Apply pending migrations in version order, each in its own transaction. Returns the versions applied."""
+    await conn.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "version INTEGER PRIMARY KEY, name TEXT NOT NULL, applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+        )
+    )
+    await conn.commit()
+    applied = set((await conn.execute(text("SELECT version FROM schema_migrations"))).scalars())
+    await conn.commit()
+
+    newly_applied = []
+    for migration in sorted(migrations, key=lambda item: item.version):
+        if migration.version in applied:
+            continue
+        for statement in migration.statements:
+            if migration.batch_size is None:
+                await conn.execute(text(statement))
+                continue
+            # One short transaction per batch, so the backfill never holds locks on the whole table.
+            while (await conn.execute(text(statement), {"batch_size": migration.batch_size})).rowcount:
+                await conn.commit()
+        await conn.execute(
+            text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+            {"version": migration.version, "name": migration.name},
+        )
+        await conn.commit()
+        logger.info("Applied migration %04d_%s", migration.version, migration.name)
+        newly_applied.append(migration.version)
+    return newly_applied
@@ -0,0 +1,115 @@
+import logging
+
+from redis.asyncio import Redis
+
+from app.core.config import get_settings
+from app.core.events import redis_client
+
+
+logger = logging.getLogger("email-adapter-service")
+settings = get_settings()
+
+TOTAL_FIELD = "total"
+VERSION_FIELD = "version"
+
+# KEYS: counts hash. ARGV: ttl, counter version after the write, then thread_id/delta pairs.
+# Deltas are applied only on top of the exact previous version. Any other state (no hash, a gap left by
+# an out-of-order write) becomes a tombstone holding just the version, which stale rebuilds cannot pass.
+APPLY_SCRIPT = """
+local version = tonumber(ARGV[2])
+local current = redis.call('HMGET', KEYS[1], 'version', 'total')
+local cached = tonumber(current[1])
+if cached and cached >= version then
+  return 0
+end
+if current[2] and cached == version - 1 then
+  local total = 0
+  for i = 3, #ARGV, 2 do
+    total = total + tonumber(ARGV[i + 1])
+    if redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1]) <= 0 then
+      redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+  end
+  redis.call('HINCRBY', KEYS[1], 'total', total)
+  redis.call('HSET', KEYS[1], 'version', version)
+  return 1
+end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], 'version', version)
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 0
+"""
+
+# KEYS: counts hash. ARGV: ttl, counter version the counts were read at, total, then thread_id/count pairs.
+FILL_SCRIPT = """
+local version = tonumber(ARGV[2])
+local current = redis.call('HMGET', KEYS[1], 'version', 'total')
+local cached = tonumber(current[1])
+if cached and (cached > version or (current[2] and cached == version)) then
+  return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], 'version', version, 'total', ARGV[3])
+for i = 4, #ARGV, 2 do
+  redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+class UnreadCountCache:
+    """
+    Redis mirror of the unread counters: one hash per user holding `total`
+    and a field per thread with unread mail, so a read is a single HGETALL.
+
+    The Postgres counter row carries a version that every change bumps.
+    Writes apply their deltas after committing, and only onto the version
+    they followed; rebuilds from Postgres never replace a newer copy. Deltas
+    arriving out of order therefore cost a rebuild, never a wrong count.
+    Like event publishing this is best effort: Redis failures are logged and
+    callers fall back to Postgres.
+    """
+
+    def __init__(self, redis: Redis, ttl_seconds: int):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self._apply = redis.register_script(APPLY_SCRIPT)
+        self._fill = redis.register_script(FILL_SCRIPT)
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"email_unread:{user_id}"
+
+    async def read(self, user_id: str) -> tuple[int, dict[str, int]] | None:
+        """Cached `(total, {thread_id: count})`, or None on a miss or Redis failure."""
+        try:
+            raw = await self.redis.hgetall(self._key(user_id))
+        except Exception:
+            logger.warning("Failed to read unread counts for user %s", user_id, exc_info=True)
+            return None
+        if TOTAL_FIELD not in raw:
+            return None
+        threads = {field: int(value) for field, value in raw.items() if field not in (TOTAL_FIELD, VERSION_FIELD)}
+        return int(raw[TOTAL_FIELD]), threads
+
+    async def fill(self, user_id: str, version: int, total: int, threads: dict[str, int]) -> None:
+        args: list[str | int] = [self.ttl_seconds, version, total]
+        for thread_id, count in threads.items():
+            args.extend((thread_id, count))
+        try:
+            await self._fill(keys=[self._key(user_id)], args=args)
+        except Exception:
+            logger.warning("Failed to cache unread counts for user %s", user_id, exc_info=True)
+
+    async def apply(self, user_id: str, version: int, thread_deltas: dict[str, int]) -> None:
+        args: list[str | int] = [self.ttl_seconds, version]
+        for thread_id, delta in thread_deltas.items():
+            args.extend((thread_id, delta))
+        try:
+            await self._apply(keys=[self._key(user_id)], args=args)
+        except Exception:
+            logger.warning("Failed to apply unread count deltas for user %s", user_id, exc_info=True)
+
+
+unread_count_cache = UnreadCountCache(redis=redis_client, ttl_seconds=settings.unread_counts_cache_ttl_seconds)
@@ -4,7 +4,7 @@ from fastapi import Header, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db_session
-from app.services.auth_client import introspect_token
+from app.services.auth_client import authenticate_token
 from shared.models import AuthenticatedUser
 
 
@@ -19,6 +19,6 @@ async def get_current_user(authorization: str | None = Header(default=None)) ->
 
     token = authorization.removeprefix("Bearer ").strip()
     try:
-        return await introspect_token(token)
+        return await authenticate_token(token)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from exc
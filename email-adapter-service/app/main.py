@@ -2,19 +2,32 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app.core.config import get_settings
 from app.core.database import AsyncSessionLocal, init_database
+from app.core.events import redis_client
+from app.core.http_client import http_clients
+from app.core.jwks import jwks_key_set
 from app.core.middleware import RequestLoggingMiddleware
 from app.routers.messages_router import router as messages_router
 from app.routers.platforms_router import router as platforms_router
 from app.services.mock_seed_service import seed_mock_messages
 
 
+settings = get_settings()
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     await init_database()
     async with AsyncSessionLocal() as session:
         await seed_mock_messages(session)
+    await http_clients.start()
+    if settings.auth_local_verification:
+        await jwks_key_set.start()
     yield
+    await jwks_key_set.stop()
+    await http_clients.aclose()
+    await redis_client.aclose()
 
 
 app = FastAPI(
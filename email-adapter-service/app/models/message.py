@@ -1,26 +1,54 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Computed, DateTime, ForeignKey, Index, String, Text, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
 
+SEARCH_CONFIG = "english"
+MESSAGE_SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(sender, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(body, '')), 'C')"
+)
+
+
 class EmailMessage(Base):
     __tablename__ = "email_messages"
+    __table_args__ = (
+        Index("ix_email_messages_search_vector", "search_vector", postgresql_using="gin"),
+        # Unread list: matches `WHERE user_id = ? AND is_unread ORDER BY sent_at DESC, id DESC` with no sort step.
+        Index(
+            "ix_email_messages_unread_user_sent",
+            "user_id",
+            text("sent_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("is_unread"),
+        ),
+        # Thread reads: pages in (sent_at, id) order and answers unread counts with an index-only scan.
+        # Participant filter: `recipients @> ARRAY[?]` for mail to an address, the btree below for mail from it.
+        Index("ix_email_messages_recipients", "recipients", postgresql_using="gin"),
+        Index("ix_email_messages_user_sender", "user_id", "sender"),
+        Index(
+            "ix_email_messages_thread_covering",
+            "thread_id",
+            "sent_at",
+            "id",
+            postgresql_include=["user_id", "is_unread"],
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     thread_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("email_threads.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), index=True, nullable=False)
     sender: Mapped[str] = mapped_column(String(320), nullable=False)
-    recipients_csv: Mapped[str] = mapped_column(String(1500), nullable=False, default="")
+    recipients: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False, default=list, server_default="{}")
     body: Mapped[str] = mapped_column(Text, nullable=False)
     is_unread: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     direction: Mapped[str] = mapped_column(String(20), nullable=False, default="incoming")
@@ -37,5 +65,11 @@ class EmailMessage(Base):
         default=datetime.now(UTC),
         server_default=func.now(),
     )
+    # Deferred so ordinary message reads never ship the tsvector over the wire.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(MESSAGE_SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
+    )
 
     thread = relationship("EmailThread", back_populates="messages")
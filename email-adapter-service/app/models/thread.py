@@ -1,29 +1,42 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, String, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Computed, DateTime, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.models.message import SEARCH_CONFIG
+
+
+THREAD_SEARCH_VECTOR_SQL = f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(subject, '')), 'A')"
 
 
 class EmailThread(Base):
     __tablename__ = "email_threads"
+    __table_args__ = (Index("ix_email_threads_subject_vector", "subject_vector", postgresql_using="gin"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), index=True, nullable=False)
     subject: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    participants_csv: Mapped[str] = mapped_column(String(1000), nullable=False, default="")
+    participants: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False, default=list, server_default="{}")
+    # Denormalized count of unread messages; every write path in MessageRepository keeps it current.
+    unread_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=datetime.now(UTC), server_default=func.now()
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC), server_default=func.now()
     )
+    # Bumped on every change to the thread or its messages; feeds the unread and thread ETags.
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.now(UTC),
-        onupdate=datetime.now(UTC),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
         server_default=func.now(),
     )
+    subject_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(THREAD_SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
+    )
 
     messages = relationship("EmailMessage", back_populates="thread", cascade="all, delete-orphan")
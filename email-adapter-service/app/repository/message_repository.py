@@ -1,74 +1,444 @@
 import uuid
+from collections import Counter
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import String, and_, any_, bindparam, cast, func, literal, or_, select, true, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, REAL, TSVECTOR, UUID, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.message import EmailMessage
+from app.core.events import MessageEventPublisher, message_events
+from app.core.unread_counts import UnreadCountCache, unread_count_cache
+from app.models.message import SEARCH_CONFIG, EmailMessage
 from app.models.thread import EmailThread
-from shared.models import Message, MessageDirection, Platform, Priority, ThreadDetail
+from app.models.unread_counter import EmailUnreadCounter
+from shared.models import (
+    Message,
+    MessageDirection,
+    Platform,
+    Priority,
+    SearchHit,
+    SearchResults,
+    ThreadDetail,
+    ThreadUnreadCount,
+    UnreadCounts,
+)
+from shared.pagination import decode_cursor, decode_rank_cursor, encode_cursor, encode_rank_cursor
 
 
-def _csv_to_list(value: str) -> list[str]:
-    if not value:
-        return []
-    return [item for item in value.split(",") if item]
+SEARCH_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=12, MaxFragments=2"
 
 
-def _list_to_csv(value: list[str]) -> str:
-    return ",".join(v.strip() for v in value if v.strip())
+def _clean_addresses(values: list[str]) -> list[str]:
+    return [value.strip() for value in values if value.strip()]
 
 
 class MessageRepository:
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        events: MessageEventPublisher = message_events,
+        unread_counts: UnreadCountCache = unread_count_cache,
+    ):
         self.session = session
+        self.events = events
+        self.unread_counts = unread_counts
+
+    async def count_unread(self, user_id: str) -> int:
+        stmt = select(EmailUnreadCounter.unread_count).where(EmailUnreadCounter.user_id == uuid.UUID(user_id))
+        result = await self.session.execute(stmt)
+        return int(result.scalar() or 0)
+
+    async def get_unread_counts(self, user_id: str) -> UnreadCounts:
+        cached = await self.unread_counts.read(user_id)
+        if cached is None:
+            version, total, threads = await self._load_unread_counts(uuid.UUID(user_id))
+            await self.unread_counts.fill(user_id, version, total, threads)
+        else:
+            total, threads = cached
+        return UnreadCounts(
+            platform=Platform.EMAIL,
+            unread_count=total,
+            threads=[
+                ThreadUnreadCount(thread_id=thread_id, unread_count=count)
+                for thread_id, count in sorted(threads.items(), key=lambda item: (-item[1], item[0]))
+            ],
+        )
 
-    async def get_unread_messages(self, user_id: str, limit: int) -> list[Message]:
+    async def _load_unread_counts(self, owner: uuid.UUID) -> tuple[int, int, dict[str, int]]:
+        """Counter version, total and per-thread counts, read in one statement so they agree."""
+        stmt = (
+            select(
+                EmailUnreadCounter.version,
+                EmailUnreadCounter.unread_count,
+                cast(EmailThread.id, String).label("thread_id"),
+                EmailThread.unread_count.label("thread_unread_count"),
+            )
+            .select_from(EmailUnreadCounter)
+            .outerjoin(
+                EmailThread,
+                and_(EmailThread.user_id == EmailUnreadCounter.user_id, EmailThread.unread_count > 0),
+            )
+            .where(EmailUnreadCounter.user_id == owner)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
+            return 0, 0, {}
+        threads = {row.thread_id: row.thread_unread_count for row in rows if row.thread_id is not None}
+        return rows[0].version, rows[0].unread_count, threads
+
+    async def _change_unread(self, owner: uuid.UUID, thread_deltas: Counter[uuid.UUID]) -> int | None:
+        """
+        Adjust the thread and user unread counters inside the caller's transaction.
+
+        Returns the user counter's new version, or None when nothing changed.
+        Threads are updated in id order so concurrent writers lock them in the
+        same order.
+        """
+        deltas = {thread_id: delta for thread_id, delta in sorted(thread_deltas.items()) if delta}
+        if not deltas:
+            return None
+        threads = EmailThread.__table__
+        await self.session.execute(
+            update(threads)
+            .where(threads.c.id == bindparam("thread_key"))
+            .values(unread_count=threads.c.unread_count + bindparam("delta")),
+            [{"thread_key": thread_id, "delta": delta} for thread_id, delta in deltas.items()],
+        )
+        stmt = insert(EmailUnreadCounter).values(user_id=owner, unread_count=sum(deltas.values()), version=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EmailUnreadCounter.user_id],
+            set_={
+                "unread_count": EmailUnreadCounter.unread_count + stmt.excluded.unread_count,
+                "version": EmailUnreadCounter.version + 1,
+                "updated_at": func.now(),
+            },
+        ).returning(EmailUnreadCounter.version)
+        return (await self.session.execute(stmt)).scalar_one()
+
+    async def _mirror_unread(self, user_id: str, version: int | None, thread_deltas: Counter[uuid.UUID]) -> None:
+        """Forward a committed counter change to the Redis mirror."""
+        if version is None:
+            return
+        await self.unread_counts.apply(
+            user_id, version, {str(thread_id): delta for thread_id, delta in thread_deltas.items() if delta}
+        )
+
+    async def recount_unread(self, user_ids: list[str]) -> None:
+        """
+        Rebuild the counters of `user_ids` from their messages and commit.
+
+        For bulk ingest that writes rows directly instead of going through the
+        write paths above.
+        """
+        owners = [uuid.UUID(user_id) for user_id in dict.fromkeys(user_ids)]
+        if not owners:
+            return
+        # The recount runs as Core statements, which do not autoflush; pending ORM rows must be counted too.
+        await self.session.flush()
+        messages = EmailMessage.__table__
+        threads = EmailThread.__table__
+        owner_filter = threads.c.user_id == any_(bindparam("owners", owners, type_=ARRAY(UUID(as_uuid=True))))
+        await self.session.execute(
+            update(threads)
+            .where(owner_filter)
+            .values(
+                unread_count=select(func.count())
+                .where(messages.c.thread_id == threads.c.id, messages.c.is_unread)
+                .scalar_subquery()
+            )
+        )
+        totals = (
+            select(threads.c.user_id, func.sum(threads.c.unread_count), literal(1))
+            .where(owner_filter)
+            .group_by(threads.c.user_id)
+        )
+        stmt = insert(EmailUnreadCounter).from_select(["user_id", "unread_count", "version"], totals)
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[EmailUnreadCounter.user_id],
+                set_={
+                    "unread_count": stmt.excluded.unread_count,
+                    "version": EmailUnreadCounter.version + 1,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        await self.session.commit()
+        for owner in owners:
+            version, total, counts = await self._load_unread_counts(owner)
+            await self.unread_counts.fill(str(owner), version, total, counts)
+
+    async def get_unread_version(self, user_id: str) -> tuple[datetime | None, int]:
+        """Cheap change marker for a user's unread list: newest thread update plus unread count."""
+        owner = uuid.UUID(user_id)
+        stmt = select(
+            select(func.max(EmailThread.updated_at)).where(EmailThread.user_id == owner).scalar_subquery(),
+            select(EmailUnreadCounter.unread_count).where(EmailUnreadCounter.user_id == owner).scalar_subquery(),
+        )
+        updated_at, unread_count = (await self.session.execute(stmt)).one()
+        return updated_at, int(unread_count or 0)
+
+    async def get_thread_version(self, user_id: str, thread_id: str) -> tuple[datetime, int, int] | None:
+        stmt = (
+            select(
+                EmailThread.updated_at,
+                func.count(EmailMessage.id),
+                EmailThread.unread_count,
+            )
+            .outerjoin(EmailMessage, EmailMessage.thread_id == EmailThread.id)
+            .where(EmailThread.id == uuid.UUID(thread_id), EmailThread.user_id == uuid.UUID(user_id))
+            .group_by(EmailThread.id)
+        )
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            return None
+        return row[0], int(row[1]), int(row[2])
+
+    async def _publish(self, event_type: str, user_id: str, messages: list[Message]) -> None:
+        if not messages:
+            return
+        await self.events.publish(
+            event_type,
+            user_id=user_id,
+            message_ids=[message.id for message in messages],
+            thread_ids=[message.thread_id for message in messages],
+            unread_count=await self.count_unread(user_id),
+        )
+
+    async def get_unread_messages(
+        self,
+        user_id: str,
+        limit: int,
+        before: datetime | None = None,
+        cursor: str | None = None,
+        participant: str | None = None,
+    ) -> list[Message]:
         stmt = (
             select(EmailMessage, EmailThread)
             .join(EmailThread, EmailThread.id == EmailMessage.thread_id)
-            .where(EmailMessage.user_id == uuid.UUID(user_id), EmailMessage.is_unread.is_(True))
-            .order_by(EmailMessage.sent_at.desc())
+            .where(EmailMessage.user_id == uuid.UUID(user_id), EmailMessage.is_unread)
+            .order_by(EmailMessage.sent_at.desc(), EmailMessage.id.desc())
             .limit(limit)
         )
+        if before is not None:
+            stmt = stmt.where(EmailMessage.sent_at < before)
+        if cursor is not None:
+            stmt = stmt.where(self._older_than_cursor(cursor))
+        if participant is not None:
+            stmt = stmt.where(self._involving(participant))
         result = await self.session.execute(stmt)
         rows = result.all()
-        return [self._to_message(row.EmailMessage, row.EmailThread) for row in rows]
+        return [self._to_message(row.EmailMessage, row.EmailThread.subject) for row in rows]
+
+    async def stream_messages(
+        self,
+        user_id: str,
+        unread_only: bool = False,
+        thread_id: str | None = None,
+        since: datetime | None = None,
+        participant: str | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[list[Message]]:
+        stmt = (
+            select(EmailMessage, EmailThread.subject)
+            .join(EmailThread, EmailThread.id == EmailMessage.thread_id)
+            .where(EmailMessage.user_id == uuid.UUID(user_id))
+            .order_by(EmailMessage.sent_at.asc(), EmailMessage.id.asc())
+            # Server-side cursor: rows arrive in partitions of `batch_size` instead of one big fetch.
+            .execution_options(yield_per=batch_size)
+        )
+        if unread_only:
+            stmt = stmt.where(EmailMessage.is_unread)
+        if thread_id is not None:
+            stmt = stmt.where(EmailMessage.thread_id == uuid.UUID(thread_id))
+        if since is not None:
+            stmt = stmt.where(EmailMessage.sent_at >= since)
+        if participant is not None:
+            stmt = stmt.where(self._involving(participant))
+        result = await self.session.stream(stmt)
+        async for partition in result.partitions():
+            yield [self._to_message(row.EmailMessage, row.subject) for row in partition]
+
+    async def search_messages(
+        self,
+        user_id: str,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        unread_only: bool = False,
+        participant: str | None = None,
+    ) -> SearchResults:
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        document = EmailMessage.search_vector.op("||", return_type=TSVECTOR)(EmailThread.subject_vector)
+        rank = func.ts_rank(document, ts_query, type_=REAL)
 
-    async def get_thread(self, user_id: str, thread_id: str) -> ThreadDetail | None:
-        thread_stmt = select(EmailThread).where(
-            EmailThread.id == uuid.UUID(thread_id),
-            EmailThread.user_id == uuid.UUID(user_id),
+        # Rank and page on ids first so ts_headline only runs for the rows that are returned.
+        page = (
+            select(EmailMessage.id.label("id"), rank.label("rank"))
+            .join(EmailThread, EmailThread.id == EmailMessage.thread_id)
+            .where(
+                EmailMessage.user_id == uuid.UUID(user_id),
+                # Two matches instead of one on `document`, so each side can use its own GIN index.
+                or_(EmailMessage.search_vector.op("@@")(ts_query), EmailThread.subject_vector.op("@@")(ts_query)),
+            )
+            .order_by(rank.desc(), EmailMessage.sent_at.desc(), EmailMessage.id.desc())
+            .limit(limit)
         )
-        thread_result = await self.session.execute(thread_stmt)
-        thread = thread_result.scalar_one_or_none()
-        if not thread:
-            return None
+        if since is not None:
+            page = page.where(EmailMessage.sent_at >= since)
+        if until is not None:
+            page = page.where(EmailMessage.sent_at < until)
+        if unread_only:
+            page = page.where(EmailMessage.is_unread)
+        if participant is not None:
+            page = page.where(self._involving(participant))
+        if cursor is not None:
+            last_rank, sent_at, message_id = decode_rank_cursor(cursor)
+            page = page.where(
+                tuple_(rank, EmailMessage.sent_at, EmailMessage.id) < (last_rank, sent_at, uuid.UUID(message_id))
+            )
+        page = page.subquery()
 
-        messages_stmt = (
-            select(EmailMessage)
-            .where(EmailMessage.thread_id == thread.id, EmailMessage.user_id == uuid.UUID(user_id))
-            .order_by(EmailMessage.sent_at.asc())
+        stmt = (
+            select(
+                EmailMessage,
+                EmailThread.subject,
+                page.c.rank,
+                func.ts_headline(SEARCH_CONFIG, EmailMessage.body, ts_query, SEARCH_HEADLINE_OPTIONS).label("snippet"),
+            )
+            .join(page, page.c.id == EmailMessage.id)
+            .join(EmailThread, EmailThread.id == EmailMessage.thread_id)
+            .order_by(page.c.rank.desc(), EmailMessage.sent_at.desc(), EmailMessage.id.desc())
         )
-        messages_result = await self.session.execute(messages_stmt)
-        messages = list(messages_result.scalars().all())
+        rows = (await self.session.execute(stmt)).all()
+        hits = [
+            SearchHit(
+                message=self._to_message(row.EmailMessage, row.subject),
+                rank=row.rank,
+                snippet=row.snippet,
+            )
+            for row in rows
+        ]
+        next_cursor = None
+        if len(rows) == limit:
+            last = rows[-1]
+            next_cursor = encode_rank_cursor(last.rank, last.EmailMessage.sent_at, str(last.EmailMessage.id))
+        return SearchResults(hits=hits, next_cursor=next_cursor)
+
+    @staticmethod
+    def _involving(participant: str):
+        """Messages from or to `participant` (an exact address), answered from the sender and recipients indexes."""
+        address = participant.strip()
+        return or_(EmailMessage.sender == address, EmailMessage.recipients.contains([address]))
+
+    @staticmethod
+    def _older_than_cursor(cursor: str):
+        sent_at, message_id = decode_cursor(cursor)
+        try:
+            return tuple_(EmailMessage.sent_at, EmailMessage.id) < (sent_at, uuid.UUID(message_id))
+        except ValueError:
+            # Cursors minted by the gateway's cross-platform merge may end on another platform's message.
+            # Postgres orders uuids like their hex text, so comparing as text keeps the merged order.
+            return or_(
+                EmailMessage.sent_at < sent_at,
+                and_(EmailMessage.sent_at == sent_at, cast(EmailMessage.id, String) < message_id),
+            )
 
-        unread_count_stmt = select(func.count(EmailMessage.id)).where(
-            EmailMessage.thread_id == thread.id,
-            EmailMessage.user_id == uuid.UUID(user_id),
-            EmailMessage.is_unread.is_(True),
+    async def get_thread(
+        self,
+        user_id: str,
+        thread_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> ThreadDetail | None:
+        owner, thread = uuid.UUID(user_id), uuid.UUID(thread_id)
+        page_stmt = (
+            select(
+                EmailMessage.id,
+                EmailMessage.sender,
+                EmailMessage.recipients,
+                EmailMessage.body,
+                EmailMessage.is_unread,
+                EmailMessage.direction,
+                EmailMessage.priority,
+                EmailMessage.sent_at,
+            )
+            .where(EmailMessage.thread_id == EmailThread.id, EmailMessage.user_id == owner)
+            .order_by(EmailMessage.sent_at.asc(), EmailMessage.id.asc())
+        )
+        if cursor is not None:
+            sent_at, message_id = decode_cursor(cursor)
+            page_stmt = page_stmt.where(
+                tuple_(EmailMessage.sent_at, EmailMessage.id) > (sent_at, uuid.UUID(message_id))
+            )
+        if limit is not None:
+            page_stmt = page_stmt.limit(limit)
+        page = page_stmt.lateral("page")
+        # One round trip: the thread row and the message page come back as one
+        # row per message (or a single row with NULL message columns when the page is empty).
+        # Ids are cast to text in the database; asyncpg decodes text and arrays in C, which is far
+        # cheaper than str(uuid) per row in Python.
+        stmt = (
+            select(
+                EmailThread.subject,
+                EmailThread.participants,
+                EmailThread.updated_at,
+                EmailThread.unread_count,
+                cast(page.c.id, String).label("id"),
+                page.c.sender,
+                page.c.recipients,
+                page.c.body,
+                page.c.is_unread,
+                page.c.direction,
+                page.c.priority,
+                page.c.sent_at,
+            )
+            .select_from(EmailThread)
+            .outerjoin(page, true())
+            .where(EmailThread.id == thread, EmailThread.user_id == owner)
+            .order_by(page.c.sent_at.asc(), page.c.id.asc())
         )
-        unread_count_result = await self.session.execute(unread_count_stmt)
-        unread_count = int(unread_count_result.scalar() or 0)
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
+            return None
 
+        first = rows[0]
+        thread_key, owner_key = str(thread), str(owner)
+        messages = [
+            Message(
+                id=message_id,
+                thread_id=thread_key,
+                user_id=owner_key,
+                platform=Platform.EMAIL,
+                sender=sender,
+                recipients=recipients,
+                subject=first.subject,
+                body=body,
+                is_unread=is_unread,
+                direction=direction,
+                priority=priority,
+                sent_at=sent_at,
+            )
+            for *_, message_id, sender, recipients, body, is_unread, direction, priority, sent_at in rows
+            if message_id is not None
+        ]
         return ThreadDetail(
-            id=str(thread.id),
-            user_id=str(thread.user_id),
+            id=thread_key,
+            user_id=owner_key,
             platform=Platform.EMAIL,
-            subject=thread.subject,
-            participants=_csv_to_list(thread.participants_csv),
-            unread_count=unread_count,
-            messages=[self._to_message(message, thread) for message in messages],
+            subject=first.subject,
+            participants=first.participants,
+            unread_count=first.unread_count,
+            messages=messages,
+            updated_at=first.updated_at,
+            next_cursor=(
+                encode_cursor(messages[-1].sent_at, messages[-1].id)
+                if limit is not None and len(messages) == limit
+                else None
+            ),
         )
 
     async def send_reply(self, user_id: str, message_id: str, body: str) -> Message:
@@ -76,6 +446,9 @@ class MessageRepository:
             select(EmailMessage, EmailThread)
             .join(EmailThread, EmailThread.id == EmailMessage.thread_id)
             .where(EmailMessage.id == uuid.UUID(message_id), EmailMessage.user_id == uuid.UUID(user_id))
+            # Locked and re-read so the unread transition below is counted exactly once.
+            .with_for_update(of=EmailMessage)
+            .execution_options(populate_existing=True)
         )
         result = await self.session.execute(msg_stmt)
         row = result.first()
@@ -85,13 +458,14 @@ class MessageRepository:
         original = row.EmailMessage
         thread = row.EmailThread
 
+        deltas = Counter({thread.id: -1 if original.is_unread else 0})
         original.is_unread = False
 
         reply = EmailMessage(
             thread_id=thread.id,
             user_id=uuid.UUID(user_id),
             sender="assistant@inbox.local",
-            recipients_csv=_list_to_csv(_csv_to_list(original.recipients_csv) or [original.sender]),
+            recipients=original.recipients or [original.sender],
             body=body,
             is_unread=False,
             direction=MessageDirection.OUTGOING.value,
@@ -100,10 +474,14 @@ class MessageRepository:
         )
         self.session.add(reply)
         thread.updated_at = datetime.now(UTC)
+        version = await self._change_unread(thread.user_id, deltas)
         await self.session.commit()
         await self.session.refresh(reply)
+        await self._mirror_unread(user_id, version, deltas)
 
-        return self._to_message(reply, thread)
+        sent = self._to_message(reply, thread.subject)
+        await self._publish("message_sent", user_id, [sent, self._to_message(original, thread.subject)])
+        return sent
 
     async def send_message(
         self,
@@ -126,7 +504,7 @@ class MessageRepository:
             thread = EmailThread(
                 user_id=uuid.UUID(user_id),
                 subject=subject,
-                participants_csv=_list_to_csv(recipients),
+                participants=_clean_addresses(recipients),
             )
             self.session.add(thread)
             await self.session.flush()
@@ -135,7 +513,7 @@ class MessageRepository:
             thread_id=thread.id,
             user_id=uuid.UUID(user_id),
             sender="assistant@inbox.local",
-            recipients_csv=_list_to_csv(recipients),
+            recipients=_clean_addresses(recipients),
             body=body,
             is_unread=False,
             direction=MessageDirection.OUTGOING.value,
@@ -143,16 +521,21 @@ class MessageRepository:
             sent_at=datetime.now(UTC),
         )
         self.session.add(message)
+        thread.updated_at = datetime.now(UTC)
         await self.session.commit()
         await self.session.refresh(message)
         await self.session.refresh(thread)
-        return self._to_message(message, thread)
+        sent = self._to_message(message, thread.subject)
+        await self._publish("message_sent", user_id, [sent])
+        return sent
 
     async def mark_as_read(self, user_id: str, message_id: str) -> Message:
         stmt = (
             select(EmailMessage, EmailThread)
             .join(EmailThread, EmailThread.id == EmailMessage.thread_id)
             .where(EmailMessage.id == uuid.UUID(message_id), EmailMessage.user_id == uuid.UUID(user_id))
+            .with_for_update(of=EmailMessage)
+            .execution_options(populate_existing=True)
         )
         result = await self.session.execute(stmt)
         row = result.first()
@@ -161,20 +544,67 @@ class MessageRepository:
 
         message = row.EmailMessage
         thread = row.EmailThread
+        deltas = Counter({thread.id: -1 if message.is_unread else 0})
         message.is_unread = False
+        thread.updated_at = datetime.now(UTC)
+        version = await self._change_unread(thread.user_id, deltas)
         await self.session.commit()
         await self.session.refresh(message)
-        return self._to_message(message, thread)
+        await self._mirror_unread(user_id, version, deltas)
+        updated = self._to_message(message, thread.subject)
+        await self._publish("messages_read", user_id, [updated])
+        return updated
+
+    async def mark_many_as_read(self, user_id: str, message_ids: list[str]) -> list[Message]:
+        owner = uuid.UUID(user_id)
+        ids = [uuid.UUID(message_id) for message_id in dict.fromkeys(message_ids)]
+        messages = EmailMessage.__table__
+        threads = EmailThread.__table__
+        # RETURNING only sees new values, so the locked pre-update state says which rows actually became read.
+        previous = (
+            select(messages.c.id, messages.c.is_unread.label("was_unread"))
+            .where(
+                messages.c.user_id == owner,
+                messages.c.id == any_(bindparam("ids", ids, type_=ARRAY(UUID(as_uuid=True)))),
+            )
+            .with_for_update()
+            .subquery("previous")
+        )
+        stmt = (
+            update(messages)
+            .where(messages.c.id == previous.c.id, messages.c.thread_id == threads.c.id)
+            .values(is_unread=False)
+            .returning(*messages.c, threads.c.subject, previous.c.was_unread)
+        )
+        result = await self.session.execute(stmt)
+        rows = {row.id: row for row in result.all()}
+        thread_ids = list({row.thread_id for row in rows.values()})
+        deltas: Counter[uuid.UUID] = Counter()
+        deltas.subtract(row.thread_id for row in rows.values() if row.was_unread)
+        if thread_ids:
+            await self.session.execute(
+                update(threads)
+                .where(threads.c.id == any_(bindparam("thread_ids", thread_ids, type_=ARRAY(UUID(as_uuid=True)))))
+                .values(updated_at=func.now())
+            )
+        version = await self._change_unread(owner, deltas)
+        await self.session.commit()
+        await self._mirror_unread(user_id, version, deltas)
+        updated = [
+            self._to_message(rows[message_id], rows[message_id].subject) for message_id in ids if message_id in rows
+        ]
+        await self._publish("messages_read", user_id, updated)
+        return updated
 
-    def _to_message(self, message: EmailMessage, thread: EmailThread) -> Message:
+    def _to_message(self, message: EmailMessage, subject: str | None) -> Message:
         return Message(
             id=str(message.id),
             thread_id=str(message.thread_id),
             user_id=str(message.user_id),
             platform=Platform.EMAIL,
             sender=message.sender,
-            recipients=_csv_to_list(message.recipients_csv),
-            subject=thread.subject,
+            recipients=message.recipients,
+            subject=subject,
             body=message.body,
             is_unread=message.is_unread,
             direction=MessageDirection(message.direction),
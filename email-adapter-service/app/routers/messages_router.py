@@ -1,10 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import uuid
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import AsyncSessionLocal
 from app.dependencies import get_current_user, get_session
-from app.schemas.message import ReplyPayload, SendPayload, ThreadResponse, UnreadMessagesResponse
+from app.schemas.message import (
+    MarkReadPayload,
+    MarkReadResponse,
+    ReplyPayload,
+    SendPayload,
+    ThreadResponse,
+    UnreadMessagesResponse,
+)
 from app.services.message_service import MessageService
-from shared.models import AuthenticatedUser, Message, SendMessageRequest
+from shared.etag import etag_matches
+from shared.models import AuthenticatedUser, Message, SearchResults, SendMessageRequest, UnreadCounts
+from shared.pagination import encode_cursor
 
 
 router = APIRouter(prefix="/v1", tags=["messages"])
@@ -12,13 +27,98 @@ router = APIRouter(prefix="/v1", tags=["messages"])
 
 @router.get("/messages/unread", response_model=UnreadMessagesResponse)
 async def get_unread_messages(
+    response: Response,
     limit: int = Query(default=25, ge=1, le=100),
+    before: datetime | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    participant: str | None = Query(default=None, min_length=1, max_length=320),
+    if_none_match: str | None = Header(default=None),
+    user: AuthenticatedUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> UnreadMessagesResponse | Response:
+    service = MessageService(session)
+    etag = await service.get_unread_etag(
+        user_id=user.user_id,
+        limit=limit,
+        before=before,
+        cursor=cursor,
+        participant=participant,
+    )
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    try:
+        messages = await service.get_unread_messages(
+            user_id=user.user_id,
+            limit=limit,
+            before=before,
+            cursor=cursor,
+            participant=participant,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    response.headers["ETag"] = etag
+    next_cursor = encode_cursor(messages[-1].sent_at, messages[-1].id) if len(messages) == limit else None
+    return UnreadMessagesResponse(messages=messages, next_cursor=next_cursor)
+
+
+@router.get("/counts", response_model=UnreadCounts)
+async def get_unread_counts(
     user: AuthenticatedUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
-) -> UnreadMessagesResponse:
+) -> UnreadCounts:
     service = MessageService(session)
-    messages = await service.get_unread_messages(user_id=user.user_id, limit=limit)
-    return UnreadMessagesResponse(messages=messages)
+    return await service.get_unread_counts(user_id=user.user_id)
+
+
+@router.get("/messages/search", response_model=SearchResults)
+async def search_messages(
+    q: str = Query(min_length=1, max_length=500),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+    since: datetime | None = Query(default=None),
+    until: datetime | None = Query(default=None),
+    unread_only: bool = Query(default=False),
+    participant: str | None = Query(default=None, min_length=1, max_length=320),
+    user: AuthenticatedUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> SearchResults:
+    service = MessageService(session)
+    try:
+        return await service.search_messages(
+            user_id=user.user_id,
+            query=q,
+            limit=limit,
+            cursor=cursor,
+            since=since,
+            until=until,
+            unread_only=unread_only,
+            participant=participant,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.get("/messages/export")
+async def export_messages(
+    unread_only: bool = Query(default=False),
+    thread_id: uuid.UUID | None = Query(default=None),
+    since: datetime | None = Query(default=None),
+    participant: str | None = Query(default=None, min_length=1, max_length=320),
+    user: AuthenticatedUser = Depends(get_current_user),
+) -> StreamingResponse:
+    async def body() -> AsyncIterator[bytes]:
+        # Request-scoped sessions close before a streamed body is sent, so the export owns its session.
+        async with AsyncSessionLocal() as session:
+            async for chunk in MessageService(session).export_ndjson(
+                user_id=user.user_id,
+                unread_only=unread_only,
+                thread_id=str(thread_id) if thread_id else None,
+                since=since,
+                participant=participant,
+            ):
+                yield chunk
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
 
 
 @router.post("/messages/{message_id}/reply", response_model=Message)
@@ -49,6 +149,20 @@ async def send_message(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
+@router.post("/messages/mark-read", response_model=MarkReadResponse)
+async def mark_many_as_read(
+    payload: MarkReadPayload,
+    user: AuthenticatedUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> MarkReadResponse:
+    service = MessageService(session)
+    try:
+        messages = await service.mark_many_as_read(user_id=user.user_id, message_ids=payload.message_ids)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return MarkReadResponse(messages=messages)
+
+
 @router.post("/messages/{message_id}/mark-read", response_model=Message)
 async def mark_as_read(
     message_id: str,
@@ -65,11 +179,28 @@ async def mark_as_read(
 @router.get("/threads/{thread_id}", response_model=ThreadResponse)
 async def get_thread(
     thread_id: str,
+    response: Response,
+    limit: int | None = Query(default=None, ge=1, le=500),
+    cursor: str | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
     user: AuthenticatedUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
-) -> ThreadResponse:
+) -> ThreadResponse | Response:
     service = MessageService(session)
-    thread = await service.get_thread(user_id=user.user_id, thread_id=thread_id)
+    try:
+        etag = await service.get_thread_etag(user_id=user.user_id, thread_id=thread_id, limit=limit, cursor=cursor)
+    except ValueError:
+        # A thread id that is not a UUID names no thread.
+        etag = None
+    if etag is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Thread not found")
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    try:
+        thread = await service.get_thread(user_id=user.user_id, thread_id=thread_id, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     if not thread:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Thread not found")
+    response.headers["ETag"] = etag
     return ThreadResponse(thread=thread)
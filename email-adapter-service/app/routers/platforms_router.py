@@ -1,9 +1,8 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_current_user, get_session
+from app.dependencies import get_current_user
 from app.schemas.platform import PlatformStatusResponse
-from app.services.message_service import MessageService
+from app.services.platform_service import PlatformService
 from shared.models import AuthenticatedUser
 
 
@@ -11,9 +10,11 @@ router = APIRouter(prefix="/v1", tags=["platforms"])
 
 
 @router.get("/platforms", response_model=PlatformStatusResponse)
-async def get_platforms(
-    _: AuthenticatedUser = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
-) -> PlatformStatusResponse:
-    service = MessageService(session)
-    return PlatformStatusResponse(platforms=await service.get_platforms())
+async def get_platforms(_: AuthenticatedUser = Depends(get_current_user)) -> PlatformStatusResponse:
+    return PlatformStatusResponse(platforms=await PlatformService().get_platforms())
+
+
+@router.get("/platforms/health", response_model=PlatformStatusResponse)
+async def get_platforms_health() -> PlatformStatusResponse:
+    # Unauthenticated so the gateway's background prober can poll it without a user token.
+    return PlatformStatusResponse(platforms=await PlatformService().get_platforms())
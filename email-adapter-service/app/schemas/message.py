@@ -5,12 +5,21 @@ from shared.models import Message, SendMessageRequest, ThreadDetail
 
 class UnreadMessagesResponse(BaseModel):
     messages: list[Message]
+    next_cursor: str | None = None
 
 
 class ReplyPayload(BaseModel):
     body: str = Field(min_length=1, max_length=5000)
 
 
+class MarkReadPayload(BaseModel):
+    message_ids: list[str] = Field(min_length=1, max_length=500)
+
+
+class MarkReadResponse(BaseModel):
+    messages: list[Message]
+
+
 class SendPayload(SendMessageRequest):
     pass
 
@@ -1,8 +1,8 @@
 from typing import Any
 
-import httpx
-
 from app.core.config import get_settings
+from app.core.http_client import http_clients
+from app.core.jwks import LocalVerificationUnavailable, verify_token_locally
 from shared.models import AuthenticatedUser, Role
 
 
@@ -10,11 +10,8 @@ settings = get_settings()
 
 
 async def introspect_token(token: str) -> AuthenticatedUser:
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.post(
-            f"{settings.auth_service_url}/auth/introspect",
-            json={"token": token},
-        )
+    client = http_clients.get("auth")
+    response = await client.post("/auth/introspect", json={"token": token})
     response.raise_for_status()
     payload: dict[str, Any] = response.json()
     if not payload.get("active"):
@@ -25,3 +22,16 @@ async def introspect_token(token: str) -> AuthenticatedUser:
         email=payload["email"],
         role=Role(payload["role"]),
     )
+
+
+async def authenticate_token(token: str) -> AuthenticatedUser:
+    if settings.auth_local_verification:
+        try:
+            user = await verify_token_locally(token)
+        except LocalVerificationUnavailable:
+            pass
+        else:
+            if user is None:
+                raise ValueError("Invalid token")
+            return user
+    return await introspect_token(token)
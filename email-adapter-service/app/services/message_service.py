@@ -1,8 +1,21 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.gmail_adapter import GmailAdapter
 from app.adapters.outlook_adapter import OutlookAdapter
-from shared.models import Message, Platform, PlatformStatus, SendMessageRequest, ThreadDetail
+from app.services.platform_service import PlatformService
+from shared.etag import make_etag
+from shared.models import (
+    Message,
+    Platform,
+    PlatformStatus,
+    SearchResults,
+    SendMessageRequest,
+    ThreadDetail,
+    UnreadCounts,
+)
 
 
 class MessageService:
@@ -10,8 +23,54 @@ class MessageService:
         self.gmail_adapter = GmailAdapter(session)
         self.outlook_adapter = OutlookAdapter()
 
-    async def get_unread_messages(self, user_id: str, limit: int) -> list[Message]:
-        return await self.gmail_adapter.fetch_unread(user_id=user_id, limit=limit)
+    async def get_unread_messages(
+        self,
+        user_id: str,
+        limit: int,
+        before: datetime | None = None,
+        cursor: str | None = None,
+        participant: str | None = None,
+    ) -> list[Message]:
+        return await self.gmail_adapter.fetch_unread(
+            user_id=user_id,
+            limit=limit,
+            before=before,
+            cursor=cursor,
+            participant=participant,
+        )
+
+    async def get_unread_etag(
+        self,
+        user_id: str,
+        limit: int,
+        before: datetime | None = None,
+        cursor: str | None = None,
+        participant: str | None = None,
+    ) -> str:
+        updated_at, unread_count = await self.gmail_adapter.get_unread_version(user_id=user_id)
+        return make_etag(
+            "unread",
+            user_id,
+            updated_at.isoformat() if updated_at else None,
+            unread_count,
+            limit,
+            before,
+            cursor,
+            participant,
+        )
+
+    async def get_thread_etag(
+        self,
+        user_id: str,
+        thread_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> str | None:
+        version = await self.gmail_adapter.get_thread_version(user_id=user_id, thread_id=thread_id)
+        if version is None:
+            return None
+        updated_at, message_count, unread_count = version
+        return make_etag("thread", thread_id, updated_at.isoformat(), message_count, unread_count, limit, cursor)
 
     async def send_reply(self, user_id: str, message_id: str, body: str) -> Message:
         return await self.gmail_adapter.send_reply(user_id=user_id, message_id=message_id, body=body)
@@ -24,11 +83,60 @@ class MessageService:
     async def mark_as_read(self, user_id: str, message_id: str) -> Message:
         return await self.gmail_adapter.mark_as_read(user_id=user_id, message_id=message_id)
 
-    async def get_thread(self, user_id: str, thread_id: str) -> ThreadDetail | None:
-        return await self.gmail_adapter.get_thread(user_id=user_id, thread_id=thread_id)
+    async def mark_many_as_read(self, user_id: str, message_ids: list[str]) -> list[Message]:
+        return await self.gmail_adapter.mark_many_as_read(user_id=user_id, message_ids=message_ids)
+
+    async def get_thread(
+        self,
+        user_id: str,
+        thread_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> ThreadDetail | None:
+        return await self.gmail_adapter.get_thread(user_id=user_id, thread_id=thread_id, limit=limit, cursor=cursor)
+
+    async def get_unread_counts(self, user_id: str) -> UnreadCounts:
+        return await self.gmail_adapter.get_unread_counts(user_id=user_id)
+
+    async def search_messages(
+        self,
+        user_id: str,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        unread_only: bool = False,
+        participant: str | None = None,
+    ) -> SearchResults:
+        return await self.gmail_adapter.search_messages(
+            user_id=user_id,
+            query=query,
+            limit=limit,
+            cursor=cursor,
+            since=since,
+            until=until,
+            unread_only=unread_only,
+            participant=participant,
+        )
+
+    async def export_ndjson(
+        self,
+        user_id: str,
+        unread_only: bool = False,
+        thread_id: str | None = None,
+        since: datetime | None = None,
+        participant: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        batches = self.gmail_adapter.stream_messages(
+            user_id=user_id,
+            unread_only=unread_only,
+            thread_id=thread_id,
+            since=since,
+            participant=participant,
+        )
+        async for batch in batches:
+            yield "".join(f"{message.model_dump_json()}\n" for message in batch).encode("utf-8")
 
     async def get_platforms(self) -> list[PlatformStatus]:
-        return [
-            await self.gmail_adapter.get_platform_status(),
-            await self.outlook_adapter.get_platform_status(),
-        ]
+        return await PlatformService().get_platforms()
@@ -5,8 +5,10 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
+from app.core.events import message_events
 from app.models.message import EmailMessage
 from app.models.thread import EmailThread
+from app.repository.message_repository import MessageRepository
 from shared.constants import DEFAULT_ADMIN_USER_ID, DEFAULT_MEMBER_USER_ID, DEFAULT_OWNER_USER_ID
 
 
@@ -29,6 +31,7 @@ async def seed_mock_messages(session: AsyncSession) -> None:
     ]
 
     priorities = ["urgent", "normal", "low"]
+    ingested: dict[str, list[EmailMessage]] = {}
 
     for idx, (user_id, mailbox) in enumerate(seed_users):
         for i in range(settings.mock_seed_message_count):
@@ -36,7 +39,7 @@ async def seed_mock_messages(session: AsyncSession) -> None:
                 id=uuid.uuid4(),
                 user_id=uuid.UUID(user_id),
                 subject=f"Mock Thread {idx + 1}-{i + 1}",
-                participants_csv=f"client{i}@example.com,{mailbox}",
+                participants=[f"client{i}@example.com", mailbox],
             )
             session.add(thread)
             await session.flush()
@@ -46,7 +49,7 @@ async def seed_mock_messages(session: AsyncSession) -> None:
                 thread_id=thread.id,
                 user_id=uuid.UUID(user_id),
                 sender=f"client{i}@example.com",
-                recipients_csv=mailbox,
+                recipients=[mailbox],
                 body=f"Hello {mailbox}, this is mock inbound message {i + 1}.",
                 is_unread=True,
                 direction="incoming",
@@ -54,5 +57,18 @@ async def seed_mock_messages(session: AsyncSession) -> None:
                 sent_at=now - timedelta(minutes=i * 5 + idx * 3),
             )
             session.add(incoming)
+            ingested.setdefault(user_id, []).append(incoming)
 
-    await session.commit()
+    # Rows were added directly, so the unread counters are rebuilt (and committed) in one pass.
+    repository = MessageRepository(session)
+    await repository.recount_unread(list(ingested))
+
+    for user_id, messages in ingested.items():
+        await message_events.publish(
+            "messages_ingested",
+            user_id=user_id,
+            message_ids=[str(message.id) for message in messages],
+            thread_ids=[str(message.thread_id) for message in messages],
+            # Like every other change event, carry the user's total unread count, not this batch's.
+            unread_count=await repository.count_unread(user_id),
+        )
@@ -0,0 +1,13 @@
+from app.adapters.gmail_adapter import GmailAdapter
+from app.adapters.outlook_adapter import OutlookAdapter
+from shared.models import PlatformStatus
+
+
+class PlatformService:
+    """Connection status of the email platforms; needs no database session."""
+
+    async def get_platforms(self) -> list[PlatformStatus]:
+        return [
+            await GmailAdapter.get_platform_status(),
+            await OutlookAdapter.get_platform_status(),
+        ]
@@ -0,0 +1,170 @@
+"""
+Latency benchmark for `MessageRepository.get_thread`.
+
+Seeds throwaway threads of each size for a random user, times full-thread
+reads and first-page reads, prints median and p95 in milliseconds, and
+deletes the seeded rows again. Run from `email-adapter-service/` against
+any database `DATABASE_URL` points at:
+
+    python -m scripts.benchmark_get_thread --sizes 10 1000 10000 --repeat 20
+
+`--mode three-query` times the previous query shape instead: the thread
+row, message ORM entities and an unread count as three round trips,
+converted per row in Python. It reads the current TEXT[] columns, so it
+isolates the round-trip and row-building part of the single-statement
+change; the CSV split the original read also paid no longer exists to be
+measured. The default `both` prints the two side by side.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal, engine, init_database
+from app.models.message import EmailMessage
+from app.models.thread import EmailThread
+from app.repository.message_repository import MessageRepository
+from shared.models import Platform, ThreadDetail
+
+
+PAGE_SIZE = 200
+
+
+async def seed_thread(user_id: uuid.UUID, size: int) -> uuid.UUID:
+    thread_id = uuid.uuid4()
+    started = datetime.now(UTC) - timedelta(minutes=size)
+    async with AsyncSessionLocal() as session, session.begin():
+        await session.execute(
+            insert(EmailThread).values(
+                id=thread_id,
+                user_id=user_id,
+                subject=f"Benchmark thread ({size} messages)",
+                participants=["alice@example.com", "bob@example.com"],
+            )
+        )
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "thread_id": thread_id,
+                "user_id": user_id,
+                "sender": "alice@example.com" if index % 2 else "bob@example.com",
+                "recipients": ["bob@example.com", "carol@example.com"],
+                "body": f"Message {index}: following up on the quarterly numbers before Friday's review.",
+                "is_unread": index % 3 == 0,
+                "direction": "incoming" if index % 2 else "outgoing",
+                "priority": "normal",
+                "sent_at": started + timedelta(minutes=index),
+            }
+            for index in range(size)
+        ]
+        for offset in range(0, size, 5000):
+            await session.execute(insert(EmailMessage), rows[offset : offset + 5000])
+    return thread_id
+
+
+async def three_query_get_thread(
+    session: AsyncSession,
+    user_id: str,
+    thread_id: str,
+    limit: int | None = None,
+) -> ThreadDetail | None:
+    """The three-query shape `get_thread` replaced, on today's schema."""
+    repository = MessageRepository(session)
+    owner = uuid.UUID(user_id)
+    thread_stmt = select(EmailThread).where(EmailThread.id == uuid.UUID(thread_id), EmailThread.user_id == owner)
+    thread = (await session.execute(thread_stmt)).scalar_one_or_none()
+    if thread is None:
+        return None
+
+    messages_stmt = (
+        select(EmailMessage)
+        .where(EmailMessage.thread_id == thread.id, EmailMessage.user_id == owner)
+        .order_by(EmailMessage.sent_at.asc(), EmailMessage.id.asc())
+    )
+    if limit is not None:
+        messages_stmt = messages_stmt.limit(limit)
+    messages = list((await session.execute(messages_stmt)).scalars().all())
+
+    unread_count = await session.scalar(
+        select(func.count(EmailMessage.id)).where(
+            EmailMessage.thread_id == thread.id,
+            EmailMessage.user_id == owner,
+            EmailMessage.is_unread.is_(True),
+        )
+    )
+    return ThreadDetail(
+        id=str(thread.id),
+        user_id=str(thread.user_id),
+        platform=Platform.EMAIL,
+        subject=thread.subject,
+        participants=thread.participants,
+        unread_count=int(unread_count or 0),
+        messages=[repository._to_message(message, thread.subject) for message in messages],
+        updated_at=thread.updated_at,
+    )
+
+
+async def current_get_thread(
+    session: AsyncSession,
+    user_id: str,
+    thread_id: str,
+    limit: int | None = None,
+) -> ThreadDetail | None:
+    return await MessageRepository(session).get_thread(user_id=user_id, thread_id=thread_id, limit=limit)
+
+
+READERS = {"current": current_get_thread, "three-query": three_query_get_thread}
+
+
+async def time_reads(mode: str, user_id: str, thread_id: str, limit: int | None, repeat: int) -> list[float]:
+    reader = READERS[mode]
+    samples = []
+    for attempt in range(repeat + 1):
+        async with AsyncSessionLocal() as session:
+            started = time.perf_counter()
+            await reader(session, user_id, thread_id, limit)
+            elapsed = (time.perf_counter() - started) * 1000
+        # The first read warms the connection and statement caches.
+        if attempt:
+            samples.append(elapsed)
+    return samples
+
+
+def describe(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+    return f"median {statistics.median(ordered):8.2f} ms   p95 {p95:8.2f} ms"
+
+
+async def main(sizes: list[int], repeat: int, modes: list[str]) -> None:
+    await init_database()
+    user_id = uuid.uuid4()
+    try:
+        for size in sizes:
+            thread_id = await seed_thread(user_id, size)
+            for mode in modes:
+                full = await time_reads(mode, str(user_id), str(thread_id), None, repeat)
+                page = await time_reads(mode, str(user_id), str(thread_id), PAGE_SIZE, repeat)
+                print(
+                    f"{size:>6} messages   {mode:<11}   full thread: {describe(full)}   "
+                    f"first {PAGE_SIZE}: {describe(page)}"
+                )
+    finally:
+        async with AsyncSessionLocal() as session, session.begin():
+            await session.execute(delete(EmailThread).where(EmailThread.user_id == user_id))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--mode", choices=[*READERS, "both"], default="both")
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeat, list(READERS) if args.mode == "both" else [args.mode]))
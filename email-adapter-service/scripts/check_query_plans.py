@@ -0,0 +1,172 @@
+"""
+Assert that the hot read paths are planned on their indexes.
+
+Migrates the database, seeds throwaway mailboxes large enough for the planner
+to prefer index scans, runs the repository methods while capturing the SQL
+they issue, and checks the EXPLAIN plan of every captured statement. Exits
+non-zero when a query misses its index or the unread list needs a sort. Run
+from `email-adapter-service/`:
+
+    python -m scripts.check_query_plans --users 40 --messages-per-user 2000
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, event, insert, select, text
+
+from app.core.database import AsyncSessionLocal, engine, init_database
+from app.models.message import EmailMessage
+from app.models.thread import EmailThread
+from app.repository.message_repository import MessageRepository
+
+
+UNREAD_INDEX = "ix_email_messages_unread_user_sent"
+THREAD_INDEX = "ix_email_messages_thread_covering"
+RECIPIENTS_INDEX = "ix_email_messages_recipients"
+SENDER_INDEX = "ix_email_messages_user_sender"
+PARTICIPANT = "contact7@example.com"
+MESSAGES_PER_THREAD = 25
+
+
+async def seed(users: int, messages_per_user: int) -> list[uuid.UUID]:
+    user_ids = [uuid.uuid4() for _ in range(users)]
+    started = datetime.now(UTC) - timedelta(days=30)
+    async with AsyncSessionLocal() as session, session.begin():
+        for user_id in user_ids:
+            thread_ids = [uuid.uuid4() for _ in range(max(1, messages_per_user // MESSAGES_PER_THREAD))]
+            await session.execute(
+                insert(EmailThread),
+                [{"id": thread_id, "user_id": user_id, "subject": "Plan check"} for thread_id in thread_ids],
+            )
+            await session.execute(
+                insert(EmailMessage),
+                [
+                    {
+                        "thread_id": thread_ids[index % len(thread_ids)],
+                        "user_id": user_id,
+                        "sender": "sender@example.com",
+                        "recipients": [f"contact{index % 100}@example.com"],
+                        "body": f"Message {index}",
+                        # Roughly one message in ten unread, like a mailbox that is kept up with.
+                        "is_unread": index % 10 == 0,
+                        "sent_at": started + timedelta(minutes=index),
+                    }
+                    for index in range(messages_per_user)
+                ],
+            )
+    # VACUUM as well as ANALYZE: index-only scans are costed on the visibility map, which autovacuum keeps current.
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE email_messages"))
+        await conn.execute(text("VACUUM ANALYZE email_threads"))
+    return user_ids
+
+
+async def drain(batches: AsyncIterator[object]) -> None:
+    async for _ in batches:
+        pass
+
+
+async def capture(call: Callable[[MessageRepository], Awaitable[object]]) -> list[tuple[str, tuple]]:
+    statements: list[tuple[str, tuple]] = []
+
+    def record(_conn, _cursor, statement, parameters, _context, _executemany) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        async with AsyncSessionLocal() as session:
+            await call(MessageRepository(session))
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+    return statements
+
+
+def plan_nodes(node: dict) -> Iterator[dict]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+async def explain(statement: str, parameters: tuple) -> list[dict]:
+    async with engine.connect() as conn:
+        raw = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)).scalar_one()
+    plan = json.loads(raw) if isinstance(raw, str) else raw
+    return list(plan_nodes(plan[0]["Plan"]))
+
+
+async def check(
+    label: str,
+    call: Callable[[MessageRepository], Awaitable[object]],
+    index: str,
+    forbid_sort: bool = False,
+    also: str | None = None,
+) -> bool:
+    statements = [item for item in await capture(call) if "email_messages" in item[0]]
+    ok = bool(statements)
+    for statement, parameters in statements:
+        nodes = await explain(statement, parameters)
+        used = sorted({node["Index Name"] for node in nodes if "Index Name" in node})
+        sorted_in_memory = any(node["Node Type"] == "Sort" for node in nodes)
+        passed = index in used and (also is None or also in used) and not (forbid_sort and sorted_in_memory)
+        ok = ok and passed
+        detail = f"indexes={used}" + (" +Sort" if sorted_in_memory else "")
+        print(f"{'ok  ' if passed else 'FAIL'} {label}: {detail}")
+    if not statements:
+        print(f"FAIL {label}: no email_messages query captured")
+    return ok
+
+
+async def main(users: int, messages_per_user: int) -> int:
+    await init_database()
+    user_ids = await seed(users, messages_per_user)
+    user_id = str(user_ids[0])
+    try:
+        async with AsyncSessionLocal() as session:
+            thread_id = str(
+                (await session.execute(select(EmailThread.id).where(EmailThread.user_id == user_ids[0]).limit(1)))
+                .scalar_one()
+            )
+        results = [
+            await check(
+                "unread list",
+                lambda repo: repo.get_unread_messages(user_id=user_id, limit=50),
+                UNREAD_INDEX,
+                forbid_sort=True,
+            ),
+            await check(
+                "thread page",
+                lambda repo: repo.get_thread(user_id=user_id, thread_id=thread_id, limit=20),
+                THREAD_INDEX,
+            ),
+            await check(
+                "thread version",
+                lambda repo: repo.get_thread_version(user_id=user_id, thread_id=thread_id),
+                THREAD_INDEX,
+            ),
+            await check(
+                "participant export",
+                lambda repo: drain(repo.stream_messages(user_id=user_id, participant=PARTICIPANT)),
+                RECIPIENTS_INDEX,
+                also=SENDER_INDEX,
+            ),
+        ]
+    finally:
+        async with AsyncSessionLocal() as session, session.begin():
+            await session.execute(delete(EmailThread).where(EmailThread.user_id.in_(user_ids)))
+        await engine.dispose()
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=40)
+    parser.add_argument("--messages-per-user", type=int, default=2000)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.users, args.messages_per_user)))
@@ -39,6 +39,31 @@ export interface ThreadDetail {
   participants: string[];
   unread_count: number;
   messages: Message[];
+  next_cursor?: string | null;
+  updated_at?: string | null;
+}
+
+export interface SearchHit {
+  message: Message;
+  rank: number;
+  snippet: string;
+  score?: number | null;
+}
+
+export interface SearchResults {
+  hits: SearchHit[];
+  next_cursor?: string | null;
+}
+
+export interface ThreadUnreadCount {
+  thread_id: string;
+  unread_count: number;
+}
+
+export interface UnreadCounts {
+  platform: Platform;
+  unread_count: number;
+  threads: ThreadUnreadCount[];
 }
 
 export interface PlatformStatus {
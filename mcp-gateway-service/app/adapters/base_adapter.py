@@ -1,13 +1,21 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 
-from shared.models import Message, PlatformStatus, SendMessageRequest, ThreadDetail
+from shared.models import Message, PlatformStatus, SearchResults, SendMessageRequest, ThreadDetail, UnreadCounts
 
 
 class BaseGatewayPlatformAdapter(ABC):
     platform: str
 
     @abstractmethod
-    async def get_unread_messages(self, token: str, limit: int) -> list[Message]:
+    async def get_unread_messages(
+        self,
+        token: str,
+        limit: int,
+        before: datetime | None = None,
+        cursor: str | None = None,
+    ) -> list[Message]:
         raise NotImplementedError
 
     @abstractmethod
@@ -22,10 +30,55 @@ class BaseGatewayPlatformAdapter(ABC):
     async def mark_as_read(self, token: str, message_id: str) -> Message:
         raise NotImplementedError
 
+    @abstractmethod
+    async def mark_many_as_read(self, token: str, message_ids: list[str]) -> list[Message]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_platforms(self, token: str) -> list[PlatformStatus]:
         raise NotImplementedError
 
     @abstractmethod
-    async def get_thread(self, token: str, thread_id: str) -> ThreadDetail:
+    async def probe(self) -> list[PlatformStatus]:
+        """Token-less health check used by the background platform prober."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search_messages(
+        self,
+        token: str,
+        query: str,
+        limit: int = 20,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        unread_only: bool = False,
+        participant: str | None = None,
+    ) -> SearchResults:
+        raise NotImplementedError
+
+    @abstractmethod
+    def export_messages(
+        self,
+        token: str,
+        unread_only: bool = False,
+        thread_id: str | None = None,
+        since: datetime | None = None,
+    ) -> AsyncIterator[bytes]:
+        """NDJSON byte stream of the user's messages, relayed without buffering."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_thread(
+        self,
+        token: str,
+        thread_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> ThreadDetail:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_unread_counts(self, token: str) -> UnreadCounts:
+        """Unread total and per-thread counts for the caller."""
         raise NotImplementedError
@@ -1,16 +1,25 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+
 from app.adapters.base_adapter import BaseGatewayPlatformAdapter
 from app.services.email_adapter_client import EmailAdapterClient
-from shared.models import Message, PlatformStatus, SendMessageRequest, ThreadDetail
+from shared.models import Message, PlatformStatus, SearchResults, SendMessageRequest, ThreadDetail, UnreadCounts
 
 
 class EmailGatewayAdapter(BaseGatewayPlatformAdapter):
     platform = "email"
 
-    def __init__(self):
-        self.client = EmailAdapterClient()
+    def __init__(self, client: EmailAdapterClient):
+        self.client = client
 
-    async def get_unread_messages(self, token: str, limit: int) -> list[Message]:
-        return await self.client.get_unread_messages(token=token, limit=limit)
+    async def get_unread_messages(
+        self,
+        token: str,
+        limit: int,
+        before: datetime | None = None,
+        cursor: str | None = None,
+    ) -> list[Message]:
+        return await self.client.get_unread_messages(token=token, limit=limit, before=before, cursor=cursor)
 
     async def send_reply(self, token: str, message_id: str, content: str) -> Message:
         return await self.client.send_reply(token=token, message_id=message_id, body=content)
@@ -21,8 +30,59 @@ class EmailGatewayAdapter(BaseGatewayPlatformAdapter):
     async def mark_as_read(self, token: str, message_id: str) -> Message:
         return await self.client.mark_as_read(token=token, message_id=message_id)
 
+    async def mark_many_as_read(self, token: str, message_ids: list[str]) -> list[Message]:
+        return await self.client.mark_many_as_read(token=token, message_ids=message_ids)
+
     async def get_platforms(self, token: str) -> list[PlatformStatus]:
         return await self.client.get_platforms(token=token)
 
-    async def get_thread(self, token: str, thread_id: str) -> ThreadDetail:
-        return await self.client.get_thread(token=token, thread_id=thread_id)
+    async def probe(self) -> list[PlatformStatus]:
+        return await self.client.get_platform_health()
+
+    async def search_messages(
+        self,
+        token: str,
+        query: str,
+        limit: int = 20,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        unread_only: bool = False,
+        participant: str | None = None,
+    ) -> SearchResults:
+        return await self.client.search_messages(
+            token=token,
+            query=query,
+            limit=limit,
+            cursor=cursor,
+            since=since,
+            until=until,
+            unread_only=unread_only,
+            participant=participant,
+        )
+
+    def export_messages(
+        self,
+        token: str,
+        unread_only: bool = False,
+        thread_id: str | None = None,
+        since: datetime | None = None,
+    ) -> AsyncIterator[bytes]:
+        return self.client.stream_messages_export(
+            token=token,
+            unread_only=unread_only,
+            thread_id=thread_id,
+            since=since,
+        )
+
+    async def get_thread(
+        self,
+        token: str,
+        thread_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> ThreadDetail:
+        return await self.client.get_thread(token=token, thread_id=thread_id, limit=limit, cursor=cursor)
+
+    async def get_unread_counts(self, token: str) -> UnreadCounts:
+        return await self.client.get_unread_counts(token=token)
@@ -1,15 +1,24 @@
 from app.adapters.base_adapter import BaseGatewayPlatformAdapter
 from app.adapters.email_gateway_adapter import EmailGatewayAdapter
+from app.adapters.resilience import AdapterGuards, ResilientAdapter, adapter_guards
 from app.adapters.slack_gateway_adapter import SlackGatewayAdapter
 from app.adapters.whatsapp_gateway_adapter import WhatsAppGatewayAdapter
+from app.core.http_client import http_clients
+from app.services.email_adapter_client import EmailAdapterClient
+from shared.http_client import HttpClientRegistry
 
 
 class AdapterFactory:
-    def __init__(self):
+    def __init__(self, clients: HttpClientRegistry = http_clients, guards: AdapterGuards = adapter_guards):
+        self.guards = guards
+        adapters: list[BaseGatewayPlatformAdapter] = [
+            EmailGatewayAdapter(EmailAdapterClient(clients.get("email"))),
+            SlackGatewayAdapter(),
+            WhatsAppGatewayAdapter(),
+        ]
+        # Breaker and bulkhead state lives in `guards`, so it survives across per-request factories.
         self._adapters: dict[str, BaseGatewayPlatformAdapter] = {
-            "email": EmailGatewayAdapter(),
-            "slack": SlackGatewayAdapter(),
-            "whatsapp": WhatsAppGatewayAdapter(),
+            adapter.platform: ResilientAdapter(adapter, guards.get(adapter.platform)) for adapter in adapters
         }
 
     def get(self, platform: str) -> BaseGatewayPlatformAdapter:
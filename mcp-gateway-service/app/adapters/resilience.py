@@ -0,0 +1,328 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import datetime
+from typing import Any, TypeVar
+
+import httpx
+from fastapi import HTTPException, status
+
+from app.adapters.base_adapter import BaseGatewayPlatformAdapter
+from app.core.config import Settings, get_settings
+from shared.models import Message, PlatformStatus, SearchResults, SendMessageRequest, ThreadDetail, UnreadCounts
+
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+class AdapterUnavailable(HTTPException):
+    def __init__(self, platform: str, reason: str):
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"{platform} adapter {reason}")
+
+
+def is_transient_failure(exc: BaseException) -> bool:
+    """Upstream faults that say something about the adapter's health (not caller errors)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, (httpx.TransportError, asyncio.TimeoutError))
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker over a sliding time window.
+
+    Closed: calls pass and outcomes are recorded. Once at least `min_calls`
+    outcomes in the last `window_seconds` exceed `failure_rate_threshold`, the
+    breaker opens and rejects calls for `open_seconds`. It then goes half-open
+    and lets `half_open_max_calls` probes through: a success closes it, a
+    failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        window_seconds: float,
+        min_calls: int,
+        failure_rate_threshold: float,
+        open_seconds: float,
+        half_open_max_calls: int,
+    ):
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.state = self.CLOSED
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._rejected = 0
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                self._rejected += 1
+                return False
+            self.state = self.HALF_OPEN
+            self._half_open_in_flight = 0
+        if self.state == self.HALF_OPEN:
+            if self._half_open_in_flight >= self.half_open_max_calls:
+                self._rejected += 1
+                return False
+            self._half_open_in_flight += 1
+        return True
+
+    def record(self, success: bool) -> None:
+        if self.state == self.HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+            if success:
+                self.state = self.CLOSED
+                self._outcomes.clear()
+            else:
+                self._open()
+            return
+
+        now = time.monotonic()
+        self._outcomes.append((now, success))
+        self._trim(now)
+        if self.state == self.CLOSED and self._should_trip():
+            self._open()
+
+    def abandon(self) -> None:
+        """Release an allowed call that never produced an outcome."""
+        if self.state == self.HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def snapshot(self) -> dict[str, Any]:
+        self._trim(time.monotonic())
+        calls = len(self._outcomes)
+        failures = sum(1 for _, success in self._outcomes if not success)
+        return {
+            "state": self.state,
+            "calls": calls,
+            "failure_rate": round(failures / calls, 4) if calls else 0.0,
+            "rejected": self._rejected,
+        }
+
+    def _should_trip(self) -> bool:
+        calls = len(self._outcomes)
+        if calls < self.min_calls:
+            return False
+        failures = sum(1 for _, success in self._outcomes if not success)
+        return failures / calls >= self.failure_rate_threshold
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+    def _trim(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+
+
+class RetryBudget:
+    """Token bucket that caps retries to a fraction of recent traffic."""
+
+    def __init__(self, ratio: float, max_tokens: float):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+
+    def deposit(self) -> None:
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class AdapterGuard:
+    """Breaker, bulkhead and retry budget shared by every request for one platform."""
+
+    def __init__(self, platform: str, config: Settings):
+        self.platform = platform
+        self.call_timeout_seconds = config.adapter_call_timeout_seconds
+        self.bulkhead_wait_seconds = config.adapter_bulkhead_wait_seconds
+        self.breaker = CircuitBreaker(
+            window_seconds=config.adapter_breaker_window_seconds,
+            min_calls=config.adapter_breaker_min_calls,
+            failure_rate_threshold=config.adapter_breaker_failure_rate,
+            open_seconds=config.adapter_breaker_open_seconds,
+            half_open_max_calls=config.adapter_breaker_half_open_calls,
+        )
+        self.bulkhead = asyncio.Semaphore(config.adapter_bulkhead_max_concurrent)
+        self.retry_budget = RetryBudget(config.adapter_retry_budget_ratio, config.adapter_retry_budget_max)
+        self._bulkhead_rejected = 0
+        self._retries = 0
+
+    async def call(self, operation: Callable[[], Awaitable[T]], idempotent: bool = False) -> T:
+        self.retry_budget.deposit()
+        try:
+            return await self._call_once(operation)
+        except Exception as exc:
+            if not (idempotent and is_transient_failure(exc) and self.retry_budget.try_spend()):
+                raise
+        self._retries += 1
+        return await self._call_once(operation)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            **self.breaker.snapshot(),
+            "bulkhead_rejected": self._bulkhead_rejected,
+            "retries": self._retries,
+        }
+
+    async def _call_once(self, operation: Callable[[], Awaitable[T]]) -> T:
+        if not self.breaker.allow():
+            raise AdapterUnavailable(self.platform, "circuit open")
+        try:
+            await asyncio.wait_for(self.bulkhead.acquire(), timeout=self.bulkhead_wait_seconds)
+        except asyncio.TimeoutError:
+            self._bulkhead_rejected += 1
+            # The upstream was never called, so this says nothing about its health.
+            self.breaker.abandon()
+            raise AdapterUnavailable(self.platform, "concurrency limit reached") from None
+        except asyncio.CancelledError:
+            self.breaker.abandon()
+            raise
+
+        try:
+            result = await asyncio.wait_for(operation(), timeout=self.call_timeout_seconds)
+        except Exception as exc:
+            self.breaker.record(not is_transient_failure(exc))
+            raise
+        except asyncio.CancelledError:
+            self.breaker.abandon()
+            raise
+        finally:
+            self.bulkhead.release()
+        self.breaker.record(True)
+        return result
+
+
+class AdapterGuards:
+    def __init__(self, config: Settings):
+        self.config = config
+        self._guards: dict[str, AdapterGuard] = {}
+
+    def get(self, platform: str) -> AdapterGuard:
+        guard = self._guards.get(platform)
+        if guard is None:
+            guard = AdapterGuard(platform, self.config)
+            self._guards[platform] = guard
+        return guard
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {platform: guard.snapshot() for platform, guard in self._guards.items()}
+
+
+adapter_guards = AdapterGuards(settings)
+
+
+class ResilientAdapter(BaseGatewayPlatformAdapter):
+    """Routes every call of the wrapped adapter through its platform's AdapterGuard."""
+
+    def __init__(self, adapter: BaseGatewayPlatformAdapter, guard: AdapterGuard):
+        self.adapter = adapter
+        self.guard = guard
+        self.platform = adapter.platform
+
+    async def get_unread_messages(
+        self,
+        token: str,
+        limit: int,
+        before: datetime | None = None,
+        cursor: str | None = None,
+    ) -> list[Message]:
+        return await self.guard.call(
+            lambda: self.adapter.get_unread_messages(token=token, limit=limit, before=before, cursor=cursor),
+            idempotent=True,
+        )
+
+    async def send_reply(self, token: str, message_id: str, content: str) -> Message:
+        return await self.guard.call(
+            lambda: self.adapter.send_reply(token=token, message_id=message_id, content=content)
+        )
+
+    async def send_message(self, token: str, payload: SendMessageRequest) -> Message:
+        return await self.guard.call(lambda: self.adapter.send_message(token=token, payload=payload))
+
+    async def mark_as_read(self, token: str, message_id: str) -> Message:
+        return await self.guard.call(
+            lambda: self.adapter.mark_as_read(token=token, message_id=message_id),
+            idempotent=True,
+        )
+
+    async def mark_many_as_read(self, token: str, message_ids: list[str]) -> list[Message]:
+        return await self.guard.call(
+            lambda: self.adapter.mark_many_as_read(token=token, message_ids=message_ids),
+            idempotent=True,
+        )
+
+    async def get_platforms(self, token: str) -> list[PlatformStatus]:
+        return await self.guard.call(lambda: self.adapter.get_platforms(token=token), idempotent=True)
+
+    async def probe(self) -> list[PlatformStatus]:
+        return await self.guard.call(self.adapter.probe, idempotent=True)
+
+    async def search_messages(
+        self,
+        token: str,
+        query: str,
+        limit: int = 20,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        unread_only: bool = False,
+        participant: str | None = None,
+    ) -> SearchResults:
+        return await self.guard.call(
+            lambda: self.adapter.search_messages(
+                token=token,
+                query=query,
+                limit=limit,
+                cursor=cursor,
+                since=since,
+                until=until,
+                unread_only=unread_only,
+                participant=participant,
+            ),
+            idempotent=True,
+        )
+
+    def export_messages(
+        self,
+        token: str,
+        unread_only: bool = False,
+        thread_id: str | None = None,
+        since: datetime | None = None,
+    ) -> AsyncIterator[bytes]:
+        # An export can legitimately outlive the per-call timeout, so it only has to get past the breaker.
+        if not self.guard.breaker.allow():
+            raise AdapterUnavailable(self.platform, "circuit open")
+        self.guard.breaker.abandon()
+        return self.adapter.export_messages(token=token, unread_only=unread_only, thread_id=thread_id, since=since)
+
+    async def get_thread(
+        self,
+        token: str,
+        thread_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> ThreadDetail:
+        return await self.guard.call(
+            lambda: self.adapter.get_thread(token=token, thread_id=thread_id, limit=limit, cursor=cursor),
+            idempotent=True,
+        )
+
+    async def get_unread_counts(self, token: str) -> UnreadCounts:
+        return await self.guard.call(lambda: self.adapter.get_unread_counts(token=token), idempotent=True)
@@ -1,13 +1,30 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+
 from fastapi import HTTPException, status
 
 from app.adapters.base_adapter import BaseGatewayPlatformAdapter
-from shared.models import Message, Platform, PlatformStatus, SendMessageRequest, ThreadDetail
+from shared.models import (
+    Message,
+    Platform,
+    PlatformStatus,
+    SearchResults,
+    SendMessageRequest,
+    ThreadDetail,
+    UnreadCounts,
+)
 
 
 class SlackGatewayAdapter(BaseGatewayPlatformAdapter):
     platform = "slack"
 
-    async def get_unread_messages(self, token: str, limit: int) -> list[Message]:
+    async def get_unread_messages(
+        self,
+        token: str,
+        limit: int,
+        before: datetime | None = None,
+        cursor: str | None = None,
+    ) -> list[Message]:
         return []
 
     async def send_reply(self, token: str, message_id: str, content: str) -> Message:
@@ -28,6 +45,12 @@ class SlackGatewayAdapter(BaseGatewayPlatformAdapter):
             detail="Slack adapter is a stub in v1 MVP.",
         )
 
+    async def mark_many_as_read(self, token: str, message_ids: list[str]) -> list[Message]:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Slack adapter is a stub in v1 MVP.",
+        )
+
     async def get_platforms(self, token: str) -> list[PlatformStatus]:
         return [
             PlatformStatus(
@@ -38,8 +61,45 @@ class SlackGatewayAdapter(BaseGatewayPlatformAdapter):
             )
         ]
 
-    async def get_thread(self, token: str, thread_id: str) -> ThreadDetail:
+    async def probe(self) -> list[PlatformStatus]:
+        return await self.get_platforms(token="")
+
+    async def search_messages(
+        self,
+        token: str,
+        query: str,
+        limit: int = 20,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        unread_only: bool = False,
+        participant: str | None = None,
+    ) -> SearchResults:
+        return SearchResults()
+
+    def export_messages(
+        self,
+        token: str,
+        unread_only: bool = False,
+        thread_id: str | None = None,
+        since: datetime | None = None,
+    ) -> AsyncIterator[bytes]:
         raise HTTPException(
             status_code=status.HTTP_501_NOT_IMPLEMENTED,
             detail="Slack adapter is a stub in v1 MVP.",
         )
+
+    async def get_thread(
+        self,
+        token: str,
+        thread_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> ThreadDetail:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Slack adapter is a stub in v1 MVP.",
+        )
+
+    async def get_unread_counts(self, token: str) -> UnreadCounts:
+        return UnreadCounts(platform=Platform.SLACK)
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -11,6 +12,77 @@ class Settings(BaseSettings):
     whatsapp_adapter_url: str = "http://localhost:8004"
     redis_url: str = "redis://localhost:6379/0"
     mcp_sse_heartbeat_seconds: int = 5
+    mcp_sse_buffer_size: int = 64
+    mcp_sse_unread_resync_seconds: float = 60.0
+    message_events_stream: str = "message_events"
+    mcp_batch_max_size: int = 50
+    mcp_batch_concurrency: int = 8
+
+    adapter_timeout_seconds: float = 3.0
+    adapter_hedge_enabled: bool = False
+    adapter_hedge_min_delay_seconds: float = 0.05
+    adapter_hedge_min_samples: int = 20
+    adapter_latency_window: int = 200
+    search_deadline_seconds: float = 2.0
+    priority_recency_half_life_hours: float = 24.0
+    priority_important_senders: list[str] = []
+    summary_max_sentences: int = 3
+    summary_max_threads: int = 5
+    summary_unread_scan_limit: int = 25
+    summary_sentence_cache_max_messages: int = 5000
+    summary_jobs_stream: str = "summary_jobs"
+    summary_jobs_stream_maxlen: int = 10000
+    summary_jobs_group: str = "summary-workers"
+    summary_job_ttl_seconds: int = 3600
+    summary_worker_processes: int = 2
+    summary_worker_batch_size: int = 8
+    summary_worker_block_ms: int = 5000
+    summary_worker_claim_idle_ms: int = 60000
+    platform_probe_interval_seconds: float = 15.0
+    platform_probe_jitter: float = 0.2
+
+    adapter_call_timeout_seconds: float = 10.0
+    adapter_bulkhead_max_concurrent: int = 32
+    adapter_bulkhead_wait_seconds: float = 0.5
+    adapter_breaker_window_seconds: float = 30.0
+    adapter_breaker_min_calls: int = 10
+    adapter_breaker_failure_rate: float = 0.5
+    adapter_breaker_open_seconds: float = 15.0
+    adapter_breaker_half_open_calls: int = 1
+    adapter_retry_budget_ratio: float = 0.1
+    adapter_retry_budget_max: float = 10.0
+
+    tool_cache_fresh_ttl_seconds: float = 10.0
+    tool_cache_stale_ttl_seconds: float = 50.0
+    tool_cache_stale_if_error_seconds: float = 300.0
+
+    upstream_etag_cache_max_entries: int = 2000
+
+    tool_log_queue_size: int = 10000
+    tool_log_batch_size: int = 200
+    tool_log_flush_interval_seconds: float = 0.5
+    tool_log_overflow_policy: Literal["drop", "spill"] = "drop"
+    tool_log_spill_path: str = "/tmp/mcp-gateway-tool-calls.spill.jsonl"
+    tool_log_replay_interval_seconds: float = 30.0
+    tool_log_shutdown_timeout_seconds: float = 5.0
+
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    http_connect_timeout_seconds: float = 5.0
+    http2_enabled: bool = False
+    auth_service_timeout_seconds: float = 10.0
+    email_adapter_timeout_seconds: float = 20.0
+
+    auth_local_verification: bool = True
+    auth_jwt_issuer: str = "auth-service"
+    auth_jwt_algorithms: list[str] = ["RS256"]
+    auth_jwks_refresh_seconds: float = 300.0
+    auth_jwks_min_refresh_seconds: float = 30.0
+
+    introspection_cache_max_entries: int = 10000
+    introspection_cache_ttl_seconds: float = 300.0
+    introspection_cache_negative_ttl_seconds: float = 5.0
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
@@ -0,0 +1,56 @@
+from collections import OrderedDict
+from typing import Any
+
+from fastapi import Response, status
+from pydantic import BaseModel
+
+from app.core.config import get_settings
+from shared.etag import etag_for_bytes, etag_matches
+
+
+settings = get_settings()
+
+
+def conditional_response(model: BaseModel, if_none_match: str | None, include: set[str] | None = None) -> Response:
+    """
+    Serialize `model` with an ETag, or answer 304 when the client already has it.
+
+    `include` limits which fields feed the tag, so per-request diagnostics such
+    as latencies do not defeat revalidation.
+    """
+    body = model.model_dump_json()
+    tagged = model.model_dump_json(include=include).encode("utf-8") if include else body.encode("utf-8")
+    etag = etag_for_bytes(tagged)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+class ConditionalGetCache:
+    """LRU of upstream (ETag, body) pairs so repeat GETs can be revalidated with If-None-Match."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[Any, ...], tuple[str, Any]] = OrderedDict()
+        self._counters = {"revalidated": 0, "refetched": 0}
+
+    def get(self, key: tuple[Any, ...]) -> tuple[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: tuple[Any, ...], etag: str, body: Any) -> None:
+        self._entries[key] = (etag, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def record(self, revalidated: bool) -> None:
+        self._counters["revalidated" if revalidated else "refetched"] += 1
+
+    def stats(self) -> dict[str, int]:
+        return {**self._counters, "size": len(self._entries)}
+
+
+upstream_etags = ConditionalGetCache(max_entries=settings.upstream_etag_cache_max_entries)
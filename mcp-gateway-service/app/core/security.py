@@ -1,31 +1,43 @@
 from typing import Any
 
-import httpx
 from fastapi import HTTPException, status
 
 from app.core.config import get_settings
+from app.core.http_client import http_clients
+from app.core.jwks import LocalVerificationUnavailable, verify_token_locally
+from app.core.token_cache import introspection_cache
 from shared.models import AuthenticatedUser, Role
 
 
 settings = get_settings()
 
 
-async def introspect_bearer_token(token: str) -> AuthenticatedUser:
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.post(
-            f"{settings.auth_service_url}/auth/introspect",
-            json={"token": token},
-        )
+async def _introspect_remote(token: str) -> AuthenticatedUser | None:
+    client = http_clients.get("auth")
+    response = await client.post("/auth/introspect", json={"token": token})
 
     if response.status_code >= 400:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token introspection failed")
 
     payload: dict[str, Any] = response.json()
     if not payload.get("active"):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive token")
+        return None
 
     return AuthenticatedUser(
         user_id=payload["user_id"],
         email=payload["email"],
         role=Role(payload["role"]),
     )
+
+
+async def _verify_token(token: str) -> AuthenticatedUser | None:
+    if settings.auth_local_verification:
+        try:
+            return await verify_token_locally(token)
+        except LocalVerificationUnavailable:
+            pass
+    return await _introspect_remote(token)
+
+
+async def introspect_bearer_token(token: str) -> AuthenticatedUser:
+    return await introspection_cache.get_or_load(token, _verify_token)
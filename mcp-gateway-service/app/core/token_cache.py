@@ -0,0 +1,142 @@
+import asyncio
+import base64
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from fastapi import HTTPException, status
+
+from app.core.config import get_settings
+from shared.models import AuthenticatedUser
+
+
+settings = get_settings()
+
+
+@dataclass
+class _CacheEntry:
+    user: AuthenticatedUser | None
+    expires_at: float
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _token_expiry(token: str) -> float | None:
+    """Read the unverified `exp` claim so cached entries never outlive the token."""
+    try:
+        segment = token.split(".")[1]
+        padded = segment + "=" * (-len(segment) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(padded))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class IntrospectionCache:
+    """
+    In-process LRU cache of token introspection results keyed by token hash.
+
+    Positive entries live until the JWT `exp` (capped by `max_ttl_seconds`),
+    inactive tokens are cached for `negative_ttl_seconds`, and concurrent
+    lookups of the same token share a single upstream call.
+    """
+
+    def __init__(self, max_entries: int, max_ttl_seconds: float, negative_ttl_seconds: float):
+        self.max_entries = max_entries
+        self.max_ttl_seconds = max_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._counters = {
+            "hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0,
+        }
+
+    async def get_or_load(
+        self,
+        token: str,
+        loader: Callable[[str], Awaitable[AuthenticatedUser | None]],
+    ) -> AuthenticatedUser:
+        key = _token_key(token)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                if entry.user is None:
+                    self._counters["negative_hits"] += 1
+                    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive token")
+                self._counters["hits"] += 1
+                return entry.user
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self._counters["misses"] += 1
+            task = asyncio.ensure_future(self._load(key, token, loader))
+            self._inflight[key] = task
+        else:
+            self._counters["coalesced"] += 1
+
+        user = await asyncio.shield(task)
+        if user is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive token")
+        return user
+
+    async def _load(
+        self,
+        key: str,
+        token: str,
+        loader: Callable[[str], Awaitable[AuthenticatedUser | None]],
+    ) -> AuthenticatedUser | None:
+        try:
+            user = await loader(token)
+            self._store(key, token, user)
+            return user
+        finally:
+            self._inflight.pop(key, None)
+
+    def _store(self, key: str, token: str, user: AuthenticatedUser | None) -> None:
+        now = time.monotonic()
+        if user is None:
+            ttl = self.negative_ttl_seconds
+        else:
+            ttl = self.max_ttl_seconds
+            exp = _token_expiry(token)
+            if exp is not None:
+                ttl = min(ttl, exp - time.time())
+        if ttl <= 0:
+            return
+
+        self._entries[key] = _CacheEntry(user=user, expires_at=now + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def invalidate(self, token: str) -> None:
+        self._entries.pop(_token_key(token), None)
+
+    def stats(self) -> dict[str, float | int]:
+        lookups = self._counters["hits"] + self._counters["negative_hits"] + self._counters["misses"]
+        hit_count = self._counters["hits"] + self._counters["negative_hits"]
+        return {
+            **self._counters,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hit_ratio": round(hit_count / lookups, 4) if lookups else 0.0,
+        }
+
+
+introspection_cache = IntrospectionCache(
+    max_entries=settings.introspection_cache_max_entries,
+    max_ttl_seconds=settings.introspection_cache_ttl_seconds,
+    negative_ttl_seconds=settings.introspection_cache_negative_ttl_seconds,
+)
@@ -3,16 +3,37 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.adapters.resilience import adapter_guards
+from app.core.config import get_settings
 from app.core.database import redis_client
+from app.core.etag import upstream_etags
+from app.core.http_client import http_clients
+from app.core.jwks import jwks_key_set
 from app.core.middleware import RequestLoggingMiddleware
+from app.core.token_cache import introspection_cache
 from app.routers.mcp_router import router as mcp_router
 from app.routers.rest_router import router as rest_router
+from app.services.fanout import adapter_fanout
 from app.services.fastmcp_service import FastMCPRegistry
+from app.services.platform_prober import platform_prober
+from app.services.sse_hub import sse_hub
+from app.services.summary_jobs import summary_jobs
+from app.services.tool_cache import tool_cache
+from app.services.tool_call_logger import tool_call_logger
+
+
+settings = get_settings()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await redis_client.ping()
+    await http_clients.start()
+    await tool_call_logger.start()
+    if settings.auth_local_verification:
+        await jwks_key_set.start()
+    await platform_prober.start()
+    await sse_hub.start()
     registry = FastMCPRegistry(redis_provider=lambda: redis_client)
     app.state.fastmcp_registry = registry
 
@@ -22,6 +43,11 @@ async def lifespan(app: FastAPI):
         elif hasattr(registry.server, "streamable_http_app"):
             app.mount("/mcp/fastmcp", registry.server.streamable_http_app())
     yield
+    await sse_hub.stop()
+    await platform_prober.stop()
+    await tool_call_logger.stop(timeout_seconds=settings.tool_log_shutdown_timeout_seconds)
+    await jwks_key_set.stop()
+    await http_clients.aclose()
     await redis_client.aclose()
 
 
@@ -48,3 +74,17 @@ app.include_router(mcp_router)
 @app.get("/health", tags=["health"])
 async def health() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@app.get("/metrics", tags=["health"])
+async def metrics() -> dict[str, dict]:
+    return {
+        "introspection_cache": introspection_cache.stats(),
+        "sse_hub": sse_hub.stats(),
+        "tool_call_log": tool_call_logger.stats(),
+        "adapter_fanout": adapter_fanout.stats(),
+        "adapter_guards": adapter_guards.snapshot(),
+        "tool_cache": tool_cache.stats(),
+        "upstream_etags": upstream_etags.stats(),
+        "thread_summaries": summary_jobs.stats(),
+    }
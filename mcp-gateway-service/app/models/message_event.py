@@ -0,0 +1,35 @@
+import json
+from dataclasses import dataclass, field
+
+
+@dataclass
+class MessageChangeEvent:
+    event_type: str
+    user_id: str
+    platform: str
+    unread_count: int
+    message_ids: list[str] = field(default_factory=list)
+    thread_ids: list[str] = field(default_factory=list)
+    occurred_at: str | None = None
+
+    @classmethod
+    def from_stream(cls, data: dict[str, str]) -> "MessageChangeEvent":
+        return cls(
+            event_type=data.get("type", "unknown"),
+            user_id=data["user_id"],
+            platform=data.get("platform", "email"),
+            unread_count=int(data.get("unread_count", 0)),
+            message_ids=json.loads(data.get("message_ids", "[]")),
+            thread_ids=json.loads(data.get("thread_ids", "[]")),
+            occurred_at=data.get("occurred_at"),
+        )
+
+    def to_delta(self) -> dict:
+        return {
+            "type": self.event_type,
+            "platform": self.platform,
+            "unread_count": self.unread_count,
+            "message_ids": self.message_ids,
+            "thread_ids": self.thread_ids,
+            "occurred_at": self.occurred_at,
+        }
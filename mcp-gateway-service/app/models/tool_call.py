@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
 
@@ -6,4 +6,13 @@ from datetime import UTC, datetime
 class ToolCallLog:
     tool_name: str
     user_id: str
-    created_at: datetime = datetime.now(UTC)
+    status: str = "success"
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    def to_stream_fields(self) -> dict[str, str]:
+        return {
+            "tool_name": self.tool_name,
+            "user_id": self.user_id,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+        }
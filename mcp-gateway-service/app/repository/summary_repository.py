@@ -0,0 +1,152 @@
+import json
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+
+# KEYS: job status hash, jobs stream. ARGV: job TTL, stream maxlen, then field/value pairs for the stream entry;
+# all but the last pair (the thread JSON) are also copied onto the status hash.
+# Claiming the job, setting its TTL and adding the stream entry happen together, so a failure can never leave a
+# `queued` status with no TTL and no entry for the worker to pick up.
+ENQUEUE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+  return 0
+end
+redis.call('HSET', KEYS[1], 'status', 'queued', unpack(ARGV, 3, #ARGV - 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[2], '*', unpack(ARGV, 3))
+return 1
+"""
+
+# KEYS: thread summaries hash, job status hash, jobs stream. ARGV: summary field, version field, thread version,
+# summary JSON, job TTL, consumer group, entry id.
+# Jobs for different versions of a thread can finish in any order, so a summary is only written when it is at
+# least as new as the stored one. The job is acknowledged either way.
+COMPLETE_SCRIPT = """
+local stored = tonumber(redis.call('HGET', KEYS[1], ARGV[2]))
+local written = 0
+if not stored or stored <= tonumber(ARGV[3]) then
+  redis.call('HSET', KEYS[1], ARGV[1], ARGV[4], ARGV[2], ARGV[3])
+  written = 1
+end
+redis.call('HSET', KEYS[2], 'status', 'done')
+redis.call('EXPIRE', KEYS[2], ARGV[5])
+redis.call('XACK', KEYS[3], ARGV[6], ARGV[7])
+redis.call('XDEL', KEYS[3], ARGV[7])
+return written
+"""
+
+
+class SummaryRepository:
+    """
+    Redis storage for the summarization pipeline.
+
+    Jobs are entries on a stream read through a consumer group; each job also
+    has a status hash (`summary_job:{job_id}`) that expires after `job_ttl_seconds`.
+    Finished summaries live in one hash per thread (`thread_summaries:{platform}:{thread_id}`,
+    one field per sentence limit, plus `{limit}:version` holding the thread's
+    `updated_at` timestamp) with no expiry, so they survive restarts. A newer
+    summary overwrites the older one; an older one arriving late is dropped.
+    """
+
+    def __init__(self, redis: Redis, stream: str, group: str, stream_maxlen: int, job_ttl_seconds: int):
+        self.redis = redis
+        self.stream = stream
+        self.group = group
+        self.stream_maxlen = stream_maxlen
+        self.job_ttl_seconds = job_ttl_seconds
+        self._enqueue = redis.register_script(ENQUEUE_SCRIPT)
+        self._complete = redis.register_script(COMPLETE_SCRIPT)
+
+    @staticmethod
+    def summary_key(platform: str, thread_id: str) -> str:
+        return f"thread_summaries:{platform}:{thread_id}"
+
+    @staticmethod
+    def job_key(job_id: str) -> str:
+        return f"summary_job:{job_id}"
+
+    async def get_summaries(self, items: list[tuple[str, str, int]]) -> list[dict[str, Any] | None]:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for platform, thread_id, max_sentences in items:
+                pipe.hget(self.summary_key(platform, thread_id), str(max_sentences))
+            raw = await pipe.execute()
+        return [json.loads(value) if value else None for value in raw]
+
+    async def get_job(self, job_id: str) -> dict[str, str]:
+        return await self.redis.hgetall(self.job_key(job_id))
+
+    async def enqueue(
+        self,
+        job_id: str,
+        platform: str,
+        thread_id: str,
+        max_sentences: int,
+        version: float,
+        thread_json: str,
+    ) -> bool:
+        """Add a job unless one with the same id is already queued, running or recently failed."""
+        fields = {
+            "job_id": job_id,
+            "platform": platform,
+            "thread_id": thread_id,
+            "max_sentences": str(max_sentences),
+            "version": repr(version),
+        }
+        args: list[str | int] = [self.job_ttl_seconds, self.stream_maxlen]
+        for name, value in [*fields.items(), ("thread", thread_json)]:
+            args.extend((name, value))
+        return bool(await self._enqueue(keys=[self.job_key(job_id), self.stream], args=args))
+
+    async def ensure_group(self) -> None:
+        try:
+            await self.redis.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    async def read_jobs(self, consumer: str, count: int, block_ms: int) -> list[tuple[str, dict[str, str]]]:
+        response = await self.redis.xreadgroup(self.group, consumer, {self.stream: ">"}, count=count, block=block_ms)
+        return [entry for _, entries in response or [] for entry in entries]
+
+    async def claim_stale(self, consumer: str, min_idle_ms: int, count: int) -> list[tuple[str, dict[str, str]]]:
+        """Take over jobs delivered to a consumer that died before acknowledging them."""
+        response = await self.redis.xautoclaim(self.stream, self.group, consumer, min_idle_ms, count=count)
+        return [(entry_id, fields) for entry_id, fields in response[1] if fields]
+
+    async def mark_running(self, job_id: str, consumer: str) -> None:
+        await self.redis.hset(self.job_key(job_id), mapping={"status": "running", "consumer": consumer})
+
+    async def complete(
+        self,
+        entry_id: str,
+        job_id: str,
+        platform: str,
+        max_sentences: int,
+        version: float,
+        summary: dict[str, Any],
+    ) -> bool:
+        """Store the summary unless a newer thread version's is already stored, and acknowledge the job."""
+        written = await self._complete(
+            keys=[self.summary_key(platform, summary["thread_id"]), self.job_key(job_id), self.stream],
+            args=[
+                str(max_sentences),
+                f"{max_sentences}:version",
+                repr(version),
+                json.dumps(summary, separators=(",", ":")),
+                self.job_ttl_seconds,
+                self.group,
+                entry_id,
+            ],
+        )
+        return bool(written)
+
+    async def fail(self, entry_id: str, job_id: str | None, error: str) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if job_id:
+                pipe.hset(self.job_key(job_id), mapping={"status": "failed", "error": error})
+                pipe.expire(self.job_key(job_id), self.job_ttl_seconds)
+            pipe.xack(self.stream, self.group, entry_id)
+            pipe.xdel(self.stream, entry_id)
+            await pipe.execute()
@@ -1,18 +1,14 @@
 from redis.asyncio import Redis
 
+from app.models.tool_call import ToolCallLog
+
 
 class ToolCallRepository:
     def __init__(self, redis: Redis):
         self.redis = redis
 
-    async def log_tool_call(self, tool_name: str, user_id: str, status: str) -> None:
-        await self.redis.xadd(
-            "tool_calls",
-            {
-                "tool_name": tool_name,
-                "user_id": user_id,
-                "status": status,
-            },
-            maxlen=5000,
-            approximate=True,
-        )
+    async def log_many(self, entries: list[ToolCallLog]) -> None:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for entry in entries:
+                pipe.xadd("tool_calls", entry.to_stream_fields(), maxlen=5000, approximate=True)
+            await pipe.execute()
@@ -1,15 +1,19 @@
 import asyncio
 import json
+from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, Header, HTTPException, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
 from redis.asyncio import Redis
 
 from app.core.config import get_settings
 from app.core.database import get_redis
 from app.core.security import introspect_bearer_token
 from app.services.mcp_service import MCPService
+from app.services.priority_scoring import CRITERIA_PRESETS, FEATURES
+from app.services.sse_hub import format_sse, sse_hub
 from shared.jsonrpc import JsonRpcError, JsonRpcRequest, JsonRpcResponse
 from shared.models import SendMessageRequest
 
@@ -27,6 +31,28 @@ TOOL_DEFINITIONS = [
             "properties": {
                 "platform": {"type": "string", "default": "all"},
                 "limit": {"type": "integer", "minimum": 1, "maximum": 100, "default": 50},
+                "before": {
+                    "type": "string",
+                    "format": "date-time",
+                    "description": "Return messages sent strictly before this time (the previous page's next_before).",
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": "Opaque cursor from the previous page's next_cursor; stable when timestamps tie.",
+                },
+            },
+        },
+    },
+    {
+        "name": "get_unread_counts",
+        "description": (
+            "Unread totals per platform and per thread, read from incrementally maintained counters. "
+            "Cheap enough to poll for badges."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "platform": {"type": "string", "default": "all"},
             },
         },
     },
@@ -77,36 +103,60 @@ TOOL_DEFINITIONS = [
     },
     {
         "name": "prioritize_messages",
-        "description": "Sort messages by urgency/importance criteria.",
+        "description": (
+            "Rank messages by a weighted score over urgency, recency, sender importance, thread unread depth and "
+            "direction. Returns each message's score and per-feature breakdown."
+        ),
         "inputSchema": {
             "type": "object",
             "required": ["messages"],
             "properties": {
                 "messages": {"type": "array", "items": {"type": "object"}},
-                "criteria": {"type": "string", "default": "urgency"},
+                "criteria": {
+                    "type": "string",
+                    "enum": list(CRITERIA_PRESETS),
+                    "default": "urgency",
+                },
+                "weights": {
+                    "type": "object",
+                    "description": "Per-feature weight overrides applied on top of the criteria preset.",
+                    "properties": {feature: {"type": "number", "minimum": 0} for feature in FEATURES},
+                    "additionalProperties": False,
+                },
             },
         },
     },
     {
         "name": "summarize_threads",
-        "description": "Phase 2 placeholder for thread summarization.",
+        "description": (
+            "Extractive summary of a thread (the most central sentences, in thread order). Without thread_id, "
+            "summarizes the threads behind the newest unread messages. Summaries are computed in the background: "
+            "entries not yet ready carry a job status and, when available, the previous summary marked stale."
+        ),
         "inputSchema": {
             "type": "object",
             "properties": {
                 "thread_id": {"type": "string"},
                 "platform": {"type": "string", "default": "email"},
+                "max_sentences": {"type": "integer", "minimum": 1, "maximum": 20},
             },
         },
     },
     {
         "name": "search_messages",
-        "description": "Phase 3 placeholder for cross-platform search.",
+        "description": "Full-text search over message bodies, subjects and senders, ranked by relevance.",
         "inputSchema": {
             "type": "object",
             "required": ["query"],
             "properties": {
-                "query": {"type": "string"},
+                "query": {"type": "string", "description": "Web-search syntax: quoted phrases, OR, -exclude."},
                 "platform": {"type": "string", "default": "all"},
+                "limit": {"type": "integer", "minimum": 1, "maximum": 100, "default": 20},
+                "cursor": {"type": "string", "description": "next_cursor of the previous page (single platform)."},
+                "since": {"type": "string", "format": "date-time"},
+                "until": {"type": "string", "format": "date-time"},
+                "unread_only": {"type": "boolean", "default": False},
+                "participant": {"type": "string", "description": "Only messages from or to this exact address."},
             },
         },
     },
@@ -142,6 +192,14 @@ async def _dispatch_tool(
             user_id=user_id,
             platform=str(args.get("platform", "all")),
             limit=int(args.get("limit", 50)),
+            before=datetime.fromisoformat(args["before"]) if args.get("before") else None,
+            cursor=str(args["cursor"]) if args.get("cursor") else None,
+        )
+    if tool_name == "get_unread_counts":
+        return await service.get_unread_counts(
+            token=token,
+            user_id=user_id,
+            platform=str(args.get("platform", "all")),
         )
     if tool_name == "send_reply":
         return await service.send_reply(
@@ -183,28 +241,72 @@ async def _dispatch_tool(
             user_id=user_id,
             messages=[item for item in messages if isinstance(item, dict)],
             criteria=str(args.get("criteria", "urgency")),
+            weights={str(key): float(value) for key, value in (args.get("weights") or {}).items()},
         )
     if tool_name == "summarize_threads":
         return await service.summarize_threads(
+            token=token,
             user_id=user_id,
             platform=str(args.get("platform", "email")),
             thread_id=args.get("thread_id"),
+            max_sentences=int(args["max_sentences"]) if args.get("max_sentences") else None,
         )
     if tool_name == "search_messages":
         return await service.search_messages(
+            token=token,
             user_id=user_id,
             platform=str(args.get("platform", "all")),
-            query=str(args.get("query", "")),
+            cursor=str(args["cursor"]) if args.get("cursor") else None,
+            **_search_arguments(args),
         )
     raise ValueError(f"Unknown tool: {tool_name}")
 
 
-@router.post("")
-async def mcp_jsonrpc(
-    request: JsonRpcRequest,
-    redis: Redis = Depends(get_redis),
-    authorization: str | None = Header(default=None),
-) -> JsonRpcResponse:
+def _search_arguments(args: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "query": str(args.get("query", "")),
+        "limit": int(args.get("limit", 20)),
+        "since": datetime.fromisoformat(args["since"]) if args.get("since") else None,
+        "until": datetime.fromisoformat(args["until"]) if args.get("until") else None,
+        "unread_only": bool(args.get("unread_only", False)),
+        "participant": str(args["participant"]) if args.get("participant") else None,
+    }
+
+
+PUBLIC_METHODS = {"initialize", "tools/list", "ping"}
+
+
+class _BatchAuth:
+    """Resolves the caller once and shares the outcome across every call in a batch."""
+
+    def __init__(self, authorization: str | None):
+        self.authorization = authorization
+        self._task: asyncio.Task | None = None
+
+    async def resolve(self) -> tuple[str, str] | None:
+        if self._task is None:
+            self._task = asyncio.ensure_future(_resolve_user(self.authorization))
+        try:
+            return await asyncio.shield(self._task)
+        except HTTPException:
+            return None
+
+
+async def _handle_call(raw: Any, auth: _BatchAuth, service: MCPService) -> JsonRpcResponse | None:
+    raw_id = raw.get("id") if isinstance(raw, dict) else None
+    if not isinstance(raw_id, str | int) or isinstance(raw_id, bool):
+        raw_id = None
+    try:
+        request = JsonRpcRequest.model_validate(raw)
+    except ValidationError:
+        return _fail(raw_id, -32600, "Invalid Request")
+
+    is_notification = "id" not in raw
+    response = await _execute(request, auth, service)
+    return None if is_notification else response
+
+
+async def _execute(request: JsonRpcRequest, auth: _BatchAuth, service: MCPService) -> JsonRpcResponse:
     if request.jsonrpc != "2.0":
         return _fail(request.id, -32600, "Invalid Request")
 
@@ -224,12 +326,11 @@ async def mcp_jsonrpc(
     if request.method == "ping":
         return _ok(request.id, {"status": "pong"})
 
-    try:
-        token, user_id = await _resolve_user(authorization)
-    except HTTPException:
+    resolved = await auth.resolve()
+    if resolved is None:
         return _fail(request.id, -32001, "Unauthorized")
+    token, user_id = resolved
 
-    service = MCPService(redis)
     try:
         if request.method == "tools/call":
             tool_name = str(request.params.get("name", ""))
@@ -249,8 +350,114 @@ async def mcp_jsonrpc(
     return _ok(request.id, result)
 
 
-@router.get("/sse")
-async def mcp_sse(
+def _jsonrpc_response(payload: JsonRpcResponse | list[JsonRpcResponse] | None) -> Response:
+    if payload is None:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    if isinstance(payload, list):
+        return JSONResponse([item.model_dump(mode="json") for item in payload])
+    return JSONResponse(payload.model_dump(mode="json"))
+
+
+@router.post("")
+async def mcp_jsonrpc(
+    request: Request,
+    redis: Redis = Depends(get_redis),
+    authorization: str | None = Header(default=None),
+) -> Response:
+    try:
+        body = json.loads(await request.body())
+    except ValueError:
+        return _jsonrpc_response(_fail(None, -32700, "Parse error"))
+
+    auth = _BatchAuth(authorization)
+    service = MCPService(redis)
+
+    if not isinstance(body, list):
+        if _wants_streamed_search(request, body):
+            return await _stream_search_call(body, auth, service)
+        return _jsonrpc_response(await _handle_call(body, auth, service))
+
+    if not body:
+        return _jsonrpc_response(_fail(None, -32600, "Invalid Request"))
+    if len(body) > settings.mcp_batch_max_size:
+        return _jsonrpc_response(
+            _fail(None, -32600, "Invalid Request", {"batch": f"At most {settings.mcp_batch_max_size} calls"})
+        )
+
+    semaphore = asyncio.Semaphore(settings.mcp_batch_concurrency)
+
+    async def run(raw: Any) -> JsonRpcResponse | None:
+        async with semaphore:
+            return await _handle_call(raw, auth, service)
+
+    results = await asyncio.gather(*[run(raw) for raw in body])
+    responses = [item for item in results if item is not None]
+    return _jsonrpc_response(responses or None)
+
+
+def _wants_streamed_search(request: Request, body: Any) -> bool:
+    """A federated search call whose client accepts SSE and asked for progress gets results as adapters answer."""
+    if "text/event-stream" not in request.headers.get("accept", "") or not isinstance(body, dict) or "id" not in body:
+        return False
+    params = body.get("params")
+    if body.get("method") != "tools/call" or not isinstance(params, dict) or params.get("name") != "search_messages":
+        return False
+    args = params.get("arguments") or {}
+    meta = params.get("_meta") or {}
+    return (
+        isinstance(args, dict)
+        and args.get("platform", "all") == "all"
+        and isinstance(meta, dict)
+        and "progressToken" in meta
+    )
+
+
+async def _stream_search_call(body: dict[str, Any], auth: _BatchAuth, service: MCPService) -> Response:
+    try:
+        request = JsonRpcRequest.model_validate(body)
+        search_args = _search_arguments(request.params.get("arguments") or {})
+    except (ValidationError, ValueError, TypeError):
+        return _jsonrpc_response(_fail(body.get("id"), -32602, "Invalid params"))
+    resolved = await auth.resolve()
+    if resolved is None:
+        return _jsonrpc_response(_fail(request.id, -32001, "Unauthorized"))
+    token, user_id = resolved
+    progress_token = request.params["_meta"]["progressToken"]
+
+    async def event_stream():
+        try:
+            async for event in service.stream_search_messages(token=token, user_id=user_id, **search_args):
+                if event["event"] == "search_results":
+                    message: dict[str, Any] = {
+                        "jsonrpc": "2.0",
+                        "method": "notifications/progress",
+                        "params": {
+                            "progressToken": progress_token,
+                            "progress": event["completed"],
+                            "total": event["total"],
+                            "message": f"{event['platform']}: {event['status']}",
+                            "partialResult": {key: event[key] for key in ("platform", "status", "hits")},
+                        },
+                    }
+                else:
+                    result = {key: value for key, value in event.items() if key != "event"}
+                    message = _ok(request.id, result).model_dump(mode="json")
+                yield format_sse("message", message)
+        except Exception as exc:
+            failure = _fail(request.id, -32000, "Tool execution failed", {"error": str(exc)})
+            yield format_sse("message", failure.model_dump(mode="json"))
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@router.get("/search/stream")
+async def mcp_search_stream(
+    query: str = Query(min_length=1, max_length=500),
+    limit: int = Query(default=20, ge=1, le=100),
+    since: datetime | None = Query(default=None),
+    until: datetime | None = Query(default=None),
+    unread_only: bool = Query(default=False),
+    participant: str | None = Query(default=None, min_length=1, max_length=320),
     redis: Redis = Depends(get_redis),
     authorization: str | None = Header(default=None),
 ) -> StreamingResponse:
@@ -258,18 +465,35 @@ async def mcp_sse(
     service = MCPService(redis)
 
     async def event_stream():
-        stream_id = "$"
-        while True:
-            unread = await service.get_unread_messages(token=token, user_id=user_id, platform="all", limit=5)
-            yield f"event: unread_snapshot\ndata: {json.dumps(unread)}\n\n"
-
-            entries = await redis.xread({"tool_calls": stream_id}, count=10, block=1000)
-            for _, stream_entries in entries:
-                for event_id, data in stream_entries:
-                    stream_id = event_id
-                    yield f"event: tool_call\ndata: {json.dumps(data)}\n\n"
-
-            yield "event: heartbeat\ndata: {}\n\n"
-            await asyncio.sleep(settings.mcp_sse_heartbeat_seconds)
+        async for event in service.stream_search_messages(
+            token=token,
+            user_id=user_id,
+            query=query,
+            limit=limit,
+            since=since,
+            until=until,
+            unread_only=unread_only,
+            participant=participant,
+        ):
+            yield format_sse(event["event"], {key: value for key, value in event.items() if key != "event"})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@router.get("/sse")
+async def mcp_sse(authorization: str | None = Header(default=None)) -> StreamingResponse:
+    token, user_id = await _resolve_user(authorization)
+    subscriber = sse_hub.subscribe(user_id, token)
+
+    async def event_stream():
+        try:
+            while True:
+                message = await subscriber.queue.get()
+                if message is None:
+                    yield "event: evicted\ndata: {}\n\n"
+                    return
+                yield message
+        finally:
+            sse_hub.unsubscribe(subscriber)
 
     return StreamingResponse(event_stream(), media_type="text/event-stream")
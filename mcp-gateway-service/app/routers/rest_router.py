@@ -1,16 +1,22 @@
-from fastapi import APIRouter, Depends, Query
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi.responses import StreamingResponse
 from redis.asyncio import Redis
 
 from app.core.database import get_redis
+from app.core.etag import conditional_response
 from app.dependencies import get_access_token, get_current_user
 from app.schemas.rest import (
     MarkReadBody,
     MessageListResponse,
     PlatformsResponse,
     PrioritizeBody,
+    SearchResponse,
     SendMessageBody,
     SendReplyBody,
     ThreadResponse,
+    UnreadCountsResponse,
 )
 from app.services.mcp_service import MCPService
 from shared.models import AuthenticatedUser, SendMessageRequest
@@ -18,23 +24,65 @@ from shared.models import AuthenticatedUser, SendMessageRequest
 
 router = APIRouter(tags=["gateway"])
 
+# Per-platform latencies change on every call, so only the payload itself feeds the unread ETag.
+UNREAD_ETAG_FIELDS = {"messages", "next_before", "next_cursor", "partial"}
+
 
 @router.get("/messages/unread", response_model=MessageListResponse)
 async def get_unread_messages(
     platform: str = Query(default="all"),
     limit: int = Query(default=50, ge=1, le=100),
+    before: datetime | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
     token: str = Depends(get_access_token),
     user: AuthenticatedUser = Depends(get_current_user),
     redis: Redis = Depends(get_redis),
-) -> MessageListResponse:
+) -> Response:
     service = MCPService(redis)
     payload = await service.get_unread_messages(
         token=token,
         user_id=user.user_id,
         platform=platform,
         limit=limit,
+        before=before,
+        cursor=cursor,
+    )
+    return conditional_response(MessageListResponse(**payload), if_none_match, include=UNREAD_ETAG_FIELDS)
+
+
+@router.get("/counts", response_model=UnreadCountsResponse)
+async def get_unread_counts(
+    platform: str = Query(default="all"),
+    token: str = Depends(get_access_token),
+    user: AuthenticatedUser = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
+) -> UnreadCountsResponse:
+    service = MCPService(redis)
+    payload = await service.get_unread_counts(token=token, user_id=user.user_id, platform=platform)
+    return UnreadCountsResponse(**payload)
+
+
+@router.get("/messages/export")
+async def export_messages(
+    platform: str = Query(default="email"),
+    unread_only: bool = Query(default=False),
+    thread_id: str | None = Query(default=None),
+    since: datetime | None = Query(default=None),
+    token: str = Depends(get_access_token),
+    user: AuthenticatedUser = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
+) -> StreamingResponse:
+    service = MCPService(redis)
+    stream = await service.export_messages(
+        token=token,
+        user_id=user.user_id,
+        platform=platform,
+        unread_only=unread_only,
+        thread_id=thread_id,
+        since=since,
     )
-    return MessageListResponse(messages=payload["messages"])
+    return StreamingResponse(stream, media_type="application/x-ndjson")
 
 
 @router.post("/messages/{message_id}/reply")
@@ -104,47 +152,84 @@ async def prioritize_messages(
     redis: Redis = Depends(get_redis),
 ) -> dict:
     service = MCPService(redis)
-    return await service.prioritize_messages(user_id=user.user_id, messages=body.messages, criteria=body.criteria)
+    return await service.prioritize_messages(
+        user_id=user.user_id,
+        messages=body.messages,
+        criteria=body.criteria,
+        weights=body.weights,
+    )
 
 
 @router.get("/threads/{thread_id}", response_model=ThreadResponse)
 async def get_thread(
     thread_id: str,
     platform: str = Query(default="email"),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    cursor: str | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
     token: str = Depends(get_access_token),
     user: AuthenticatedUser = Depends(get_current_user),
     redis: Redis = Depends(get_redis),
-) -> ThreadResponse:
+) -> Response:
     service = MCPService(redis)
     payload = await service.get_thread(
         token=token,
         user_id=user.user_id,
         platform=platform,
         thread_id=thread_id,
+        limit=limit,
+        cursor=cursor,
     )
-    return ThreadResponse(thread=payload["thread"])
+    return conditional_response(ThreadResponse(thread=payload["thread"]), if_none_match)
 
 
 @router.get("/threads/{thread_id}/summary")
 async def summarize_thread(
     thread_id: str,
     platform: str = Query(default="email"),
+    max_sentences: int | None = Query(default=None, ge=1, le=20),
+    token: str = Depends(get_access_token),
     user: AuthenticatedUser = Depends(get_current_user),
     redis: Redis = Depends(get_redis),
 ) -> dict:
     service = MCPService(redis)
-    return await service.summarize_threads(user_id=user.user_id, platform=platform, thread_id=thread_id)
+    return await service.summarize_threads(
+        token=token,
+        user_id=user.user_id,
+        platform=platform,
+        thread_id=thread_id,
+        max_sentences=max_sentences,
+    )
 
 
-@router.get("/messages/search")
+@router.get("/messages/search", response_model=SearchResponse)
 async def search_messages(
-    q: str = Query(alias="q"),
+    q: str = Query(alias="q", min_length=1, max_length=500),
     platform: str = Query(default="all"),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+    since: datetime | None = Query(default=None),
+    until: datetime | None = Query(default=None),
+    unread_only: bool = Query(default=False),
+    participant: str | None = Query(default=None, min_length=1, max_length=320),
+    token: str = Depends(get_access_token),
     user: AuthenticatedUser = Depends(get_current_user),
     redis: Redis = Depends(get_redis),
-) -> dict:
+) -> SearchResponse:
     service = MCPService(redis)
-    return await service.search_messages(user_id=user.user_id, platform=platform, query=q)
+    payload = await service.search_messages(
+        token=token,
+        user_id=user.user_id,
+        platform=platform,
+        query=q,
+        limit=limit,
+        cursor=cursor,
+        since=since,
+        until=until,
+        unread_only=unread_only,
+        participant=participant,
+    )
+    return SearchResponse(**payload)
 
 
 @router.get("/platforms", response_model=PlatformsResponse)
@@ -155,34 +240,49 @@ async def get_platforms(
 ) -> PlatformsResponse:
     service = MCPService(redis)
     payload = await service.get_platforms(token=token, user_id=user.user_id)
-    return PlatformsResponse(platforms=payload["platforms"])
+    return PlatformsResponse(**payload)
 
 
 # Backward-compatible aliases for current frontend wiring.
 @router.get("/v1/inbox/unread", response_model=MessageListResponse)
 async def get_unread_messages_v1(
     limit: int = Query(default=50, ge=1, le=100),
+    before: datetime | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
     token: str = Depends(get_access_token),
     user: AuthenticatedUser = Depends(get_current_user),
     redis: Redis = Depends(get_redis),
-) -> MessageListResponse:
+) -> Response:
     service = MCPService(redis)
-    payload = await service.get_unread_messages(token=token, user_id=user.user_id, platform="all", limit=limit)
-    return MessageListResponse(messages=payload["messages"])
+    payload = await service.get_unread_messages(
+        token=token,
+        user_id=user.user_id,
+        platform="all",
+        limit=limit,
+        before=before,
+        cursor=cursor,
+    )
+    return conditional_response(MessageListResponse(**payload), if_none_match, include=UNREAD_ETAG_FIELDS)
 
 
 @router.get("/v1/threads/{thread_id}", response_model=ThreadResponse)
 async def get_thread_v1(
     thread_id: str,
+    limit: int | None = Query(default=None, ge=1, le=500),
+    cursor: str | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
     token: str = Depends(get_access_token),
     user: AuthenticatedUser = Depends(get_current_user),
     redis: Redis = Depends(get_redis),
-) -> ThreadResponse:
+) -> Response:
     service = MCPService(redis)
     payload = await service.get_thread(
         token=token,
         user_id=user.user_id,
         platform="email",
         thread_id=thread_id,
+        limit=limit,
+        cursor=cursor,
     )
-    return ThreadResponse(thread=payload["thread"])
+    return conditional_response(ThreadResponse(thread=payload["thread"]), if_none_match)
@@ -1,12 +1,45 @@
+from datetime import datetime
 from typing import Literal
 
 from pydantic import BaseModel, Field
 
-from shared.models import Message, PlatformStatus, SendMessageRequest, ThreadDetail
+from shared.models import Message, PlatformStatus, SearchHit, SendMessageRequest, ThreadDetail, UnreadCounts
+
+
+class PlatformCallStatus(BaseModel):
+    platform: str
+    status: Literal["ok", "timeout", "error"]
+    latency_ms: float
+    hedged: bool = False
+    error: str | None = None
+    status_code: int | None = None
+    checked_at: datetime | None = None
+    last_ok_at: datetime | None = None
 
 
 class MessageListResponse(BaseModel):
     messages: list[Message]
+    next_before: datetime | None = None
+    next_cursor: str | None = None
+    partial: bool = False
+    platform_status: list[PlatformCallStatus] = Field(default_factory=list)
+
+
+class SearchResponse(BaseModel):
+    query: str
+    platform: str
+    hits: list[SearchHit]
+    next_cursor: str | None = None
+    partial: bool = False
+    platform_status: list[PlatformCallStatus] = Field(default_factory=list)
+    timed_out: list[str] = Field(default_factory=list)
+
+
+class UnreadCountsResponse(BaseModel):
+    unread_count: int
+    platforms: list[UnreadCounts]
+    partial: bool = False
+    platform_status: list[PlatformCallStatus] = Field(default_factory=list)
 
 
 class ThreadResponse(BaseModel):
@@ -32,9 +65,22 @@ class MarkReadBody(BaseModel):
 
 
 class PrioritizeBody(BaseModel):
-    messages: list[dict]
+    messages: list[dict] = Field(max_length=10000)
     criteria: str = Field(default="urgency")
+    weights: dict[str, float] | None = None
+
+
+class CircuitBreakerState(BaseModel):
+    state: Literal["closed", "open", "half_open"]
+    calls: int
+    failure_rate: float
+    rejected: int
+    bulkhead_rejected: int
+    retries: int
 
 
 class PlatformsResponse(BaseModel):
     platforms: list[PlatformStatus]
+    partial: bool = False
+    platform_status: list[PlatformCallStatus] = Field(default_factory=list)
+    circuit_breakers: dict[str, CircuitBreakerState] = Field(default_factory=dict)
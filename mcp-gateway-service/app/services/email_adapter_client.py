@@ -1,17 +1,21 @@
+import hashlib
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
 
 import httpx
 
-from app.core.config import get_settings
-from shared.models import Message, PlatformStatus, SendMessageRequest, ThreadDetail
+from app.core.etag import ConditionalGetCache, upstream_etags
+from shared.models import Message, PlatformStatus, SearchResults, SendMessageRequest, ThreadDetail, UnreadCounts
 
 
-settings = get_settings()
+MARK_READ_BATCH_SIZE = 500
 
 
 class EmailAdapterClient:
-    def __init__(self):
-        self.base_url = settings.email_adapter_url
+    def __init__(self, http_client: httpx.AsyncClient, etags: ConditionalGetCache = upstream_etags):
+        self.http_client = http_client
+        self.etags = etags
 
     async def _request(
         self,
@@ -22,19 +26,49 @@ class EmailAdapterClient:
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         headers = {"Authorization": f"Bearer {token}"}
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            response = await client.request(
-                method=method,
-                url=f"{self.base_url}{path}",
-                json=json_payload,
-                params=params,
-                headers=headers,
-            )
+        response = await self.http_client.request(
+            method=method,
+            url=path,
+            json=json_payload,
+            params=params,
+            headers=headers,
+        )
         response.raise_for_status()
         return response.json()
 
-    async def get_unread_messages(self, token: str, limit: int = 25) -> list[Message]:
-        payload = await self._request("GET", "/v1/messages/unread", token=token, params={"limit": limit})
+    async def _conditional_get(self, path: str, token: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        token_key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        cache_key = (token_key, path, tuple(sorted((params or {}).items())))
+        cached = self.etags.get(cache_key)
+        headers = {"Authorization": f"Bearer {token}"}
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+
+        response = await self.http_client.get(path, params=params, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            self.etags.record(revalidated=True)
+            return cached[1]
+        response.raise_for_status()
+        payload = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self.etags.put(cache_key, etag, payload)
+        self.etags.record(revalidated=False)
+        return payload
+
+    async def get_unread_messages(
+        self,
+        token: str,
+        limit: int = 25,
+        before: datetime | None = None,
+        cursor: str | None = None,
+    ) -> list[Message]:
+        params: dict[str, Any] = {"limit": limit}
+        if before is not None:
+            params["before"] = before.isoformat()
+        if cursor is not None:
+            params["cursor"] = cursor
+        payload = await self._conditional_get("/v1/messages/unread", token=token, params=params)
         return [Message(**message) for message in payload["messages"]]
 
     async def send_reply(self, token: str, message_id: str, body: str) -> Message:
@@ -63,10 +97,92 @@ class EmailAdapterClient:
         )
         return Message(**payload)
 
-    async def get_thread(self, token: str, thread_id: str) -> ThreadDetail:
-        payload = await self._request("GET", f"/v1/threads/{thread_id}", token=token)
+    async def mark_many_as_read(self, token: str, message_ids: list[str]) -> list[Message]:
+        messages: list[Message] = []
+        for start in range(0, len(message_ids), MARK_READ_BATCH_SIZE):
+            payload = await self._request(
+                "POST",
+                "/v1/messages/mark-read",
+                token=token,
+                json_payload={"message_ids": message_ids[start : start + MARK_READ_BATCH_SIZE]},
+            )
+            messages.extend(Message(**message) for message in payload["messages"])
+        return messages
+
+    async def get_thread(
+        self,
+        token: str,
+        thread_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> ThreadDetail:
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if cursor is not None:
+            params["cursor"] = cursor
+        payload = await self._conditional_get(f"/v1/threads/{thread_id}", token=token, params=params)
         return ThreadDetail(**payload["thread"])
 
+    async def get_unread_counts(self, token: str) -> UnreadCounts:
+        payload = await self._request("GET", "/v1/counts", token=token)
+        return UnreadCounts(**payload)
+
+    async def search_messages(
+        self,
+        token: str,
+        query: str,
+        limit: int = 20,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        unread_only: bool = False,
+        participant: str | None = None,
+    ) -> SearchResults:
+        params: dict[str, Any] = {"q": query, "limit": limit, "unread_only": unread_only}
+        if cursor is not None:
+            params["cursor"] = cursor
+        if since is not None:
+            params["since"] = since.isoformat()
+        if until is not None:
+            params["until"] = until.isoformat()
+        if participant is not None:
+            params["participant"] = participant
+        payload = await self._request("GET", "/v1/messages/search", token=token, params=params)
+        return SearchResults(**payload)
+
+    async def stream_messages_export(
+        self,
+        token: str,
+        unread_only: bool = False,
+        thread_id: str | None = None,
+        since: datetime | None = None,
+    ) -> AsyncIterator[bytes]:
+        params: dict[str, Any] = {"unread_only": unread_only}
+        if thread_id is not None:
+            params["thread_id"] = thread_id
+        if since is not None:
+            params["since"] = since.isoformat()
+        request = self.http_client.build_request(
+            "GET",
+            "/v1/messages/export",
+            params=params,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        response = await self.http_client.send(request, stream=True)
+        try:
+            response.raise_for_status()
+            # Raw chunks are relayed as they arrive; the NDJSON is never decoded or held in full here.
+            async for chunk in response.aiter_raw():
+                yield chunk
+        finally:
+            await response.aclose()
+
     async def get_platforms(self, token: str) -> list[PlatformStatus]:
         payload = await self._request("GET", "/v1/platforms", token=token)
         return [PlatformStatus(**platform) for platform in payload["platforms"]]
+
+    async def get_platform_health(self) -> list[PlatformStatus]:
+        response = await self.http_client.get("/v1/platforms/health")
+        response.raise_for_status()
+        return [PlatformStatus(**platform) for platform in response.json()["platforms"]]
@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+import httpx
+from fastapi import HTTPException
+
+from app.core.config import get_settings
+
+
+logger = logging.getLogger("mcp-gateway-service")
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+@dataclass
+class PlatformOutcome(Generic[T]):
+    platform: str
+    status: str
+    latency_ms: float
+    result: T | None = None
+    error: str | None = None
+    status_code: int | None = None
+    hedged: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+    def to_status(self) -> dict[str, Any]:
+        return {
+            "platform": self.platform,
+            "status": self.status,
+            "latency_ms": round(self.latency_ms, 1),
+            "hedged": self.hedged,
+            "error": self.error,
+            "status_code": self.status_code,
+        }
+
+
+class LatencyTracker:
+    """Sliding window of successful call latencies per platform."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, platform: str, seconds: float) -> None:
+        self._samples.setdefault(platform, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, platform: str, quantile: float) -> float | None:
+        samples = self._samples.get(platform)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, math.ceil(quantile * len(ordered)) - 1)]
+
+    def sample_count(self, platform: str) -> int:
+        return len(self._samples.get(platform, ()))
+
+    def platforms(self) -> list[str]:
+        return list(self._samples)
+
+
+class AdapterFanOut:
+    """
+    Runs one call per platform adapter with an independent deadline.
+
+    A slow or failing platform yields a `timeout`/`error` outcome instead of
+    failing the whole request. With hedging enabled, an idempotent call that
+    has not answered after the platform's observed p95 latency gets a second
+    attempt, and whichever attempt finishes first wins.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float,
+        hedge_enabled: bool,
+        hedge_min_delay_seconds: float,
+        hedge_min_samples: int,
+        latency_window: int,
+    ):
+        self.timeout_seconds = timeout_seconds
+        self.hedge_enabled = hedge_enabled
+        self.hedge_min_delay_seconds = hedge_min_delay_seconds
+        self.hedge_min_samples = hedge_min_samples
+        self.latency = LatencyTracker(latency_window)
+        self._counters = {"calls": 0, "timeouts": 0, "errors": 0, "hedges": 0, "hedge_wins": 0}
+
+    async def run(
+        self,
+        calls: dict[str, Callable[[], Awaitable[T]]],
+        hedge: bool = False,
+    ) -> list[PlatformOutcome[T]]:
+        return list(
+            await asyncio.gather(*[self.run_one(platform, call, hedge) for platform, call in calls.items()])
+        )
+
+    def hedge_delay(self, platform: str) -> float | None:
+        if not self.hedge_enabled or self.latency.sample_count(platform) < self.hedge_min_samples:
+            return None
+        p95 = self.latency.percentile(platform, 0.95)
+        if p95 is None:
+            return None
+        return max(p95, self.hedge_min_delay_seconds)
+
+    def stats(self) -> dict[str, Any]:
+        platforms = {}
+        for platform in self.latency.platforms():
+            p50 = self.latency.percentile(platform, 0.5)
+            p95 = self.latency.percentile(platform, 0.95)
+            platforms[platform] = {
+                "samples": self.latency.sample_count(platform),
+                "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+                "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            }
+        return {**self._counters, "platforms": platforms}
+
+    async def run_one(
+        self,
+        platform: str,
+        call: Callable[[], Awaitable[T]],
+        hedge: bool,
+    ) -> PlatformOutcome[T]:
+        self._counters["calls"] += 1
+        outcome: PlatformOutcome[T] = PlatformOutcome(platform=platform, status="ok", latency_ms=0.0)
+        started = time.monotonic()
+        try:
+            outcome.result = await asyncio.wait_for(
+                self._attempt(platform, call, outcome, hedge),
+                timeout=self.timeout_seconds,
+            )
+            self.latency.record(platform, time.monotonic() - started)
+        except asyncio.TimeoutError:
+            self._counters["timeouts"] += 1
+            outcome.status = "timeout"
+            outcome.error = f"No response within {self.timeout_seconds:g}s"
+        except HTTPException as exc:
+            self._counters["errors"] += 1
+            outcome.status = "error"
+            outcome.error = str(exc.detail)
+            outcome.status_code = exc.status_code
+        except Exception as exc:
+            self._counters["errors"] += 1
+            logger.warning("Adapter call failed for platform %s", platform, exc_info=True)
+            outcome.status = "error"
+            outcome.error = str(exc) or exc.__class__.__name__
+            if isinstance(exc, httpx.HTTPStatusError):
+                outcome.status_code = exc.response.status_code
+        outcome.latency_ms = (time.monotonic() - started) * 1000
+        return outcome
+
+    async def _attempt(
+        self,
+        platform: str,
+        call: Callable[[], Awaitable[T]],
+        outcome: PlatformOutcome[T],
+        hedge: bool,
+    ) -> T:
+        primary = asyncio.ensure_future(call())
+        attempts = [primary]
+        try:
+            delay = self.hedge_delay(platform) if hedge else None
+            if delay is not None:
+                done, _ = await asyncio.wait(attempts, timeout=delay)
+                if not done:
+                    self._counters["hedges"] += 1
+                    outcome.hedged = True
+                    attempts.append(asyncio.ensure_future(call()))
+
+            pending = set(attempts)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None:
+                        if task is not primary:
+                            self._counters["hedge_wins"] += 1
+                        return task.result()
+                if not pending:
+                    # Every attempt failed; surface the primary's error.
+                    return primary.result()
+        finally:
+            for task in attempts:
+                if not task.done():
+                    task.cancel()
+
+
+adapter_fanout = AdapterFanOut(
+    timeout_seconds=settings.adapter_timeout_seconds,
+    hedge_enabled=settings.adapter_hedge_enabled,
+    hedge_min_delay_seconds=settings.adapter_hedge_min_delay_seconds,
+    hedge_min_samples=settings.adapter_hedge_min_samples,
+    latency_window=settings.adapter_latency_window,
+)
@@ -1,7 +1,10 @@
 from collections.abc import Callable
+from datetime import datetime
 
+from fastapi import HTTPException, status
 from redis.asyncio import Redis
 
+from app.core.security import introspect_bearer_token
 from app.services.mcp_service import MCPService
 from shared.models import SendMessageRequest
 
@@ -11,6 +14,16 @@ except Exception:  # pragma: no cover - fallback when SDK import fails
     FastMCP = None  # type: ignore
 
 
+async def _authorize(access_token: str, user_id: str) -> None:
+    """
+    FastMCP tools take the token and user id as separate arguments; only act
+    (and touch per-user caches) for the user the token was issued to.
+    """
+    user = await introspect_bearer_token(access_token)
+    if user.user_id != user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="access_token does not belong to user_id")
+
+
 class FastMCPRegistry:
     def __init__(self, redis_provider: Callable[[], Redis]):
         self.redis_provider = redis_provider
@@ -22,15 +35,31 @@ class FastMCPRegistry:
         assert self.server is not None
 
         @self.server.tool(name="get_unread_messages")
-        async def get_unread_messages(access_token: str, user_id: str, platform: str = "all", limit: int = 50) -> dict:
+        async def get_unread_messages(
+            access_token: str,
+            user_id: str,
+            platform: str = "all",
+            limit: int = 50,
+            before: str | None = None,
+            cursor: str | None = None,
+        ) -> dict:
+            await _authorize(access_token, user_id)
             service = MCPService(self.redis_provider())
             return await service.get_unread_messages(
                 token=access_token,
                 user_id=user_id,
                 platform=platform,
                 limit=limit,
+                before=datetime.fromisoformat(before) if before else None,
+                cursor=cursor,
             )
 
+        @self.server.tool(name="get_unread_counts")
+        async def get_unread_counts(access_token: str, user_id: str, platform: str = "all") -> dict:
+            await _authorize(access_token, user_id)
+            service = MCPService(self.redis_provider())
+            return await service.get_unread_counts(token=access_token, user_id=user_id, platform=platform)
+
         @self.server.tool(name="send_reply")
         async def send_reply(
             access_token: str,
@@ -39,6 +68,7 @@ class FastMCPRegistry:
             message_id: str,
             content: str,
         ) -> dict:
+            await _authorize(access_token, user_id)
             service = MCPService(self.redis_provider())
             return await service.send_reply(
                 token=access_token,
@@ -58,6 +88,7 @@ class FastMCPRegistry:
             recipients: list[str] | None = None,
             thread_id: str | None = None,
         ) -> dict:
+            await _authorize(access_token, user_id)
             service = MCPService(self.redis_provider())
             payload = SendMessageRequest(
                 platform=platform,  # type: ignore[arg-type]
@@ -75,6 +106,7 @@ class FastMCPRegistry:
 
         @self.server.tool(name="get_platforms")
         async def get_platforms(access_token: str, user_id: str) -> dict:
+            await _authorize(access_token, user_id)
             service = MCPService(self.redis_provider())
             return await service.get_platforms(token=access_token, user_id=user_id)
 
@@ -85,6 +117,7 @@ class FastMCPRegistry:
             platform: str,
             message_ids: list[str],
         ) -> dict:
+            await _authorize(access_token, user_id)
             service = MCPService(self.redis_provider())
             return await service.mark_as_read(
                 token=access_token,
@@ -94,20 +127,62 @@ class FastMCPRegistry:
             )
 
         @self.server.tool(name="prioritize_messages")
-        async def prioritize_messages(user_id: str, messages: list[dict], criteria: str = "urgency") -> dict:
+        async def prioritize_messages(
+            user_id: str,
+            messages: list[dict],
+            criteria: str = "urgency",
+            weights: dict[str, float] | None = None,
+        ) -> dict:
             service = MCPService(self.redis_provider())
             return await service.prioritize_messages(
                 user_id=user_id,
                 messages=messages,
                 criteria=criteria,
+                weights=weights,
             )
 
         @self.server.tool(name="summarize_threads")
-        async def summarize_threads(user_id: str, platform: str = "email", thread_id: str | None = None) -> dict:
+        async def summarize_threads(
+            access_token: str,
+            user_id: str,
+            platform: str = "email",
+            thread_id: str | None = None,
+            max_sentences: int | None = None,
+        ) -> dict:
+            await _authorize(access_token, user_id)
             service = MCPService(self.redis_provider())
-            return await service.summarize_threads(user_id=user_id, platform=platform, thread_id=thread_id)
+            return await service.summarize_threads(
+                token=access_token,
+                user_id=user_id,
+                platform=platform,
+                thread_id=thread_id,
+                max_sentences=max_sentences,
+            )
 
         @self.server.tool(name="search_messages")
-        async def search_messages(user_id: str, query: str, platform: str = "all") -> dict:
+        async def search_messages(
+            access_token: str,
+            user_id: str,
+            query: str,
+            platform: str = "all",
+            limit: int = 20,
+            cursor: str | None = None,
+            since: str | None = None,
+            until: str | None = None,
+            unread_only: bool = False,
+            participant: str | None = None,
+        ) -> dict:
+            await _authorize(access_token, user_id)
             service = MCPService(self.redis_provider())
-            return await service.search_messages(user_id=user_id, platform=platform, query=query)
+            return await service.search_messages(
+                token=access_token,
+                user_id=user_id,
+                platform=platform,
+                query=query,
+                limit=limit,
+                cursor=cursor,
+                since=datetime.fromisoformat(since) if since else None,
+                until=datetime.fromisoformat(until) if until else None,
+                unread_only=unread_only,
+                participant=participant,
+            )
@@ -0,0 +1,118 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from app.core.config import get_settings
+from app.services.fanout import AdapterFanOut, PlatformOutcome, adapter_fanout
+from shared.models import SearchHit, SearchResults
+
+
+settings = get_settings()
+
+
+def normalize_scores(hits: list[SearchHit]) -> list[SearchHit]:
+    """Scale one adapter's ranks into [0, 1] by its best hit, so rankings from different engines can be merged."""
+    best = max((hit.rank for hit in hits), default=0.0)
+    return [hit.model_copy(update={"score": hit.rank / best if best > 0 else 0.0}) for hit in hits]
+
+
+class TopK:
+    """Bounded min-heap that keeps the `k` best-scoring hits offered so far."""
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: list[tuple[float, int, SearchHit]] = []
+        self._sequence = itertools.count()
+
+    def offer(self, hit: SearchHit) -> bool:
+        # The sequence number breaks score ties so hits themselves are never compared.
+        item = (hit.score or 0.0, -next(self._sequence), hit)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+            return True
+        if item[:2] <= self._heap[0][:2]:
+            return False
+        heapq.heapreplace(self._heap, item)
+        return True
+
+    def ranked(self) -> list[SearchHit]:
+        return [hit for _, _, hit in sorted(self._heap, reverse=True)]
+
+
+class FederatedSearch:
+    """
+    Cross-platform search under one shared deadline.
+
+    Every adapter is queried concurrently through the fan-out (so per-adapter
+    timeouts, hedging and latency stats still apply). Results are consumed as
+    they complete: each page is score-normalized and offered to a bounded
+    top-k heap, and an event is yielded straight away. Adapters still running
+    at the deadline are cancelled and reported as timed out.
+    """
+
+    def __init__(self, fanout: AdapterFanOut, deadline_seconds: float):
+        self.fanout = fanout
+        self.deadline_seconds = deadline_seconds
+
+    async def stream(
+        self,
+        calls: dict[str, Callable[[], Awaitable[SearchResults]]],
+        limit: int,
+    ) -> AsyncIterator[dict[str, Any]]:
+        started = time.monotonic()
+        deadline = started + self.deadline_seconds
+        tasks = {
+            asyncio.ensure_future(self.fanout.run_one(platform, call, hedge=True)): platform
+            for platform, call in calls.items()
+        }
+        top = TopK(limit)
+        platform_status: list[dict[str, Any]] = []
+        pending = set(tasks)
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    outcome: PlatformOutcome[SearchResults] = task.result()
+                    platform_status.append(outcome.to_status())
+                    admitted = []
+                    if outcome.ok and outcome.result is not None:
+                        admitted = [hit for hit in normalize_scores(outcome.result.hits) if top.offer(hit)]
+                    yield {
+                        "event": "search_results",
+                        "platform": outcome.platform,
+                        "status": outcome.status,
+                        "hits": [hit.model_dump(mode="json") for hit in admitted],
+                        "completed": len(platform_status),
+                        "total": len(tasks),
+                    }
+        finally:
+            for task in pending:
+                task.cancel()
+
+        timed_out = sorted(tasks[task] for task in pending)
+        elapsed_ms = (time.monotonic() - started) * 1000
+        platform_status.extend(
+            {
+                "platform": platform,
+                "status": "timeout",
+                "latency_ms": round(elapsed_ms, 1),
+                "hedged": False,
+                "error": f"No response within the {self.deadline_seconds:g}s search deadline",
+            }
+            for platform in timed_out
+        )
+        yield {
+            "event": "search_complete",
+            "hits": [hit.model_dump(mode="json") for hit in top.ranked()],
+            "timed_out": timed_out,
+            "platform_status": platform_status,
+        }
+
+
+federated_search = FederatedSearch(fanout=adapter_fanout, deadline_seconds=settings.search_deadline_seconds)
@@ -1,19 +1,40 @@
 import asyncio
-from collections import defaultdict
+import heapq
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
+from functools import partial
+from itertools import islice
 
 from fastapi import HTTPException, status
 from redis.asyncio import Redis
 
 from app.adapters.factory import AdapterFactory
-from app.repository.tool_call_repository import ToolCallRepository
-from shared.models import SendMessageRequest
+from app.core.config import get_settings
+from app.services.fanout import adapter_fanout
+from app.services.federated_search import federated_search
+from app.services.platform_prober import platform_prober
+from app.services.priority_scoring import priority_scorer
+from app.services.summary_jobs import summary_jobs
+from app.services.tool_cache import tool_cache
+from app.services.tool_call_logger import tool_call_logger
+from shared.models import Message, PlatformStatus, SendMessageRequest
+from shared.pagination import decode_cursor, decode_rank_cursor, encode_cursor
+
+
+settings = get_settings()
 
 
 class MCPService:
     def __init__(self, redis: Redis):
         self.redis = redis
-        self.tool_repo = ToolCallRepository(redis)
+        self.tool_logger = tool_call_logger
         self.adapter_factory = AdapterFactory()
+        self.fanout = adapter_fanout
+        self.federated_search = federated_search
+        self.prober = platform_prober
+        self.cache = tool_cache
+        self.scorer = priority_scorer
+        self.summaries = summary_jobs
 
     async def get_unread_messages(
         self,
@@ -21,18 +42,89 @@ class MCPService:
         user_id: str,
         platform: str = "all",
         limit: int = 50,
+        before: datetime | None = None,
+        cursor: str | None = None,
+    ) -> dict:
+        self._validate_cursor(cursor)
+        payload = await self.cache.get_or_load(
+            "get_unread_messages",
+            user_id,
+            (platform, limit, before.isoformat() if before else None, cursor),
+            partial(
+                self._load_unread_messages,
+                token=token,
+                platform=platform,
+                limit=limit,
+                before=before,
+                cursor=cursor,
+            ),
+            # A page missing a timed-out platform must not be served to later callers.
+            cacheable=lambda result: not result["partial"],
+        )
+        self.tool_logger.log("get_unread_messages", user_id, "partial" if payload["partial"] else "success")
+        return payload
+
+    async def _load_unread_messages(
+        self,
+        token: str,
+        platform: str,
+        limit: int,
+        before: datetime | None,
+        cursor: str | None,
     ) -> dict:
         adapters = self._resolve_adapters(platform)
+        platform_status: list[dict] = []
         if platform == "all":
-            results = await asyncio.gather(
-                *[adapter.get_unread_messages(token=token, limit=limit) for adapter in adapters]
+            outcomes = await self.fanout.run(
+                {
+                    adapter.platform: partial(
+                        adapter.get_unread_messages,
+                        token=token,
+                        limit=limit,
+                        before=before,
+                        cursor=cursor,
+                    )
+                    for adapter in adapters
+                },
+                hedge=True,
             )
-            messages = [message for adapter_messages in results for message in adapter_messages]
+            messages = self._merge_newest_first([outcome.result for outcome in outcomes if outcome.ok], limit)
+            platform_status = [outcome.to_status() for outcome in outcomes]
         else:
-            messages = await adapters[0].get_unread_messages(token=token, limit=limit)
+            messages = await adapters[0].get_unread_messages(token=token, limit=limit, before=before, cursor=cursor)
 
-        await self.tool_repo.log_tool_call("get_unread_messages", user_id, "success")
-        return {"messages": [message.model_dump(mode="json") for message in messages]}
+        # A full page means the merge may continue; the oldest message is the cursor for the next one.
+        has_more = len(messages) >= limit
+        is_partial = any(item["status"] != "ok" for item in platform_status)
+        return {
+            "messages": [message.model_dump(mode="json") for message in messages],
+            "next_before": messages[-1].sent_at.isoformat() if has_more else None,
+            "next_cursor": encode_cursor(messages[-1].sent_at, messages[-1].id) if has_more else None,
+            "partial": is_partial,
+            "platform_status": platform_status,
+        }
+
+    async def get_unread_counts(self, token: str, user_id: str, platform: str = "all") -> dict:
+        adapters = self._resolve_adapters(platform)
+        platform_status: list[dict] = []
+        if platform == "all":
+            outcomes = await self.fanout.run(
+                {adapter.platform: partial(adapter.get_unread_counts, token=token) for adapter in adapters},
+                hedge=True,
+            )
+            counts = [outcome.result for outcome in outcomes if outcome.ok]
+            platform_status = [outcome.to_status() for outcome in outcomes]
+        else:
+            counts = [await adapters[0].get_unread_counts(token=token)]
+
+        is_partial = any(item["status"] != "ok" for item in platform_status)
+        self.tool_logger.log("get_unread_counts", user_id, "partial" if is_partial else "success")
+        return {
+            "unread_count": sum(item.unread_count for item in counts),
+            "platforms": [item.model_dump(mode="json") for item in counts],
+            "partial": is_partial,
+            "platform_status": platform_status,
+        }
 
     async def send_reply(
         self,
@@ -44,7 +136,8 @@ class MCPService:
     ) -> dict:
         adapter = self.adapter_factory.get(platform)
         message = await adapter.send_reply(token=token, message_id=message_id, content=content)
-        await self.tool_repo.log_tool_call("send_reply", user_id, "success")
+        await self.cache.invalidate(user_id)
+        self.tool_logger.log("send_reply", user_id, "success")
         return message.model_dump(mode="json")
 
     async def send_message(
@@ -56,7 +149,8 @@ class MCPService:
     ) -> dict:
         adapter = self.adapter_factory.get(platform)
         message = await adapter.send_message(token=token, payload=payload)
-        await self.tool_repo.log_tool_call("send_message", user_id, "success")
+        await self.cache.invalidate(user_id)
+        self.tool_logger.log("send_message", user_id, "success")
         return message.model_dump(mode="json")
 
     async def mark_as_read(
@@ -67,18 +161,26 @@ class MCPService:
         message_ids: list[str],
     ) -> dict:
         adapter = self.adapter_factory.get(platform)
-        updated: list[dict] = []
-        for message_id in message_ids:
-            updated_message = await adapter.mark_as_read(token=token, message_id=message_id)
-            updated.append(updated_message.model_dump(mode="json"))
-        await self.tool_repo.log_tool_call("mark_as_read", user_id, "success")
-        return {"messages": updated}
+        updated = await adapter.mark_many_as_read(token=token, message_ids=message_ids)
+        await self.cache.invalidate(user_id)
+        self.tool_logger.log("mark_as_read", user_id, "success")
+        return {"messages": [message.model_dump(mode="json") for message in updated]}
 
     async def get_platforms(self, token: str, user_id: str) -> dict:
-        statuses = await asyncio.gather(
-            *[adapter.get_platforms(token=token) for adapter in self.adapter_factory.all()]
-        )
-        merged = [item.model_dump(mode="json") for sublist in statuses for item in sublist]
+        probes = await self.prober.get_snapshot()
+        merged = []
+        for probe in probes:
+            if probe.status == "ok":
+                merged.extend(item.model_dump(mode="json") for item in probe.statuses)
+            else:
+                merged.append(
+                    PlatformStatus(
+                        platform=probe.platform,
+                        connected=False,
+                        status=probe.status,
+                        detail=probe.error,
+                    ).model_dump(mode="json")
+                )
         # Deduplicate by platform + status to avoid duplicate email rows from adapters that represent email channels.
         deduped = []
         seen = set()
@@ -88,43 +190,185 @@ class MCPService:
                 continue
             seen.add(key)
             deduped.append(item)
-        await self.tool_repo.log_tool_call("get_platforms", user_id, "success")
-        return {"platforms": deduped}
+        is_partial = any(probe.status != "ok" for probe in probes)
+        self.tool_logger.log("get_platforms", user_id, "partial" if is_partial else "success")
+        return {
+            "platforms": deduped,
+            "partial": is_partial,
+            "platform_status": [probe.to_status() for probe in probes],
+            "circuit_breakers": self.adapter_factory.guards.snapshot(),
+        }
 
-    async def get_thread(self, token: str, user_id: str, platform: str, thread_id: str) -> dict:
+    async def get_thread(
+        self,
+        token: str,
+        user_id: str,
+        platform: str,
+        thread_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> dict:
+        self._validate_cursor(cursor)
         adapter = self.adapter_factory.get(platform)
-        thread = await adapter.get_thread(token=token, thread_id=thread_id)
-        await self.tool_repo.log_tool_call("get_thread", user_id, "success")
+        thread = await adapter.get_thread(token=token, thread_id=thread_id, limit=limit, cursor=cursor)
+        self.tool_logger.log("get_thread", user_id, "success")
         return {"thread": thread.model_dump(mode="json")}
 
-    async def prioritize_messages(self, user_id: str, messages: list[dict], criteria: str = "urgency") -> dict:
-        ranked_messages = sorted(
-            messages,
-            key=lambda item: self._priority_rank(str(item.get("priority", "normal"))),
-        )
-        await self.tool_repo.log_tool_call("prioritize_messages", user_id, "success")
+    async def export_messages(
+        self,
+        token: str,
+        user_id: str,
+        platform: str,
+        unread_only: bool = False,
+        thread_id: str | None = None,
+        since: datetime | None = None,
+    ) -> AsyncIterator[bytes]:
+        adapter = self.adapter_factory.get(platform)
+        stream = adapter.export_messages(token=token, unread_only=unread_only, thread_id=thread_id, since=since)
+        # Pull the first chunk now so an upstream failure surfaces as an error status, not a truncated 200.
+        first = await anext(stream, b"")
+        self.tool_logger.log("export_messages", user_id, "success")
+        return self._prepend(first, stream)
+
+    async def prioritize_messages(
+        self,
+        user_id: str,
+        messages: list[dict],
+        criteria: str = "urgency",
+        weights: dict[str, float] | None = None,
+    ) -> dict:
+        try:
+            resolved_weights, ranked_messages = self.scorer.rank(messages, criteria=criteria, weights=weights)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+        self.tool_logger.log("prioritize_messages", user_id, "success")
         return {
             "criteria": criteria,
+            "weights": resolved_weights,
             "messages": ranked_messages,
         }
 
-    async def summarize_threads(self, user_id: str, platform: str, thread_id: str | None = None) -> dict:
-        await self.tool_repo.log_tool_call("summarize_threads", user_id, "not_implemented")
+    async def summarize_threads(
+        self,
+        token: str,
+        user_id: str,
+        platform: str,
+        thread_id: str | None = None,
+        max_sentences: int | None = None,
+    ) -> dict:
+        adapter = self.adapter_factory.get(platform)
+        if thread_id is not None:
+            thread_ids = [thread_id]
+        else:
+            # Without a thread, summarize the conversations behind the newest unread messages.
+            unread = await adapter.get_unread_messages(token=token, limit=settings.summary_unread_scan_limit)
+            thread_ids = list(dict.fromkeys(message.thread_id for message in unread))[: settings.summary_max_threads]
+
+        threads = await asyncio.gather(*[adapter.get_thread(token=token, thread_id=item) for item in thread_ids])
+        summaries = await self.summaries.summaries(platform, threads, max_sentences)
+        is_pending = any(item["status"] != "ready" for item in summaries)
+        self.tool_logger.log("summarize_threads", user_id, "pending" if is_pending else "success")
         return {
-            "phase": 2,
             "platform": platform,
             "thread_id": thread_id,
-            "summary": "Thread summarization integration is planned for phase 2.",
+            "summary": summaries[0]["summary"] if thread_id is not None else None,
+            "summaries": summaries,
+            "pending": is_pending,
         }
 
-    async def search_messages(self, user_id: str, platform: str, query: str) -> dict:
-        await self.tool_repo.log_tool_call("search_messages", user_id, "not_implemented")
+    async def search_messages(
+        self,
+        token: str,
+        user_id: str,
+        platform: str,
+        query: str,
+        limit: int = 20,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        unread_only: bool = False,
+        participant: str | None = None,
+    ) -> dict:
+        if platform == "all":
+            if cursor is not None:
+                # Ranks are only comparable within one adapter, so a cursor cannot resume a merged ranking.
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Search cursors page a single platform",
+                )
+            result: dict = {}
+            async for event in self.stream_search_messages(
+                token=token,
+                user_id=user_id,
+                query=query,
+                limit=limit,
+                since=since,
+                until=until,
+                unread_only=unread_only,
+                participant=participant,
+            ):
+                result = event
+            return {key: value for key, value in result.items() if key != "event"}
+
+        self._validate_cursor(cursor, decode_rank_cursor)
+        adapter = self.adapter_factory.get(platform)
+        results = await adapter.search_messages(
+            token=token,
+            query=query,
+            limit=limit,
+            cursor=cursor,
+            since=since,
+            until=until,
+            unread_only=unread_only,
+            participant=participant,
+        )
+        self.tool_logger.log("search_messages", user_id, "success")
         return {
-            "phase": 3,
-            "platform": platform,
             "query": query,
-            "result": "Search service is planned for phase 3.",
+            "platform": platform,
+            "hits": [hit.model_dump(mode="json") for hit in results.hits],
+            "next_cursor": results.next_cursor,
+            "partial": False,
+            "platform_status": [],
+            "timed_out": [],
+        }
+
+    async def stream_search_messages(
+        self,
+        token: str,
+        user_id: str,
+        query: str,
+        limit: int = 20,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        unread_only: bool = False,
+        participant: str | None = None,
+    ) -> AsyncIterator[dict]:
+        calls = {
+            adapter.platform: partial(
+                adapter.search_messages,
+                token=token,
+                query=query,
+                limit=limit,
+                since=since,
+                until=until,
+                unread_only=unread_only,
+                participant=participant,
+            )
+            for adapter in self._resolve_adapters("all")
         }
+        async for event in self.federated_search.stream(calls, limit):
+            if event["event"] == "search_complete":
+                is_partial = any(item["status"] != "ok" for item in event["platform_status"])
+                self.tool_logger.log("search_messages", user_id, "partial" if is_partial else "success")
+                event = {
+                    **event,
+                    "query": query,
+                    "platform": "all",
+                    "next_cursor": None,
+                    "partial": is_partial,
+                }
+            yield event
 
     def _resolve_adapters(self, platform: str):
         if platform == "all":
@@ -132,6 +376,25 @@ class MCPService:
         return [self.adapter_factory.get(platform)]
 
     @staticmethod
-    def _priority_rank(priority: str) -> int:
-        order = defaultdict(lambda: 99, {"urgent": 0, "normal": 1, "low": 2})
-        return order[priority]
+    async def _prepend(first: bytes, rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        if first:
+            yield first
+        async for chunk in rest:
+            yield chunk
+
+    @staticmethod
+    def _validate_cursor(cursor: str | None, decode: Callable[[str], object] = decode_cursor) -> None:
+        if cursor is None:
+            return
+        try:
+            decode(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    @staticmethod
+    def _merge_newest_first(results: list[list[Message]], limit: int) -> list[Message]:
+        # Each adapter returns its page already sorted by (sent_at, id) descending, so a lazy
+        # k-way heap merge yields the global order and stops as soon as `limit` is reached.
+        merged = heapq.merge(*results, key=lambda message: (message.sent_at, message.id), reverse=True)
+        return list(islice(merged, limit))
+
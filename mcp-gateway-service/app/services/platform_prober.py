@@ -0,0 +1,128 @@
+import asyncio
+import contextlib
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from fastapi import HTTPException
+
+from app.adapters.base_adapter import BaseGatewayPlatformAdapter
+from app.adapters.factory import AdapterFactory
+from app.core.config import get_settings
+from shared.models import PlatformStatus
+
+
+logger = logging.getLogger("mcp-gateway-service")
+settings = get_settings()
+
+
+@dataclass
+class PlatformProbe:
+    platform: str
+    status: str
+    checked_at: datetime
+    latency_ms: float
+    statuses: list[PlatformStatus] = field(default_factory=list)
+    error: str | None = None
+    last_ok_at: datetime | None = None
+
+    def to_status(self) -> dict[str, Any]:
+        return {
+            "platform": self.platform,
+            "status": self.status,
+            "latency_ms": round(self.latency_ms, 1),
+            "hedged": False,
+            "error": self.error,
+            "checked_at": self.checked_at.isoformat(),
+            "last_ok_at": self.last_ok_at.isoformat() if self.last_ok_at else None,
+        }
+
+
+class PlatformHealthProber:
+    """
+    Background refresh of every adapter's PlatformStatus.
+
+    Each round probes all adapters concurrently with a per-adapter timeout
+    and replaces the in-memory snapshot, so `get_platforms` reads a dict
+    instead of fanning out. Rounds are spaced by `interval_seconds` with
+    +/- `jitter` so replicas do not probe in lockstep.
+    """
+
+    def __init__(self, interval_seconds: float, jitter: float, timeout_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.jitter = jitter
+        self.timeout_seconds = timeout_seconds
+        self._snapshot: dict[str, PlatformProbe] = {}
+        self._task: asyncio.Task | None = None
+        self._refresh_lock = asyncio.Lock()
+
+    def snapshot(self) -> list[PlatformProbe]:
+        return list(self._snapshot.values())
+
+    async def get_snapshot(self) -> list[PlatformProbe]:
+        # Only the very first request after startup (or with the prober disabled) pays for a probe.
+        if not self._snapshot:
+            await self.refresh()
+        return self.snapshot()
+
+    async def refresh(self) -> None:
+        async with self._refresh_lock:
+            adapters = AdapterFactory().all()
+            probes = await asyncio.gather(*[self._probe(adapter) for adapter in adapters])
+            self._snapshot = {probe.platform: probe for probe in probes}
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.warning("Platform health probe round failed", exc_info=True)
+            spread = self.interval_seconds * self.jitter
+            await asyncio.sleep(self.interval_seconds + random.uniform(-spread, spread))
+
+    async def _probe(self, adapter: BaseGatewayPlatformAdapter) -> PlatformProbe:
+        previous = self._snapshot.get(adapter.platform)
+        started = time.monotonic()
+        probe = PlatformProbe(
+            platform=adapter.platform,
+            status="ok",
+            checked_at=datetime.now(UTC),
+            latency_ms=0.0,
+            last_ok_at=previous.last_ok_at if previous else None,
+        )
+        try:
+            probe.statuses = await asyncio.wait_for(adapter.probe(), timeout=self.timeout_seconds)
+            probe.last_ok_at = probe.checked_at
+        except asyncio.TimeoutError:
+            probe.status = "timeout"
+            probe.error = f"No response within {self.timeout_seconds:g}s"
+        except HTTPException as exc:
+            probe.status = "error"
+            probe.error = str(exc.detail)
+        except Exception as exc:
+            logger.warning("Health probe failed for platform %s", adapter.platform, exc_info=True)
+            probe.status = "error"
+            probe.error = str(exc) or exc.__class__.__name__
+        probe.latency_ms = (time.monotonic() - started) * 1000
+        return probe
+
+
+platform_prober = PlatformHealthProber(
+    interval_seconds=settings.platform_probe_interval_seconds,
+    jitter=settings.platform_probe_jitter,
+    timeout_seconds=settings.adapter_timeout_seconds,
+)
@@ -0,0 +1,240 @@
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from redis.asyncio import Redis
+
+from app.core.config import get_settings
+from app.core.database import redis_client
+from app.models.message_event import MessageChangeEvent
+from app.services.mcp_service import MCPService
+from app.services.tool_cache import tool_cache
+
+
+logger = logging.getLogger("mcp-gateway-service")
+settings = get_settings()
+
+
+def format_sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@dataclass(eq=False)
+class Subscriber:
+    user_id: str
+    token: str
+    queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+
+
+class SseHub:
+    """
+    Per-process fan-out for `/mcp/sse`.
+
+    One Redis stream reader and one unread poller per connected user feed
+    bounded subscriber queues, so upstream cost does not grow with the number
+    of open dashboards. A subscriber whose queue fills up is evicted.
+
+    Adapter change events are pushed as `unread_delta` and wake the user's
+    poller; otherwise the poller only resyncs every `resync_seconds`.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        buffer_size: int,
+        interval_seconds: float,
+        resync_seconds: float,
+        events_stream: str,
+    ):
+        self.redis = redis
+        self.buffer_size = buffer_size
+        self.interval_seconds = interval_seconds
+        self.resync_seconds = resync_seconds
+        self.events_stream = events_stream
+        self._subscribers: dict[str, set[Subscriber]] = {}
+        self._pollers: dict[str, asyncio.Task] = {}
+        self._wakeups: dict[str, asyncio.Event] = {}
+        self._last_snapshot: dict[str, str] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._evictions = 0
+
+    async def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._read_streams()),
+                asyncio.create_task(self._heartbeat()),
+            ]
+
+    async def stop(self) -> None:
+        tasks = [*self._tasks, *self._pollers.values()]
+        self._tasks = []
+        self._pollers.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        for subscribers in self._subscribers.values():
+            for subscriber in subscribers:
+                self._close(subscriber)
+        self._subscribers.clear()
+
+    def subscribe(self, user_id: str, token: str) -> Subscriber:
+        subscriber = Subscriber(user_id=user_id, token=token, queue=asyncio.Queue(maxsize=self.buffer_size))
+        self._subscribers.setdefault(user_id, set()).add(subscriber)
+
+        snapshot = self._last_snapshot.get(user_id)
+        if snapshot is not None:
+            subscriber.queue.put_nowait(snapshot)
+        if user_id not in self._pollers:
+            self._wakeups[user_id] = asyncio.Event()
+            self._pollers[user_id] = asyncio.create_task(self._poll_unread(user_id))
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        subscribers = self._subscribers.get(subscriber.user_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscriber)
+        if subscribers:
+            return
+
+        del self._subscribers[subscriber.user_id]
+        self._last_snapshot.pop(subscriber.user_id, None)
+        self._wakeups.pop(subscriber.user_id, None)
+        poller = self._pollers.pop(subscriber.user_id, None)
+        if poller is not None:
+            poller.cancel()
+
+    def publish(self, user_id: str, event: str, data: Any) -> None:
+        message = format_sse(event, data)
+        for subscriber in list(self._subscribers.get(user_id, ())):
+            self._offer(subscriber, message)
+
+    def broadcast(self, event: str, data: Any) -> None:
+        message = format_sse(event, data)
+        for subscribers in list(self._subscribers.values()):
+            for subscriber in list(subscribers):
+                self._offer(subscriber, message)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "users": len(self._subscribers),
+            "subscribers": sum(len(subscribers) for subscribers in self._subscribers.values()),
+            "pollers": len(self._pollers),
+            "evictions": self._evictions,
+        }
+
+    def _offer(self, subscriber: Subscriber, message: str) -> None:
+        try:
+            subscriber.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.info("Evicting slow SSE subscriber for user %s", subscriber.user_id)
+            self._evictions += 1
+            self.unsubscribe(subscriber)
+            self._close(subscriber)
+
+    @staticmethod
+    def _close(subscriber: Subscriber) -> None:
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(None)
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            self.broadcast("heartbeat", {})
+
+    async def _read_streams(self) -> None:
+        stream_ids = {"tool_calls": "$", self.events_stream: "$"}
+        while True:
+            try:
+                entries = await self.redis.xread(stream_ids, count=100, block=1000)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("SSE hub failed to read Redis streams", exc_info=True)
+                await asyncio.sleep(self.interval_seconds)
+                continue
+
+            for stream, stream_entries in entries:
+                for event_id, data in stream_entries:
+                    stream_ids[stream] = event_id
+                    user_id = data.get("user_id")
+                    if not user_id:
+                        continue
+                    if stream == self.events_stream:
+                        # Mailbox changes made outside this gateway (ingest, other replicas) still
+                        # have to drop the user's cached unread lists.
+                        await tool_cache.invalidate(user_id)
+                    if user_id not in self._subscribers:
+                        continue
+                    if stream == self.events_stream:
+                        self._on_message_event(MessageChangeEvent.from_stream(data))
+                    else:
+                        self.publish(user_id, "tool_call", data)
+
+    def _on_message_event(self, event: MessageChangeEvent) -> None:
+        self.publish(event.user_id, "unread_delta", event.to_delta())
+        wakeup = self._wakeups.get(event.user_id)
+        if wakeup is not None:
+            wakeup.set()
+
+    @staticmethod
+    def _rejected_token(unread: dict) -> bool:
+        return any(item.get("status_code") == 401 for item in unread.get("platform_status", ()))
+
+    async def _poll_unread(self, user_id: str) -> None:
+        service = MCPService(self.redis)
+        while user_id in self._subscribers:
+            for subscriber in list(self._subscribers.get(user_id, ())):
+                try:
+                    unread = await service.get_unread_messages(
+                        token=subscriber.token,
+                        user_id=user_id,
+                        platform="all",
+                        limit=5,
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.warning("SSE hub unread poll failed for user %s", user_id, exc_info=True)
+                    break
+
+                if self._rejected_token(unread):
+                    # The fan-out reports auth failures per platform. This connection's token has expired or
+                    # been revoked, so end its stream (the client reconnects with a fresh token) and poll
+                    # with another connection's token.
+                    logger.info("Closing SSE subscriber for user %s after its token was rejected", user_id)
+                    self.unsubscribe(subscriber)
+                    self._close(subscriber)
+                    continue
+
+                message = format_sse("unread_snapshot", unread)
+                self._last_snapshot[user_id] = message
+                for target in list(self._subscribers.get(user_id, ())):
+                    self._offer(target, message)
+                break
+
+            polled_at = time.monotonic()
+            wakeup = self._wakeups.get(user_id)
+            if wakeup is None:
+                return
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), timeout=self.resync_seconds)
+            # Coalesce bursts of change events into at most one poll per interval.
+            await asyncio.sleep(max(0.0, self.interval_seconds - (time.monotonic() - polled_at)))
+            wakeup.clear()
+
+
+sse_hub = SseHub(
+    redis=redis_client,
+    buffer_size=settings.mcp_sse_buffer_size,
+    interval_seconds=settings.mcp_sse_heartbeat_seconds,
+    resync_seconds=settings.mcp_sse_unread_resync_seconds,
+    events_stream=settings.message_events_stream,
+)
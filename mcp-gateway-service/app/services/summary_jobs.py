@@ -0,0 +1,101 @@
+import asyncio
+import logging
+from typing import Any
+
+from app.core.config import get_settings
+from app.core.database import redis_client
+from app.repository.summary_repository import SummaryRepository
+from app.services.thread_summarizer import ThreadSummarizer, thread_summarizer
+from shared.models import ThreadDetail
+
+
+logger = logging.getLogger("mcp-gateway-service")
+settings = get_settings()
+
+
+class SummaryJobs:
+    """
+    Gateway side of the summarization pipeline.
+
+    A stored summary whose content key still matches the thread is returned
+    as `ready`. Otherwise a job is enqueued for the summary worker (one job per
+    thread version and sentence limit, however often it is requested) and the
+    entry reports the job's status, carrying the previous summary marked
+    `stale` when there is one. Only when Redis is unreachable does the gateway
+    summarize itself, in a worker thread so the event loop stays free.
+    """
+
+    def __init__(self, repository: SummaryRepository, summarizer: ThreadSummarizer):
+        self.repository = repository
+        self.summarizer = summarizer
+        self._counters = {"ready": 0, "stale": 0, "enqueued": 0, "pending": 0, "inline": 0}
+
+    async def summaries(
+        self,
+        platform: str,
+        threads: list[ThreadDetail],
+        max_sentences: int | None = None,
+    ) -> list[dict[str, Any]]:
+        limit = max_sentences or self.summarizer.max_sentences
+        try:
+            stored = await self.repository.get_summaries([(platform, thread.id, limit) for thread in threads])
+            return list(
+                await asyncio.gather(
+                    *[self._resolve(platform, thread, limit, summary) for thread, summary in zip(threads, stored)]
+                )
+            )
+        except Exception:
+            logger.warning("Summary store unavailable; summarizing in the gateway", exc_info=True)
+            self._counters["inline"] += len(threads)
+            return [
+                {**await asyncio.to_thread(self.summarizer.summarize, thread, limit), "status": "ready"}
+                for thread in threads
+            ]
+
+    def stats(self) -> dict[str, int]:
+        return dict(self._counters)
+
+    async def _resolve(
+        self,
+        platform: str,
+        thread: ThreadDetail,
+        limit: int,
+        stored: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        content_key = self.summarizer.content_key(thread)
+        if stored is not None and stored.get("content_key") == content_key:
+            self._counters["ready"] += 1
+            return {**stored, "status": "ready"}
+
+        job_id = f"{content_key[:32]}-{limit}"
+        version = thread.updated_at.timestamp() if thread.updated_at else 0.0
+        if await self.repository.enqueue(job_id, platform, thread.id, limit, version, thread.model_dump_json()):
+            self._counters["enqueued"] += 1
+            job = {"status": "queued"}
+        else:
+            self._counters["pending"] += 1
+            job = await self.repository.get_job(job_id)
+
+        entry = {
+            "thread_id": thread.id,
+            "subject": thread.subject,
+            "message_count": len(thread.messages),
+            "summary": None,
+            "sentences": [],
+        }
+        if stored is not None:
+            self._counters["stale"] += 1
+            entry = {**stored, "stale": True}
+        return {**entry, "status": job.get("status", "queued"), "job_id": job_id, "error": job.get("error")}
+
+
+summary_jobs = SummaryJobs(
+    repository=SummaryRepository(
+        redis=redis_client,
+        stream=settings.summary_jobs_stream,
+        group=settings.summary_jobs_group,
+        stream_maxlen=settings.summary_jobs_stream_maxlen,
+        job_ttl_seconds=settings.summary_job_ttl_seconds,
+    ),
+    summarizer=thread_summarizer,
+)
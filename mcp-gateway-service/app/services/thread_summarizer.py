@@ -0,0 +1,147 @@
+import hashlib
+import re
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from app.core.config import get_settings
+from shared.models import Message, ThreadDetail
+
+
+settings = get_settings()
+
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n{2,}")
+WORD = re.compile(r"[a-z0-9][a-z0-9'_-]*")
+QUOTED_LINE = re.compile(r"^\s*>.*$", re.MULTILINE)
+STOPWORDS = frozenset(
+    """
+    a an and are as at be but by for from has have he her his i if in into is it its me my no not of on or our
+    she so that the their them then there these they this to was we were what when which who will with you your
+    hi hello thanks thank regards best please just also can could would should do does did am been being
+    """.split()
+)
+
+
+@dataclass(frozen=True)
+class Sentence:
+    message_id: str
+    text: str
+    terms: Counter
+
+
+class ThreadSummarizer:
+    """
+    Extractive thread summaries via TextRank over sentence TF-IDF vectors.
+
+    This is pure CPU work. It normally runs inside the summary worker's
+    process pool; when Redis is unreachable the gateway runs it inline in
+    worker threads (see SummaryJobs), never on the event loop itself.
+    Sentence splits and term counts are kept per message in a bounded LRU,
+    guarded by a lock for that threaded fallback, so a thread that gained a
+    message only tokenizes the new one; IDF and the TextRank graph are
+    recomputed because they depend on the whole thread.
+    """
+
+    def __init__(self, max_sentences: int, sentence_cache_max_messages: int, damping: float = 0.85):
+        self.max_sentences = max_sentences
+        self.sentence_cache_max_messages = sentence_cache_max_messages
+        self.damping = damping
+        self._sentences: OrderedDict[tuple[str, str], list[Sentence]] = OrderedDict()
+        self._sentences_lock = threading.Lock()
+
+    @staticmethod
+    def content_key(thread: ThreadDetail) -> str:
+        updated_at = thread.updated_at.isoformat() if thread.updated_at else ""
+        material = "|".join([thread.id, updated_at, *sorted(message.id for message in thread.messages)])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def summarize(self, thread: ThreadDetail, max_sentences: int | None = None) -> dict[str, Any]:
+        limit = max_sentences or self.max_sentences
+        sentences = [sentence for message in thread.messages for sentence in self._message_sentences(message)]
+        scores = self.textrank(self.tfidf(sentences)) if sentences else np.empty(0)
+        # Highest-scoring sentences, presented in thread order.
+        chosen = sorted(np.argsort(-scores, kind="stable")[:limit].tolist())
+        return {
+            "thread_id": thread.id,
+            "content_key": self.content_key(thread),
+            "subject": thread.subject,
+            "message_count": len(thread.messages),
+            "summary": " ".join(sentences[index].text for index in chosen),
+            "sentences": [
+                {
+                    "text": sentences[index].text,
+                    "message_id": sentences[index].message_id,
+                    "score": round(float(scores[index]), 4),
+                }
+                for index in chosen
+            ],
+        }
+
+    def _message_sentences(self, message: Message) -> list[Sentence]:
+        cache_key = (message.id, hashlib.sha1(message.body.encode("utf-8")).hexdigest())
+        with self._sentences_lock:
+            cached = self._sentences.get(cache_key)
+            if cached is not None:
+                self._sentences.move_to_end(cache_key)
+                return cached
+
+        body = QUOTED_LINE.sub("", message.body)
+        sentences = []
+        for text in SENTENCE_BOUNDARY.split(body):
+            text = " ".join(text.split())
+            terms = Counter(word for word in WORD.findall(text.lower()) if word not in STOPWORDS)
+            if terms:
+                sentences.append(Sentence(message_id=message.id, text=text, terms=terms))
+        with self._sentences_lock:
+            self._sentences[cache_key] = sentences
+            while len(self._sentences) > self.sentence_cache_max_messages:
+                self._sentences.popitem(last=False)
+        return sentences
+
+    @staticmethod
+    def tfidf(sentences: list[Sentence]) -> np.ndarray:
+        vocabulary: dict[str, int] = {}
+        for sentence in sentences:
+            for term in sentence.terms:
+                vocabulary.setdefault(term, len(vocabulary))
+        matrix = np.zeros((len(sentences), len(vocabulary)))
+        for row, sentence in enumerate(sentences):
+            columns = [vocabulary[term] for term in sentence.terms]
+            matrix[row, columns] = list(sentence.terms.values())
+
+        document_frequency = np.count_nonzero(matrix, axis=0)
+        idf = np.log((1 + len(sentences)) / (1 + document_frequency)) + 1.0
+        weighted = np.log1p(matrix) * idf
+        norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+        return weighted / np.where(norms == 0, 1.0, norms)
+
+    def textrank(self, vectors: np.ndarray, iterations: int = 50, tolerance: float = 1e-6) -> np.ndarray:
+        count = vectors.shape[0]
+        if count == 1:
+            return np.ones(1)
+        similarity = vectors @ vectors.T
+        np.fill_diagonal(similarity, 0.0)
+        out_weight = similarity.sum(axis=1, keepdims=True)
+        # Sentences sharing no terms with any other spread their rank evenly.
+        transition = np.where(out_weight > 0, similarity / np.where(out_weight == 0, 1.0, out_weight), 1.0 / count)
+        scores = np.full(count, 1.0 / count)
+        for _ in range(iterations):
+            updated = (1 - self.damping) / count + self.damping * (transition.T @ scores)
+            if np.abs(updated - scores).sum() < tolerance:
+                return updated
+            scores = updated
+        return scores
+
+
+def summarize_thread_json(thread_json: str, max_sentences: int) -> dict[str, Any]:
+    """Process-pool entry point: jobs carry the thread as JSON, and each worker process keeps its own sentence cache."""
+    return thread_summarizer.summarize(ThreadDetail.model_validate_json(thread_json), max_sentences)
+
+
+thread_summarizer = ThreadSummarizer(
+    max_sentences=settings.summary_max_sentences,
+    sentence_cache_max_messages=settings.summary_sentence_cache_max_messages,
+)
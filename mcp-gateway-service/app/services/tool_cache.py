@@ -0,0 +1,190 @@
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from redis.asyncio import Redis
+
+from app.core.config import get_settings
+from app.core.database import redis_client
+
+
+logger = logging.getLogger("mcp-gateway-service")
+settings = get_settings()
+
+Loader = Callable[[], Awaitable[dict[str, Any]]]
+
+
+def _always(result: dict[str, Any]) -> bool:
+    return True
+
+
+class ToolResultCache:
+    """
+    Redis read-through cache for per-user tool results.
+
+    Entries are fresh for `fresh_ttl_seconds`. For another `stale_ttl_seconds`
+    a stale entry is still served while one background task reloads it
+    (stale-while-revalidate). Every key embeds a per-user version number, so a
+    write invalidates all of that user's cached variants with a single INCR.
+    An unversioned copy of the last result is kept for
+    `stale_if_error_seconds` and served when the loader fails.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        fresh_ttl_seconds: float,
+        stale_ttl_seconds: float,
+        stale_if_error_seconds: float,
+    ):
+        self.redis = redis
+        self.fresh_ttl_seconds = fresh_ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.stale_if_error_seconds = stale_if_error_seconds
+        self._revalidating: dict[str, asyncio.Task] = {}
+        self._counters: dict[str, dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "stale_hits": 0, "stale_if_error": 0, "misses": 0, "bypassed": 0}
+        )
+
+    async def get_or_load(
+        self,
+        tool: str,
+        user_id: str,
+        key_parts: tuple[Any, ...],
+        loader: Loader,
+        cacheable: Callable[[dict[str, Any]], bool] = _always,
+    ) -> dict[str, Any]:
+        counters = self._counters[tool]
+        fallback_key = self._fallback_key(tool, user_id, key_parts)
+        try:
+            version = await self.redis.get(self._version_key(user_id)) or "0"
+            key = self._entry_key(tool, user_id, version, key_parts)
+            entry = self._decode(await self.redis.get(key))
+        except Exception:
+            logger.warning("Tool cache unavailable; loading %s directly", tool, exc_info=True)
+            counters["bypassed"] += 1
+            return await loader()
+
+        if entry is not None:
+            age, result = entry
+            if age < self.fresh_ttl_seconds:
+                counters["hits"] += 1
+            else:
+                counters["stale_hits"] += 1
+                self._revalidate(key, fallback_key, loader, cacheable)
+            return result
+
+        counters["misses"] += 1
+        try:
+            result = await loader()
+        except Exception:
+            fallback = await self._read_fallback(fallback_key)
+            if fallback is None:
+                raise
+            counters["stale_if_error"] += 1
+            logger.warning("Serving stale %s result after load failure", tool, exc_info=True)
+            return fallback
+        if cacheable(result):
+            await self._store(key, fallback_key, result)
+        return result
+
+    async def invalidate(self, user_id: str) -> None:
+        version_key = self._version_key(user_id)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.incr(version_key)
+                # Outlive every entry that could still carry the previous version.
+                pipe.expire(version_key, int(self._entry_ttl()) * 2)
+                await pipe.execute()
+        except Exception:
+            logger.warning("Failed to invalidate tool cache for user %s", user_id, exc_info=True)
+
+    def stats(self) -> dict[str, dict[str, float | int]]:
+        report: dict[str, dict[str, float | int]] = {}
+        for tool, counters in self._counters.items():
+            served = counters["hits"] + counters["stale_hits"] + counters["stale_if_error"]
+            lookups = served + counters["misses"]
+            report[tool] = {**counters, "hit_ratio": round(served / lookups, 4) if lookups else 0.0}
+        return report
+
+    async def _read_fallback(self, fallback_key: str) -> dict[str, Any] | None:
+        # The fallback copy ignores invalidation: with the upstream failing, a
+        # slightly outdated result beats an error.
+        try:
+            entry = self._decode(await self.redis.get(fallback_key))
+        except Exception:
+            return None
+        return entry[1] if entry else None
+
+    async def _store(self, key: str, fallback_key: str, result: dict[str, Any]) -> None:
+        value = f"{time.time():.3f}|{json.dumps(result, separators=(',', ':'))}"
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(key, value, ex=int(self._entry_ttl()))
+                pipe.set(fallback_key, value, ex=int(max(self._entry_ttl(), self.stale_if_error_seconds)))
+                await pipe.execute()
+        except Exception:
+            logger.warning("Failed to store tool cache entry", exc_info=True)
+
+    def _revalidate(
+        self,
+        key: str,
+        fallback_key: str,
+        loader: Loader,
+        cacheable: Callable[[dict[str, Any]], bool],
+    ) -> None:
+        if key in self._revalidating:
+            return
+
+        async def reload() -> None:
+            try:
+                result = await loader()
+                if cacheable(result):
+                    await self._store(key, fallback_key, result)
+            except Exception:
+                logger.warning("Background revalidation failed for %s", key, exc_info=True)
+            finally:
+                self._revalidating.pop(key, None)
+
+        self._revalidating[key] = asyncio.create_task(reload())
+
+    @staticmethod
+    def _decode(raw: str | None) -> tuple[float, dict[str, Any]] | None:
+        if not raw:
+            return None
+        stored_at, _, payload = raw.partition("|")
+        try:
+            return time.time() - float(stored_at), json.loads(payload)
+        except ValueError:
+            return None
+
+    def _entry_ttl(self) -> float:
+        return max(1.0, self.fresh_ttl_seconds + self.stale_ttl_seconds)
+
+    @staticmethod
+    def _version_key(user_id: str) -> str:
+        return f"toolcache:{user_id}:version"
+
+    @staticmethod
+    def _entry_key(tool: str, user_id: str, version: str, key_parts: tuple[Any, ...]) -> str:
+        return f"toolcache:{user_id}:{tool}:v{version}:{_key_suffix(key_parts)}"
+
+    @staticmethod
+    def _fallback_key(tool: str, user_id: str, key_parts: tuple[Any, ...]) -> str:
+        return f"toolcache:{user_id}:{tool}:last:{_key_suffix(key_parts)}"
+
+
+def _key_suffix(key_parts: tuple[Any, ...]) -> str:
+    return ":".join("-" if part is None else str(part) for part in key_parts)
+
+
+tool_cache = ToolResultCache(
+    redis=redis_client,
+    fresh_ttl_seconds=settings.tool_cache_fresh_ttl_seconds,
+    stale_ttl_seconds=settings.tool_cache_stale_ttl_seconds,
+    stale_if_error_seconds=settings.tool_cache_stale_if_error_seconds,
+)
@@ -0,0 +1,242 @@
+import asyncio
+import contextlib
+import json
+import logging
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+
+from app.core.config import get_settings
+from app.core.database import redis_client
+from app.models.tool_call import ToolCallLog
+from app.repository.tool_call_repository import ToolCallRepository
+
+
+logger = logging.getLogger("mcp-gateway-service")
+settings = get_settings()
+
+
+class ToolCallLogger:
+    """
+    Write-behind logger for tool calls.
+
+    `log` only enqueues, so tool latency never includes a Redis round trip.
+    A background task flushes pipelined XADD batches when `batch_size`
+    entries are queued or `flush_interval_seconds` elapses. When the queue is
+    full, entries are dropped or, with the "spill" policy, appended to a local
+    JSONL file that is replayed once Redis accepts writes again, and every
+    `replay_interval_seconds` while it does. Spill lines that no longer parse
+    (a crash mid-write leaves a torn last line) are skipped and counted.
+    """
+
+    def __init__(
+        self,
+        repository: ToolCallRepository,
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval_seconds: float,
+        overflow_policy: str,
+        spill_path: str,
+        replay_interval_seconds: float,
+    ):
+        if overflow_policy not in {"drop", "spill"}:
+            raise ValueError("overflow_policy must be 'drop' or 'spill'")
+        self.repository = repository
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.overflow_policy = overflow_policy
+        self.spill_path = Path(spill_path)
+        self.replay_interval_seconds = replay_interval_seconds
+        self._last_replay = 0.0
+        self._queue: asyncio.Queue[ToolCallLog] = asyncio.Queue(maxsize=max_queue_size)
+        self._pending: list[ToolCallLog] = []
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._counters = {
+            "logged": 0,
+            "flushed": 0,
+            "dropped": 0,
+            "spilled": 0,
+            "spill_skipped": 0,
+            "flush_failures": 0,
+        }
+
+    def log(self, tool_name: str, user_id: str, status: str) -> None:
+        entry = ToolCallLog(tool_name=tool_name, user_id=user_id, status=status)
+        self._counters["logged"] += 1
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            self._overflow([entry])
+        if self._queue.qsize() >= self.batch_size:
+            self._wakeup.set()
+
+    def stats(self) -> dict[str, int | str]:
+        return {
+            **self._counters,
+            "queued": self._queue.qsize() + len(self._pending),
+            "overflow_policy": self.overflow_policy,
+        }
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout_seconds: float) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.warning("Tool call log drain incomplete at shutdown")
+        self._task = None
+        self._overflow(self._pending + self._take(self._queue.qsize()))
+        self._pending = []
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval_seconds)
+            self._wakeup.clear()
+            try:
+                flushed_before = self._counters["flushed"]
+                healthy = await self._flush_queued()
+                # A write that just succeeded means Redis is back; otherwise retry spilled entries on a timer.
+                if healthy and (
+                    self._counters["flushed"] > flushed_before
+                    or time.monotonic() - self._last_replay >= self.replay_interval_seconds
+                ):
+                    await self._replay_spill()
+            except Exception:
+                logger.warning("Tool call log flusher failed", exc_info=True)
+                healthy = False
+            if not healthy and not self._stopping.is_set():
+                await asyncio.sleep(self.flush_interval_seconds)
+        # Final drain once the lifespan asks us to stop.
+        await self._flush_queued()
+
+    async def _flush_queued(self) -> bool:
+        while self._pending or not self._queue.empty():
+            self._pending.extend(self._take(self.batch_size - len(self._pending)))
+            if not await self._flush_pending():
+                return False
+        return True
+
+    def _take(self, count: int) -> list[ToolCallLog]:
+        entries: list[ToolCallLog] = []
+        while len(entries) < count and not self._queue.empty():
+            entries.append(self._queue.get_nowait())
+        return entries
+
+    async def _flush_pending(self) -> bool:
+        try:
+            await self.repository.log_many(self._pending)
+        except Exception:
+            self._counters["flush_failures"] += 1
+            logger.warning("Failed to flush %s tool call log entries", len(self._pending), exc_info=True)
+            if self.overflow_policy == "spill":
+                self._overflow(self._pending)
+                self._pending = []
+            return False
+        self._counters["flushed"] += len(self._pending)
+        self._pending = []
+        return True
+
+    def _overflow(self, entries: list[ToolCallLog]) -> None:
+        if not entries:
+            return
+        if self.overflow_policy == "drop":
+            self._counters["dropped"] += len(entries)
+            return
+        try:
+            with self.spill_path.open("a", encoding="utf-8") as handle:
+                for entry in entries:
+                    handle.write(json.dumps(entry.to_stream_fields()) + "\n")
+            self._counters["spilled"] += len(entries)
+        except OSError:
+            logger.warning("Failed to spill tool call log entries", exc_info=True)
+            self._counters["dropped"] += len(entries)
+
+    async def _replay_spill(self) -> None:
+        self._last_replay = time.monotonic()
+        if self.overflow_policy != "spill":
+            return
+        claim_path = self.spill_path.with_suffix(".claim")
+        replay_path = self.spill_path.with_suffix(".replay")
+        try:
+            # Renamed on the event loop, where `_overflow` also runs, so no spill write can land mid-move.
+            # A claim left by an interrupted replay is merged first and the spill file waits for the next round.
+            if self.spill_path.exists() and not claim_path.exists():
+                self.spill_path.replace(claim_path)
+            entries, skipped = await asyncio.to_thread(self._load_replay, claim_path, replay_path)
+        except OSError:
+            logger.warning("Failed to read spilled tool call log entries", exc_info=True)
+            return
+        if skipped:
+            self._counters["spill_skipped"] += skipped
+            logger.warning("Skipped %s unreadable spilled tool call log entries", skipped)
+
+        for start in range(0, len(entries), self.batch_size):
+            batch = entries[start : start + self.batch_size]
+            try:
+                await self.repository.log_many(batch)
+            except Exception:
+                logger.warning("Failed to replay spilled tool call log entries", exc_info=True)
+                self._overflow(entries[start:])
+                break
+            self._counters["flushed"] += len(batch)
+        try:
+            replay_path.unlink(missing_ok=True)
+        except OSError:
+            logger.warning("Failed to remove replayed tool call log file", exc_info=True)
+
+    @staticmethod
+    def _load_replay(claim_path: Path, replay_path: Path) -> tuple[list[ToolCallLog], int]:
+        """Append a claimed spill file to the replay file (kept if a replay was interrupted) and parse it."""
+        if claim_path.exists():
+            with replay_path.open("a+b") as target, claim_path.open("rb") as source:
+                # Start on a fresh line if the replay file ends in a torn write.
+                if target.seek(0, 2):
+                    target.seek(-1, 2)
+                    if target.read(1) != b"\n":
+                        target.write(b"\n")
+                shutil.copyfileobj(source, target)
+            claim_path.unlink()
+        if not replay_path.exists():
+            return [], 0
+
+        entries: list[ToolCallLog] = []
+        skipped = 0
+        with replay_path.open(encoding="utf-8", errors="replace") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                try:
+                    fields = json.loads(line)
+                    entries.append(
+                        ToolCallLog(
+                            tool_name=fields["tool_name"],
+                            user_id=fields["user_id"],
+                            status=fields["status"],
+                            created_at=datetime.fromisoformat(fields["created_at"]),
+                        )
+                    )
+                except (ValueError, KeyError, TypeError):
+                    skipped += 1
+        return entries, skipped
+
+
+tool_call_logger = ToolCallLogger(
+    repository=ToolCallRepository(redis_client),
+    max_queue_size=settings.tool_log_queue_size,
+    batch_size=settings.tool_log_batch_size,
+    flush_interval_seconds=settings.tool_log_flush_interval_seconds,
+    overflow_policy=settings.tool_log_overflow_policy,
+    spill_path=settings.tool_log_spill_path,
+    replay_interval_seconds=settings.tool_log_replay_interval_seconds,
+)
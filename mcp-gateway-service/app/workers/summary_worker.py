@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import math
+import os
+import signal
+import socket
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.core.database import redis_client
+from app.repository.summary_repository import SummaryRepository
+from app.services.summary_jobs import summary_jobs
+from app.services.thread_summarizer import summarize_thread_json
+
+
+logger = logging.getLogger("mcp-gateway-service")
+settings = get_settings()
+
+
+class SummaryWorker:
+    """
+    Consumer-group reader for summary jobs.
+
+    Each batch read from the stream is summarized concurrently on a process
+    pool, so TextRank never competes with I/O for this process's event loop,
+    and results are written to the summary store before the entry is
+    acknowledged. Entries left unacknowledged by a consumer that died, or
+    after a Redis error while processing, are reclaimed once they have been
+    idle for `claim_idle_ms`; malformed entries are acknowledged as failed.
+    """
+
+    def __init__(
+        self,
+        repository: SummaryRepository,
+        consumer: str,
+        processes: int,
+        batch_size: int,
+        block_ms: int,
+        claim_idle_ms: int,
+    ):
+        self.repository = repository
+        self.consumer = consumer
+        self.processes = processes
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self._counters = {"completed": 0, "failed": 0, "reclaimed": 0, "redis_errors": 0}
+
+    async def run(self, stopping: asyncio.Event) -> None:
+        await self.repository.ensure_group()
+        logger.info("Summary worker %s consuming %s", self.consumer, self.repository.stream)
+        next_claim = 0.0
+        with ProcessPoolExecutor(max_workers=self.processes) as pool:
+            while not stopping.is_set():
+                try:
+                    entries = []
+                    if time.monotonic() >= next_claim:
+                        entries = await self.repository.claim_stale(self.consumer, self.claim_idle_ms, self.batch_size)
+                        self._counters["reclaimed"] += len(entries)
+                        next_claim = time.monotonic() + self.claim_idle_ms / 1000
+                    if not entries:
+                        entries = await self.repository.read_jobs(self.consumer, self.batch_size, self.block_ms)
+                except Exception:
+                    logger.warning("Summary worker failed to read jobs", exc_info=True)
+                    await asyncio.sleep(1.0)
+                    continue
+                results = await asyncio.gather(
+                    *[self._process(pool, entry_id, fields) for entry_id, fields in entries],
+                    return_exceptions=True,
+                )
+                for (entry_id, _), result in zip(entries, results):
+                    if isinstance(result, BrokenProcessPool):
+                        raise result
+                    if isinstance(result, BaseException):
+                        logger.warning("Summary job entry %s failed", entry_id, exc_info=result)
+        logger.info("Summary worker %s stopped: %s", self.consumer, self._counters)
+
+    async def _process(self, pool: Executor, entry_id: str, fields: dict[str, str]) -> None:
+        job_id = fields.get("job_id")
+        try:
+            try:
+                platform, thread_json = fields["platform"], fields["thread"]
+                max_sentences = int(fields["max_sentences"])
+                # Entries queued before jobs carried a version rank below any versioned summary.
+                version = float(fields.get("version", 0.0))
+                if not math.isfinite(version):
+                    raise ValueError(f"version {version!r}")
+                if not job_id:
+                    raise KeyError("job_id")
+            except (KeyError, ValueError) as exc:
+                logger.warning("Discarding malformed summary job entry %s", entry_id)
+                self._counters["failed"] += 1
+                await self.repository.fail(entry_id, job_id, f"Malformed job entry: {type(exc).__name__}: {exc}")
+                return
+
+            await self.repository.mark_running(job_id, self.consumer)
+            try:
+                summary = await asyncio.get_running_loop().run_in_executor(
+                    pool, summarize_thread_json, thread_json, max_sentences
+                )
+            except BrokenProcessPool:
+                # Leave the entry unacknowledged; it is reclaimed after the worker restarts.
+                raise
+            except Exception as exc:
+                # A job that cannot be summarized would fail again on redelivery, so it is acknowledged as failed.
+                logger.warning("Summary job %s failed", job_id, exc_info=True)
+                self._counters["failed"] += 1
+                await self.repository.fail(entry_id, job_id, f"{type(exc).__name__}: {exc}")
+                return
+            if not await self.repository.complete(entry_id, job_id, platform, max_sentences, version, summary):
+                logger.info("Summary job %s superseded by a newer version of its thread", job_id)
+            self._counters["completed"] += 1
+        except RedisError:
+            # Leave the entry pending; XAUTOCLAIM hands it out again once Redis answers.
+            logger.warning("Redis error while processing summary job entry %s", entry_id, exc_info=True)
+            self._counters["redis_errors"] += 1
+
+
+summary_worker = SummaryWorker(
+    repository=summary_jobs.repository,
+    consumer=f"{socket.gethostname()}-{os.getpid()}",
+    processes=settings.summary_worker_processes,
+    batch_size=settings.summary_worker_batch_size,
+    block_ms=settings.summary_worker_block_ms,
+    claim_idle_ms=settings.summary_worker_claim_idle_ms,
+)
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopping.set)
+    try:
+        await summary_worker.run(stopping)
+    finally:
+        await redis_client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -14,10 +14,15 @@ from .models import (
     Priority,
     ReplyRequest,
     Role,
+    SearchHit,
+    SearchResults,
     SendMessageRequest,
     ThreadDetail,
+    ThreadUnreadCount,
     ToolCallResponse,
+    UnreadCounts,
 )
+from .pagination import decode_cursor, decode_rank_cursor, encode_cursor, encode_rank_cursor
 from .security import TokenCipher
 
 __all__ = [
@@ -36,8 +41,16 @@ __all__ = [
     "Priority",
     "ReplyRequest",
     "Role",
+    "SearchHit",
+    "SearchResults",
     "SendMessageRequest",
     "ThreadDetail",
+    "ThreadUnreadCount",
     "TokenCipher",
     "ToolCallResponse",
+    "UnreadCounts",
+    "decode_cursor",
+    "decode_rank_cursor",
+    "encode_cursor",
+    "encode_rank_cursor",
 ]
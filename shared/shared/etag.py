@@ -0,0 +1,21 @@
+import hashlib
+from typing import Any
+
+
+def etag_for_bytes(payload: bytes) -> str:
+    return f'W/"{hashlib.sha1(payload).hexdigest()[:20]}"'
+
+
+def make_etag(*parts: Any) -> str:
+    """Weak ETag over version parts (timestamps, counts, request parameters); None counts as empty."""
+    return etag_for_bytes(":".join("" if part is None else str(part) for part in parts).encode("utf-8"))
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored on both sides.
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
@@ -0,0 +1,73 @@
+import logging
+from typing import Protocol
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - h2 is an optional extra of httpx
+    HTTP2_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClientSettings(Protocol):
+    http_max_connections: int
+    http_max_keepalive_connections: int
+    http_keepalive_expiry_seconds: float
+    http_connect_timeout_seconds: float
+    http2_enabled: bool
+
+
+class HttpClientRegistry:
+    """
+    Process-wide pool of httpx clients, one per upstream service.
+
+    Clients are created lazily and closed from the application lifespan so
+    connections are reused across requests instead of opened per call.
+    """
+
+    def __init__(self, config: HttpClientSettings, upstreams: dict[str, tuple[str, float]]):
+        self.config = config
+        self._upstreams = dict(upstreams)
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def get(self, upstream: str) -> httpx.AsyncClient:
+        client = self._clients.get(upstream)
+        if client is None or client.is_closed:
+            client = self._build(upstream)
+            self._clients[upstream] = client
+        return client
+
+    def _build(self, upstream: str) -> httpx.AsyncClient:
+        if upstream not in self._upstreams:
+            raise ValueError(f"Unknown upstream '{upstream}'")
+        base_url, timeout = self._upstreams[upstream]
+
+        http2 = self.config.http2_enabled and HTTP2_AVAILABLE
+        if self.config.http2_enabled and not HTTP2_AVAILABLE:
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+
+        return httpx.AsyncClient(
+            base_url=base_url,
+            http2=http2,
+            timeout=httpx.Timeout(timeout, connect=self.config.http_connect_timeout_seconds),
+            limits=httpx.Limits(
+                max_connections=self.config.http_max_connections,
+                max_keepalive_connections=self.config.http_max_keepalive_connections,
+                keepalive_expiry=self.config.http_keepalive_expiry_seconds,
+            ),
+        )
+
+    async def start(self) -> None:
+        for upstream in self._upstreams:
+            self.get(upstream)
+
+    async def aclose(self) -> None:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
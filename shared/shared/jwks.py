@@ -0,0 +1,115 @@
+import asyncio
+import contextlib
+import logging
+import time
+from typing import Any
+
+from jose import JWTError, jwt
+
+from shared.http_client import HttpClientRegistry
+from shared.models import AuthenticatedUser, Role
+
+
+logger = logging.getLogger(__name__)
+
+
+class LocalVerificationUnavailable(Exception):
+    pass
+
+
+class JwksKeySet:
+    """
+    Cached copy of the auth service's JSON Web Key Set.
+
+    Keys are refreshed on an interval by a lifespan task, and on demand when a
+    token names an unknown `kid` (rate limited so bad tokens cannot hammer the
+    auth service).
+    """
+
+    def __init__(
+        self,
+        http_clients: HttpClientRegistry,
+        refresh_seconds: float,
+        min_refresh_seconds: float,
+        algorithms: list[str],
+        issuer: str,
+        upstream: str = "auth",
+    ):
+        self.http_clients = http_clients
+        self.refresh_seconds = refresh_seconds
+        self.min_refresh_seconds = min_refresh_seconds
+        self.algorithms = algorithms
+        self.issuer = issuer
+        self.upstream = upstream
+        self._keys: dict[str, dict[str, Any]] = {}
+        self._last_refresh = 0.0
+        self._refresh_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    async def refresh(self) -> None:
+        async with self._refresh_lock:
+            client = self.http_clients.get(self.upstream)
+            response = await client.get("/.well-known/jwks.json")
+            response.raise_for_status()
+            keys = response.json().get("keys", [])
+            self._keys = {key["kid"]: key for key in keys if key.get("kid")}
+            self._last_refresh = time.monotonic()
+
+    async def get_key(self, kid: str) -> dict[str, Any] | None:
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+        if time.monotonic() - self._last_refresh < self.min_refresh_seconds:
+            return None
+        try:
+            await self.refresh()
+        except Exception:
+            logger.warning("JWKS refresh failed", exc_info=True)
+            return None
+        return self._keys.get(kid)
+
+    async def verify(self, token: str) -> AuthenticatedUser | None:
+        """
+        Verify an asymmetrically signed token against the cached keys.
+
+        Returns None for tokens that are definitively invalid and raises
+        LocalVerificationUnavailable when the caller should fall back to remote
+        introspection (legacy HS256 tokens, or a signing key we cannot resolve).
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except JWTError:
+            return None
+
+        kid = header.get("kid")
+        if not kid or header.get("alg") not in self.algorithms:
+            raise LocalVerificationUnavailable()
+
+        key = await self.get_key(kid)
+        if key is None:
+            raise LocalVerificationUnavailable()
+
+        try:
+            claims = jwt.decode(token, key, algorithms=self.algorithms, issuer=self.issuer)
+            return AuthenticatedUser(user_id=claims["sub"], email=claims["email"], role=Role(claims["role"]))
+        except (JWTError, KeyError, ValueError):
+            return None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.warning("JWKS refresh failed", exc_info=True)
+            await asyncio.sleep(self.refresh_seconds)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
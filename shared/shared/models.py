@@ -56,6 +56,33 @@ class ThreadDetail(BaseModel):
     participants: list[str] = Field(default_factory=list)
     unread_count: int = 0
     messages: list[Message] = Field(default_factory=list)
+    next_cursor: str | None = None
+    updated_at: datetime | None = None
+
+
+class SearchHit(BaseModel):
+    message: Message
+    rank: float
+    snippet: str = ""
+    # Rank scaled into [0, 1] against the best hit of the same platform; set by federated search.
+    score: float | None = None
+
+
+class SearchResults(BaseModel):
+    hits: list[SearchHit] = Field(default_factory=list)
+    next_cursor: str | None = None
+
+
+class ThreadUnreadCount(BaseModel):
+    thread_id: str
+    unread_count: int
+
+
+class UnreadCounts(BaseModel):
+    platform: Platform
+    unread_count: int = 0
+    # Only threads with unread messages, most unread first.
+    threads: list[ThreadUnreadCount] = Field(default_factory=list)
 
 
 class PlatformStatus(BaseModel):
@@ -0,0 +1,40 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+
+def encode_cursor(sent_at: datetime, message_id: str) -> str:
+    """Opaque keyset cursor for `(sent_at, id)` ordered message lists."""
+    return _encode([sent_at.isoformat(), message_id])
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        sent_at, message_id = _decode(cursor)
+        return datetime.fromisoformat(sent_at), str(message_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+
+def encode_rank_cursor(rank: float, sent_at: datetime, message_id: str) -> str:
+    """Opaque keyset cursor for `(rank, sent_at, id)` ordered search results."""
+    return _encode([rank, sent_at.isoformat(), message_id])
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, datetime, str]:
+    try:
+        rank, sent_at, message_id = _decode(cursor)
+        return float(rank), datetime.fromisoformat(sent_at), str(message_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+
+def _encode(values: list[Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _decode(cursor: str) -> Any:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))